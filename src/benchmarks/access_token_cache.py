@@ -0,0 +1,82 @@
+"""
+Compare the per-request cost of `get_current_user` with and without the access token cache.
+
+Run from the `src` directory (no database is needed):
+
+    ENVIRONMENT=testing python -m benchmarks.access_token_cache
+"""
+import argparse
+import asyncio
+
+from starlette.requests import Request
+
+from benchmarks.utils import measure, print_table
+from caches import AccessTokenCache
+from config import get_settings
+from routes.utils import get_current_user
+from security.token_manager import JWTAuthManager
+
+
+class NoCache(AccessTokenCache):
+    """The previous behaviour: every request decodes and verifies the token."""
+
+    def get(self, token: str):
+        return None
+
+    def set(self, token: str, payload: dict) -> None:
+        return None
+
+
+def authenticated_request(token: str) -> Request:
+    """A request carrying the token like one sent to an authenticated endpoint."""
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(b"authorization", f"Bearer {token}".encode())],
+    })
+
+
+async def main(users: int, iterations: int, max_entries: int) -> None:
+    """
+    Report the dependency latency while `users` distinct tokens keep hitting authenticated endpoints.
+    """
+    settings = get_settings()
+    jwt_manager = JWTAuthManager(
+        secret_key_access=settings.SECRET_KEY_ACCESS,
+        secret_key_refresh=settings.SECRET_KEY_REFRESH,
+        algorithm=settings.JWT_SIGNING_ALGORITHM,
+    )
+    requests = [
+        authenticated_request(jwt_manager.create_access_token({"user_id": user_id}))
+        for user_id in range(1, users + 1)
+    ]
+
+    rows = []
+    for label, cache in (
+            ("decode every request (before)", NoCache(max_entries=0)),
+            ("AccessTokenCache (after)", AccessTokenCache(max_entries=max_entries)),
+    ):
+        position = 0
+
+        async def authenticate():
+            nonlocal position
+            position = (position + 1) % users
+            return await get_current_user(requests[position], jwt_manager, cache, None)
+
+        timings = await measure(authenticate, iterations)
+        stats = cache.stats()
+        rows.append((label, timings["mean"] * 1000, timings["p95"] * 1000, stats.hits, stats.misses))
+
+    print(f"{users} distinct tokens, {iterations} requests, cache size {max_entries}\n")
+    print_table(("token validation", "mean us", "p95 us", "hits", "misses"), rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--max-entries", type=int, default=10000)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.users, args.iterations, args.max_entries))
@@ -0,0 +1,70 @@
+"""
+Measure actor autocomplete lookups on the in-memory prefix index used by `GET /theater/actors/suggest/`.
+
+Run from the `src` directory (no database is needed):
+
+    ENVIRONMENT=testing python -m benchmarks.actor_suggest
+"""
+import argparse
+import asyncio
+import random
+import string
+import time
+
+from benchmarks.utils import measure, print_table
+from caches import PrefixIndex
+
+
+def synthetic_actor_names(count: int, seed: int = 42) -> dict:
+    """
+    Generate names shaped like the seeded crew strings (e.g. `MichaelB.Jordan`) with random movie counts.
+    """
+    rng = random.Random(seed)
+
+    def word() -> str:
+        return rng.choice(string.ascii_uppercase) + "".join(
+            rng.choices(string.ascii_lowercase, k=rng.randint(3, 8))
+        )
+
+    names = {}
+    while len(names) < count:
+        middle = f"{rng.choice(string.ascii_uppercase)}." if rng.random() < 0.2 else ""
+        names[f"{word()}{middle}{word()}"] = rng.randint(0, 40)
+    return names
+
+
+async def main(actors: int, limit: int, iterations: int) -> None:
+    """
+    Build the index and report lookup latency for increasingly selective prefixes.
+    """
+    names = synthetic_actor_names(actors)
+    index = PrefixIndex(ttl_seconds=3600)
+
+    start = time.perf_counter()
+    index.replace(names)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    sample = random.Random(0).choice(list(names))
+    rows = []
+    for length in (1, 2, 3, 5):
+        prefix = sample[:length]
+
+        async def lookup():
+            return index.suggest(prefix, limit)
+
+        matches = len(index.suggest(prefix, actors))
+        timings = await measure(lookup, iterations)
+        rows.append((repr(prefix), matches, timings["mean"], timings["median"], timings["p95"]))
+
+    print(f"{actors} actors, index built in {build_ms:.1f} ms; top {limit}, {iterations} iterations\n")
+    print_table(("prefix", "matches", "mean ms", "median ms", "p95 ms"), rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--actors", type=int, default=100000)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.actors, args.limit, args.iterations))
@@ -0,0 +1,98 @@
+"""
+Compare the movie detail loading strategies used by `GET /theater/movies/{movie_id}/`.
+
+Run from the `src` directory (the benchmark uses its own in-memory database):
+
+    ENVIRONMENT=testing python -m benchmarks.movie_detail
+"""
+import argparse
+import asyncio
+
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload
+
+from benchmarks.utils import (
+    create_benchmark_engine,
+    create_benchmark_sessionmaker,
+    seed_movies,
+    record_statements,
+    count_result_rows,
+    measure,
+    print_table,
+)
+from database import MovieModel
+from schemas import MovieDetailSchema
+
+
+def joined_detail_stmt(movie_id: int):
+    """The previous loader: every relationship joined into a single statement."""
+    return (
+        select(MovieModel)
+        .options(
+            joinedload(MovieModel.country),
+            joinedload(MovieModel.genres),
+            joinedload(MovieModel.actors),
+            joinedload(MovieModel.languages),
+        )
+        .where(MovieModel.id == movie_id)
+    )
+
+
+def selectin_detail_stmt(movie_id: int):
+    """The current loader used by the detail route."""
+    return (
+        select(MovieModel)
+        .options(*MovieModel.detail_load_options())
+        .where(MovieModel.id == movie_id)
+    )
+
+
+async def main(actors: int, genres: int, languages: int, iterations: int) -> None:
+    """
+    Seed one movie and report queries, returned rows and latency for each strategy.
+    """
+    engine = await create_benchmark_engine()
+    session_factory = create_benchmark_sessionmaker(engine)
+
+    async with session_factory() as session:
+        movie_id, = await seed_movies(
+            session,
+            movies=1,
+            actors_per_movie=actors,
+            genres_per_movie=genres,
+            languages_per_movie=languages,
+        )
+
+    rows = []
+    for label, build_stmt in (
+            ("joinedload (before)", joined_detail_stmt),
+            ("selectinload (after)", selectin_detail_stmt),
+    ):
+        async def load_detail() -> MovieDetailSchema:
+            async with session_factory() as db:
+                result = await db.execute(build_stmt(movie_id))
+                movie = result.unique().scalars().first()
+                return MovieDetailSchema.model_validate(movie)
+
+        with record_statements(engine) as statements:
+            await load_detail()
+        returned_rows = await count_result_rows(engine, statements)
+
+        timings = await measure(load_detail, iterations)
+        rows.append((label, len(statements), returned_rows, timings["mean"], timings["median"], timings["p95"]))
+
+    await engine.dispose()
+
+    print(f"Movie with {actors} actors, {genres} genres, {languages} languages; {iterations} iterations\n")
+    print_table(("strategy", "queries", "rows", "mean ms", "median ms", "p95 ms"), rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--actors", type=int, default=18)
+    parser.add_argument("--genres", type=int, default=3)
+    parser.add_argument("--languages", type=int, default=2)
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.actors, args.genres, args.languages, args.iterations))
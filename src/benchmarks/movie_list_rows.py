@@ -0,0 +1,94 @@
+"""
+Compare ORM entities with plain rows for the movie list page built by `GET /theater/movies/`.
+
+Run from the `src` directory (the benchmark uses its own in-memory database):
+
+    ENVIRONMENT=testing python -m benchmarks.movie_list_rows
+"""
+import argparse
+import asyncio
+import time
+import tracemalloc
+
+from sqlalchemy import select
+
+from benchmarks.utils import (
+    create_benchmark_engine,
+    create_benchmark_sessionmaker,
+    seed_movies,
+    measure,
+    print_table,
+)
+from database import MovieModel
+from schemas import MovieListItemSchema
+
+LIST_COLUMNS = [
+    MovieModel.id,
+    MovieModel.name,
+    MovieModel.date,
+    MovieModel.score,
+    MovieModel.overview,
+    MovieModel.version,
+]
+
+
+def entity_stmt(offset: int, per_page: int):
+    """The previous query: full `MovieModel` instances tracked by the session."""
+    return select(MovieModel).order_by(MovieModel.id.desc()).offset(offset).limit(per_page + 1)
+
+
+def row_stmt(offset: int, per_page: int):
+    """The current query: only the columns the list page needs, returned as rows."""
+    return select(*LIST_COLUMNS).order_by(MovieModel.id.desc()).offset(offset).limit(per_page + 1)
+
+
+async def main(movies: int, per_page: int, iterations: int) -> None:
+    """
+    Seed movies and report CPU time and peak allocations for building one list page.
+    """
+    engine = await create_benchmark_engine()
+    session_factory = create_benchmark_sessionmaker(engine)
+
+    async with session_factory() as session:
+        await seed_movies(session, movies=movies, actors_per_movie=1, genres_per_movie=1, languages_per_movie=1)
+
+    offset = movies // 2
+    rows = []
+    for label, build_stmt, fetch in (
+            ("select(MovieModel) (before)", entity_stmt, lambda result: result.scalars().all()),
+            ("select(*columns) rows (after)", row_stmt, lambda result: result.all()),
+    ):
+        async def build_page():
+            async with session_factory() as db:
+                result = await db.execute(build_stmt(offset, per_page))
+                page = fetch(result)[:per_page]
+                return [MovieListItemSchema.model_validate(movie) for movie in page]
+
+        timings = await measure(build_page, iterations)
+
+        cpu_start = time.process_time()
+        for _ in range(iterations):
+            await build_page()
+        cpu_ms = (time.process_time() - cpu_start) * 1000 / iterations
+
+        tracemalloc.start()
+        await build_page()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        rows.append((label, timings["mean"], timings["p95"], cpu_ms, peak / 1024))
+
+    await engine.dispose()
+
+    print(f"{movies} movies, {per_page} per page, {iterations} iterations\n")
+    print_table(("query", "mean ms", "p95 ms", "cpu ms/page", "peak KiB/page"), rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--movies", type=int, default=5000)
+    parser.add_argument("--per-page", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=300)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.movies, args.per_page, args.iterations))
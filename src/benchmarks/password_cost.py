@@ -0,0 +1,82 @@
+"""
+Report password hashes per second per core for candidate hashing policies, to tune the cost against the login SLO.
+
+Run from the `src` directory (no database is needed):
+
+    ENVIRONMENT=testing python -m benchmarks.password_cost --bcrypt-rounds 10 11 12 13 14 --slo-ms 250
+"""
+import argparse
+import time
+
+from passlib.hash import argon2
+
+from benchmarks.utils import print_table
+from security.passwords import build_password_context
+
+
+def hashes_per_core_second(context, min_seconds: float, min_hashes: int) -> float:
+    """
+    Hash on a single thread until both minimums are reached and return the rate per CPU second.
+
+    CPU time rather than wall time is measured, so the result is the throughput of one core
+    even on a busy machine; multiply by `PASSWORD_HASH_WORKERS` (up to the core count) for a worker.
+    """
+    hashes = 0
+    started = time.process_time()
+    while hashes < min_hashes or time.process_time() - started < min_seconds:
+        context.hash("StrongPassword123!")
+        hashes += 1
+    return hashes / (time.process_time() - started)
+
+
+def main(bcrypt_rounds, argon2_costs, slo_ms: float, min_seconds: float) -> None:
+    """
+    Benchmark every candidate and mark the ones whose single hash fits in the latency budget.
+    """
+    candidates = [
+        (f"bcrypt rounds={rounds}", {"schemes": ["bcrypt"], "bcrypt_rounds": rounds})
+        for rounds in bcrypt_rounds
+    ]
+    if argon2.has_backend():
+        candidates += [
+            (
+                f"argon2 t={time_cost} m={memory_cost}KiB p={parallelism}",
+                {
+                    "schemes": ["argon2"],
+                    "argon2_time_cost": time_cost,
+                    "argon2_memory_cost": memory_cost,
+                    "argon2_parallelism": parallelism,
+                },
+            )
+            for time_cost, memory_cost, parallelism in argon2_costs
+        ]
+    else:
+        print("argon2-cffi is not installed; argon2 candidates are skipped.\n")
+
+    rows = []
+    for label, options in candidates:
+        rate = hashes_per_core_second(build_password_context(**options), min_seconds, min_hashes=3)
+        latency_ms = 1000 / rate
+        rows.append((label, rate, latency_ms, "yes" if latency_ms <= slo_ms else "no"))
+
+    print(f"single-thread CPU time, latency budget {slo_ms:.0f} ms per hash\n")
+    print_table(("policy", "hashes/s/core", "ms/hash", "within SLO"), rows)
+
+
+def argon2_cost(value: str):
+    time_cost, memory_cost, parallelism = (int(part) for part in value.split(":"))
+    return time_cost, memory_cost, parallelism
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--bcrypt-rounds", type=int, nargs="+", default=[10, 11, 12, 13, 14])
+    parser.add_argument(
+        "--argon2", type=argon2_cost, nargs="+", default=[(2, 19456, 1), (3, 65536, 4)],
+        metavar="TIME:MEMORY_KIB:PARALLELISM",
+    )
+    parser.add_argument("--slo-ms", type=float, default=250)
+    parser.add_argument("--min-seconds", type=float, default=1.0)
+    args = parser.parse_args()
+
+    main(args.bcrypt_rounds, args.argon2, args.slo_ms, args.min_seconds)
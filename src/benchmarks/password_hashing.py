@@ -0,0 +1,80 @@
+"""
+Measure how much concurrent password checks stall the event loop, inline versus on the hashing pool.
+
+Run from the `src` directory (no database is needed):
+
+    ENVIRONMENT=testing python -m benchmarks.password_hashing
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from passlib.context import CryptContext
+
+from benchmarks.utils import print_table
+from security.passwords import PasswordHashingService
+
+
+async def watch_loop_lag(interval: float, lags: list, stop: asyncio.Event) -> None:
+    """
+    Sleep in short steps and record how late each wake-up is: the delay other requests would see.
+    """
+    while not stop.is_set():
+        expected = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+        lags.append((time.perf_counter() - expected) * 1000)
+
+
+async def run(label: str, verify, logins: int) -> tuple:
+    """
+    Run `logins` concurrent password checks while watching the event loop.
+    """
+    lags: list = []
+    stop = asyncio.Event()
+    watcher = asyncio.create_task(watch_loop_lag(0.005, lags, stop))
+    await asyncio.sleep(0.02)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(verify() for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await watcher
+    return label, logins, elapsed * 1000, max(lags), statistics.median(lags)
+
+
+async def main(logins: int, rounds: int, workers: int) -> None:
+    """
+    Report the wall time of a burst of logins and the worst event loop stall during it.
+    """
+    context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=rounds)
+    hashed = context.hash("StrongPassword123!")
+    service = PasswordHashingService(max_workers=workers, max_pending=logins, context=context)
+
+    async def inline_verify():
+        return context.verify("StrongPassword123!", hashed)
+
+    async def pooled_verify():
+        return await service.verify("StrongPassword123!", hashed)
+
+    rows = [
+        await run("inline verify (before)", inline_verify, logins),
+        await run(f"PasswordHashingService, {workers} workers (after)", pooled_verify, logins),
+    ]
+    stats = service.stats()
+    service.shutdown()
+
+    print(f"bcrypt rounds={rounds}, {logins} concurrent logins\n")
+    print_table(("verification", "logins", "burst ms", "max loop stall ms", "median loop stall ms"), rows)
+    print(f"\npool peak pending={stats.peak_pending}, mean queue wait={stats.mean_queue_wait_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--logins", type=int, default=8)
+    parser.add_argument("--rounds", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.logins, args.rounds, args.workers))
@@ -0,0 +1,124 @@
+"""
+Compare the per-request serialization cost of theater responses with and without the `response_model` round trip.
+
+Run from the `src` directory (no database is needed):
+
+    ENVIRONMENT=testing python -m benchmarks.serialization
+"""
+import argparse
+import asyncio
+import datetime
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+
+from benchmarks.utils import measure, print_table
+from routes.utils import FastJSONResponse, validated_response
+from schemas import MovieDetailSchema, MovieListItemSchema, MovieListResponseSchema
+
+try:
+    from fastapi.responses import ORJSONResponse
+    import orjson  # noqa: F401
+except ImportError:
+    ORJSONResponse = None
+
+
+def list_page(items: int) -> MovieListResponseSchema:
+    """A list page shaped like `GET /theater/movies/`, with realistic overview lengths."""
+    return MovieListResponseSchema(
+        movies=[
+            MovieListItemSchema(
+                id=index,
+                name=f"Movie {index}",
+                date=datetime.date(2020, 1, 1) + datetime.timedelta(days=index),
+                score=70.5,
+                overview="A long overview of the plot. " * 12,
+            )
+            for index in range(1, items + 1)
+        ],
+        prev_page=None,
+        next_page="/theater/movies/?page=2&per_page=20",
+        next_cursor="eyJpZCI6MjB9",
+        total_pages=500,
+        total_items=10000,
+    )
+
+
+def detail_page(actors: int, genres: int, languages: int) -> MovieDetailSchema:
+    """A detail page shaped like `GET /theater/movies/{movie_id}/` with a large cast."""
+    return MovieDetailSchema(
+        id=1,
+        name="Large Movie",
+        date=datetime.date(2020, 1, 1),
+        score=81.0,
+        overview="A long overview of the plot. " * 40,
+        status="Released",
+        budget=150000000.0,
+        revenue=750000000.0,
+        country={"id": 1, "code": "US", "name": "United States"},
+        genres=[{"id": index, "name": f"Genre {index}"} for index in range(genres)],
+        actors=[{"id": index, "name": f"Actor Number {index}"} for index in range(actors)],
+        languages=[{"id": index, "name": f"Language {index}"} for index in range(languages)],
+    )
+
+
+def response_model_pipeline(schema, response_class):
+    """
+    Reproduce what FastAPI does when a route returns a schema with a `response_model`:
+    dump and re-validate it, encode it with `jsonable_encoder`, then render the response class.
+    """
+    field = APIRoute("/", lambda: None, response_model=type(schema)).response_field
+
+    async def run():
+        content = await serialize_response(field=field, response_content=schema)
+        return response_class(content).body
+
+    return run
+
+
+def validated_pipeline(schema):
+    """The theater routes: the validated schema is serialized once by pydantic-core."""
+    async def run():
+        return validated_response(schema).body
+
+    return run
+
+
+async def main(items: int, actors: int, iterations: int) -> None:
+    """
+    Report the serialization time per response for a list page and a large detail page.
+
+    Everything runs in one thread without I/O, so the latency is the CPU time per request.
+    """
+    payloads = (
+        (f"list page ({items} items)", list_page(items)),
+        (f"detail page ({actors} actors)", detail_page(actors, genres=10, languages=20)),
+    )
+
+    rows = []
+    for payload_label, schema in payloads:
+        pipelines = [
+            ("response_model + JSONResponse (before)", response_model_pipeline(schema, JSONResponse)),
+            ("response_model + FastJSONResponse", response_model_pipeline(schema, FastJSONResponse)),
+        ]
+        if ORJSONResponse is not None:
+            pipelines.append(("response_model + ORJSONResponse", response_model_pipeline(schema, ORJSONResponse)))
+        pipelines.append(("validated_response (after)", validated_pipeline(schema)))
+
+        size = len(await pipelines[-1][1]())
+        for label, pipeline in pipelines:
+            timings = await measure(pipeline, iterations)
+            rows.append((payload_label, label, size, timings["mean"], timings["median"], timings["p95"]))
+
+    print(f"{iterations} iterations per row\n")
+    print_table(("payload", "serialization", "bytes", "mean ms", "median ms", "p95 ms"), rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=20)
+    parser.add_argument("--actors", type=int, default=500)
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.items, args.actors, args.iterations))
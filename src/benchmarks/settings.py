@@ -0,0 +1,84 @@
+"""
+Compare the cost of resolving the `get_settings` dependency per request with and without caching.
+
+Run from the `src` directory (no database is needed):
+
+    ENVIRONMENT=testing python -m benchmarks.settings
+"""
+import argparse
+import asyncio
+
+from fastapi import Depends, FastAPI
+
+from benchmarks.utils import measure, print_table
+from config import get_settings
+
+
+def build_app(settings_provider) -> FastAPI:
+    """A minimal application whose single route depends on the settings, like the account routes."""
+    app = FastAPI()
+
+    @app.get("/")
+    async def read_settings(settings=Depends(settings_provider)):
+        return {"login_time_days": settings.LOGIN_TIME_DAYS}
+
+    return app
+
+
+def asgi_request(app: FastAPI):
+    """Send one GET request straight to the ASGI application, without any HTTP client overhead."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/",
+        "raw_path": b"/",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [],
+        "server": ("test", 80),
+        "client": ("test", 1234),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        return None
+
+    async def run():
+        await app(scope, receive, send)
+
+    return run
+
+
+async def main(iterations: int) -> None:
+    """
+    Report the latency of a bare settings lookup and of a full request depending on it.
+    """
+    uncached = get_settings.__wrapped__
+
+    async def call(provider):
+        return provider()
+
+    rows = []
+    for label, provider in (
+            ("new settings per call (before)", uncached),
+            ("cached get_settings (after)", get_settings),
+    ):
+        lookup = await measure(lambda: call(provider), iterations)
+        request = await measure(asgi_request(build_app(provider)), iterations)
+        rows.append((label, lookup["mean"] * 1000, request["mean"] * 1000, request["p95"] * 1000))
+
+    print(f"{iterations} iterations per row\n")
+    print_table(("settings provider", "lookup us", "request us", "request p95 us"), rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.iterations))
@@ -0,0 +1,198 @@
+import datetime
+import statistics
+import time
+from contextlib import contextmanager
+from typing import Awaitable, Callable, Dict, Iterator, List, Sequence, Tuple
+
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from database import (
+    Base,
+    CountryModel,
+    GenreModel,
+    ActorModel,
+    LanguageModel,
+    MovieModel,
+    MoviesGenresModel,
+    ActorsMoviesModel,
+    MoviesLanguagesModel,
+)
+from database.models.movies import MovieStatusEnum
+
+
+async def create_benchmark_engine() -> AsyncEngine:
+    """
+    Create an isolated in-memory SQLite engine with the full schema.
+
+    Benchmarks never touch the application database, so they can run anywhere.
+
+    :return: An AsyncEngine bound to a fresh in-memory database.
+    """
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    return engine
+
+
+def create_benchmark_sessionmaker(engine: AsyncEngine) -> sessionmaker:
+    """
+    Build a session factory configured like the application's one.
+
+    :param engine: The benchmark engine.
+    :return: A sessionmaker producing AsyncSession instances.
+    """
+    return sessionmaker(  # type: ignore
+        bind=engine,
+        class_=AsyncSession,
+        expire_on_commit=False
+    )
+
+
+async def seed_movies(
+        session: AsyncSession,
+        movies: int,
+        actors_per_movie: int,
+        genres_per_movie: int,
+        languages_per_movie: int,
+        overview_length: int = 300,
+) -> List[int]:
+    """
+    Insert synthetic movies with the requested number of related rows each.
+
+    :param session: The session used for the inserts (committed on return).
+    :param movies: Number of movies to create.
+    :param actors_per_movie: Number of actors linked to every movie.
+    :param genres_per_movie: Number of genres linked to every movie.
+    :param languages_per_movie: Number of languages linked to every movie.
+    :param overview_length: Length of the generated overview text.
+    :return: The ids of the created movies.
+    """
+    country_id = (
+        await session.execute(insert(CountryModel).returning(CountryModel.id), [{"code": "US"}])
+    ).scalar_one()
+    genre_ids = (await session.execute(
+        insert(GenreModel).returning(GenreModel.id),
+        [{"name": f"Genre {i}"} for i in range(genres_per_movie)]
+    )).scalars().all()
+    actor_ids = (await session.execute(
+        insert(ActorModel).returning(ActorModel.id),
+        [{"name": f"Actor {i}"} for i in range(actors_per_movie)]
+    )).scalars().all()
+    language_ids = (await session.execute(
+        insert(LanguageModel).returning(LanguageModel.id),
+        [{"name": f"Language {i}"} for i in range(languages_per_movie)]
+    )).scalars().all()
+
+    movie_ids = (await session.execute(
+        insert(MovieModel).returning(MovieModel.id),
+        [
+            {
+                "name": f"Movie {i}",
+                "date": datetime.date(2000 + i % 25, 1, 1) + datetime.timedelta(days=i // 25),
+                "score": float(i % 100),
+                "overview": "x" * overview_length,
+                "status": MovieStatusEnum.RELEASED,
+                "budget": 1000000.0 + i,
+                "revenue": 5000000.0 + i,
+                "country_id": country_id,
+            }
+            for i in range(movies)
+        ]
+    )).scalars().all()
+
+    for table, column, ids in (
+            (MoviesGenresModel, "genre_id", genre_ids),
+            (ActorsMoviesModel, "actor_id", actor_ids),
+            (MoviesLanguagesModel, "language_id", language_ids),
+    ):
+        rows = [{"movie_id": movie_id, column: ref_id} for movie_id in movie_ids for ref_id in ids]
+        if rows:
+            await session.execute(insert(table), rows)
+
+    await session.commit()
+    return list(movie_ids)
+
+
+@contextmanager
+def record_statements(engine: AsyncEngine) -> Iterator[List[Tuple[str, object]]]:
+    """
+    Capture every SQL statement (with parameters) the engine executes inside the block.
+
+    :param engine: The engine to listen on.
+    :return: A list that is filled with (statement, parameters) tuples.
+    """
+    statements: List[Tuple[str, object]] = []
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+
+
+async def count_result_rows(engine: AsyncEngine, statements: Sequence[Tuple[str, object]]) -> int:
+    """
+    Replay captured statements on a raw connection and count the rows the database returns.
+
+    :param engine: The engine the statements were captured on.
+    :param statements: (statement, parameters) tuples from `record_statements`.
+    :return: The total number of result rows sent back by the database.
+    """
+    total = 0
+    async with engine.connect() as conn:
+        for statement, parameters in statements:
+            result = await conn.exec_driver_sql(statement, parameters)
+            total += len(result.fetchall())
+    return total
+
+
+async def measure(func: Callable[[], Awaitable[object]], iterations: int, warmup: int = 10) -> Dict[str, float]:
+    """
+    Time an async callable and return latency statistics in milliseconds.
+
+    :param func: A zero-argument coroutine function to benchmark.
+    :param iterations: Number of timed calls.
+    :param warmup: Number of untimed calls made first.
+    :return: A dict with `mean`, `median` and `p95` latencies in milliseconds.
+    """
+    for _ in range(warmup):
+        await func()
+
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await func()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    samples.sort()
+    return {
+        "mean": statistics.fmean(samples),
+        "median": statistics.median(samples),
+        "p95": samples[int(len(samples) * 0.95) - 1],
+    }
+
+
+def print_table(headers: Sequence[str], rows: Sequence[Sequence[object]]) -> None:
+    """
+    Print rows as a plain-text table.
+
+    :param headers: Column titles.
+    :param rows: Table rows; floats are shown with three decimals.
+    """
+    formatted = [
+        [f"{value:.3f}" if isinstance(value, float) else str(value) for value in row]
+        for row in rows
+    ]
+    widths = [
+        max(len(str(header)), *(len(row[i]) for row in formatted))
+        for i, header in enumerate(headers)
+    ]
+    print("  ".join(str(header).ljust(width) for header, width in zip(headers, widths)))
+    print("  ".join("-" * width for width in widths))
+    for row in formatted:
+        print("  ".join(value.ljust(width) for value, width in zip(row, widths)))
@@ -0,0 +1,5 @@
+from caches.interfaces import CacheInterface
+from caches.memory import InMemoryLRUCache
+from caches.prefix import PrefixIndex
+from caches.redis import RedisCache
+from caches.tokens import AccessTokenCache, AccessTokenCacheStats
@@ -0,0 +1,42 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional
+
+
+class CacheInterface(ABC):
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        Return the cached value for a key, or None if it is missing or expired.
+
+        :param key: The cache key.
+        :return: The cached bytes, or None.
+        """
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, tags: Iterable[str] = ()) -> None:
+        """
+        Store a value under a key and associate it with invalidation tags.
+
+        :param key: The cache key.
+        :param value: The serialized value to store.
+        :param tags: Tags that can later be used to invalidate this entry together with others.
+        """
+        pass
+
+    @abstractmethod
+    async def invalidate_tags(self, *tags: str) -> None:
+        """
+        Remove every entry associated with any of the given tags.
+
+        :param tags: The tags whose entries should be dropped.
+        """
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """
+        Remove every entry from the cache.
+        """
+        pass
@@ -0,0 +1,100 @@
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from caches.interfaces import CacheInterface
+
+
+class InMemoryLRUCache(CacheInterface):
+    """
+    A process-local cache with least-recently-used eviction and a per-entry time to live.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries (int): The maximum number of entries kept before the least recently used is evicted.
+            ttl_seconds (float): How long an entry stays valid, in seconds.
+        """
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._tag_keys: Dict[str, Set[str]] = {}
+        self._key_tags: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _discard(self, key: str) -> None:
+        self._entries.pop(key, None)
+        for tag in self._key_tags.pop(key, ()):
+            keys = self._tag_keys.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_keys[tag]
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        Return the cached value for a key and mark it as recently used.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[bytes]: The cached value, or None if it is missing or expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if time.monotonic() >= expires_at:
+            self._discard(key)
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, tags: Iterable[str] = ()) -> None:
+        """
+        Store a value, evicting the least recently used entries if the cache is full.
+
+        Args:
+            key (str): The cache key.
+            value (bytes): The serialized value.
+            tags (Iterable[str]): Invalidation tags for the entry.
+        """
+        self._discard(key)
+        self._entries[key] = (value, time.monotonic() + self._ttl_seconds)
+
+        tags = set(tags)
+        if tags:
+            self._key_tags[key] = tags
+            for tag in tags:
+                self._tag_keys.setdefault(tag, set()).add(key)
+
+        while len(self._entries) > self._max_entries:
+            oldest_key = next(iter(self._entries))
+            self._discard(oldest_key)
+
+    async def invalidate_tags(self, *tags: str) -> None:
+        """
+        Remove every entry associated with any of the given tags.
+
+        Args:
+            tags (str): The tags to invalidate.
+        """
+        for tag in tags:
+            for key in list(self._tag_keys.get(tag, ())):
+                self._discard(key)
+
+    async def clear(self) -> None:
+        """
+        Remove every entry from the cache.
+        """
+        self._entries.clear()
+        self._tag_keys.clear()
+        self._key_tags.clear()
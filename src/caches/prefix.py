@@ -0,0 +1,178 @@
+import asyncio
+import bisect
+import heapq
+import re
+import time
+from typing import Awaitable, Callable, Dict, List, Mapping, Tuple
+
+_WORD_START = re.compile(r"(?<![^\W_])[^\W_]|(?<=[a-z])[A-Z]")
+_NON_ALNUM = re.compile(r"[\W_]+")
+
+
+def normalize_prefix(value: str) -> str:
+    """
+    Reduce a name or query to the form used for prefix matching.
+
+    Args:
+        value (str): The raw name or query.
+
+    Returns:
+        str: The lowercased value without spaces and punctuation, e.g. `michaelbjordan`
+        for `MichaelB.Jordan` as well as for `Michael B. Jordan`.
+    """
+    return _NON_ALNUM.sub("", value).lower()
+
+
+class PrefixIndex:
+    """
+    A process-local, sorted index answering "top names starting with a prefix" queries.
+
+    Every name is indexed under its normalized full form and under the normalized suffix
+    starting at each word boundary (after punctuation or at a lower-to-upper case change),
+    so `jordan` finds `MichaelB.Jordan`. Lookups are a binary search followed by a scan of
+    the matching keys; each name carries a score (e.g. its number of movies) used to rank
+    the matches.
+
+    Prefixes of up to `short_prefix_length` characters match a large share of all names,
+    so their ranked results (up to `max_results` names) are memoized and kept up to date
+    by adjustments instead of being rescanned on every lookup.
+
+    The index is rebuilt from a loader once it expires and can be adjusted in place by
+    write paths between rebuilds.
+    """
+
+    def __init__(self, ttl_seconds: float, max_results: int = 50, short_prefix_length: int = 2):
+        """
+        Initialize an empty index that needs to be loaded before use.
+
+        Args:
+            ttl_seconds (float): How long a loaded index is used before it is rebuilt, in seconds.
+            max_results (int): The number of ranked names memoized per short prefix.
+            short_prefix_length (int): The longest prefix whose results are memoized.
+        """
+        self._ttl_seconds = ttl_seconds
+        self._max_results = max_results
+        self._short_prefix_length = short_prefix_length
+        self._keys: List[Tuple[str, str]] = []
+        self._scores: Dict[str, int] = {}
+        self._short_results: Dict[str, List[str]] = {}
+        self._expires_at = 0.0
+        self._loaded = False
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    @property
+    def is_stale(self) -> bool:
+        return not self._loaded or time.monotonic() >= self._expires_at
+
+    @staticmethod
+    def _keys_for(name: str) -> List[Tuple[str, str]]:
+        keys = {normalize_prefix(name[match.start():]) for match in _WORD_START.finditer(name)}
+        return [(key, name) for key in keys if key]
+
+    def _rank(self, name: str) -> Tuple[int, str]:
+        return -self._scores[name], name
+
+    def _scan(self, key: str, limit: int) -> List[str]:
+        matches = set()
+        index = bisect.bisect_left(self._keys, (key,))
+        while index < len(self._keys) and self._keys[index][0].startswith(key):
+            matches.add(self._keys[index][1])
+            index += 1
+        return heapq.nsmallest(limit, matches, key=self._rank)
+
+    def _update_short_results(self, name: str, decreased: bool) -> None:
+        prefixes = {
+            key[:length]
+            for key, _ in self._keys_for(name)
+            for length in range(1, self._short_prefix_length + 1)
+        }
+        for prefix in prefixes:
+            ranked = self._short_results.get(prefix)
+            if ranked is None:
+                continue
+            if name not in ranked:
+                ranked.append(name)
+            elif decreased and len(ranked) >= self._max_results:
+                # A name outside the memoized results may now rank higher; rescan on next use.
+                del self._short_results[prefix]
+                continue
+            ranked.sort(key=self._rank)
+            del ranked[self._max_results:]
+
+    def replace(self, scores: Mapping[str, int]) -> None:
+        """
+        Rebuild the index from scratch.
+
+        Args:
+            scores (Mapping[str, int]): Every name to index, mapped to its score.
+        """
+        self._scores = dict(scores)
+        self._keys = sorted(key for name in self._scores for key in self._keys_for(name))
+        self._short_results = {}
+        self._expires_at = time.monotonic() + self._ttl_seconds
+        self._loaded = True
+
+    async def refresh(self, load: Callable[[], Awaitable[Mapping[str, int]]]) -> None:
+        """
+        Rebuild the index with `load` if it is stale.
+
+        Concurrent callers that find the index stale wait for a single rebuild.
+
+        Args:
+            load (Callable[[], Awaitable[Mapping[str, int]]]): A coroutine function returning
+                all names with their scores.
+        """
+        if not self.is_stale:
+            return
+
+        async with self._lock:
+            if self.is_stale:
+                self.replace(await load())
+
+    def adjust(self, deltas: Mapping[str, int]) -> None:
+        """
+        Shift the scores of names after a write, adding names that are not indexed yet.
+
+        An index that was never loaded is left alone; the next refresh loads it completely.
+
+        Args:
+            deltas (Mapping[str, int]): The change of score per name.
+        """
+        if not self._loaded:
+            return
+
+        for name, delta in deltas.items():
+            if name not in self._scores:
+                for key in self._keys_for(name):
+                    bisect.insort(self._keys, key)
+                self._scores[name] = 0
+            self._scores[name] = max(self._scores[name] + delta, 0)
+            self._update_short_results(name, decreased=delta < 0)
+
+    def suggest(self, prefix: str, limit: int) -> List[Tuple[str, int]]:
+        """
+        Return the highest-scored names with a word starting with `prefix`.
+
+        Args:
+            prefix (str): The typed prefix; case, spaces and punctuation are ignored.
+            limit (int): The maximum number of names to return.
+
+        Returns:
+            List[Tuple[str, int]]: (name, score) pairs, highest score first, then by name.
+        """
+        key = normalize_prefix(prefix)
+        if not key:
+            return []
+
+        if len(key) <= self._short_prefix_length and limit <= self._max_results:
+            ranked = self._short_results.get(key)
+            if ranked is None:
+                ranked = self._short_results[key] = self._scan(key, self._max_results)
+            best = ranked[:limit]
+        else:
+            best = self._scan(key, limit)
+
+        return [(name, self._scores[name]) for name in best]
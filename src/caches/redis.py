@@ -0,0 +1,99 @@
+from typing import Iterable, Optional
+
+from caches.interfaces import CacheInterface
+
+# Delete every tag set in KEYS together with the entries it lists. `unpack` is limited by the
+# Lua stack size, so the entries are deleted in batches.
+INVALIDATE_TAGS_SCRIPT = """
+for _, tag in ipairs(KEYS) do
+    local keys = redis.call("SMEMBERS", tag)
+    for i = 1, #keys, 1000 do
+        redis.call("DEL", unpack(keys, i, math.min(i + 999, #keys)))
+    end
+    redis.call("DEL", tag)
+end
+return #KEYS
+"""
+
+
+class RedisCache(CacheInterface):
+    """
+    A cache shared between processes and hosts, backed by Redis.
+
+    Requires the optional `redis` package. Tags are stored as Redis sets that hold the keys
+    of their entries. Invalidation reads and deletes the sets with one Lua script, which Redis
+    runs atomically, so an entry registered concurrently is either removed or keeps its tag.
+    """
+
+    def __init__(self, url: str, ttl_seconds: int, namespace: str = "cache"):
+        """
+        Initialize the Redis client.
+
+        Args:
+            url (str): The Redis connection URL (e.g. redis://localhost:6379/0).
+            ttl_seconds (int): How long an entry stays valid, in seconds.
+            namespace (str): A prefix applied to every key, so several caches can share a database.
+        """
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError as e:
+            raise RuntimeError("The 'redis' package is required for the Redis cache backend.") from e
+
+        self._client = redis_asyncio.from_url(url)
+        self._invalidate_tags = self._client.register_script(INVALIDATE_TAGS_SCRIPT)
+        self._ttl_seconds = ttl_seconds
+        self._namespace = namespace
+
+    def _key(self, key: str) -> str:
+        return f"{self._namespace}:{key}"
+
+    def _tag(self, tag: str) -> str:
+        return f"{self._namespace}:tag:{tag}"
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        Return the cached value for a key.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[bytes]: The cached value, or None if it is missing or expired.
+        """
+        return await self._client.get(self._key(key))
+
+    async def set(self, key: str, value: bytes, tags: Iterable[str] = ()) -> None:
+        """
+        Store a value with the configured time to live and register it under its tags.
+
+        The entry and its tag memberships are written in one `MULTI` transaction, so an
+        invalidation never sees the entry without its tags.
+
+        Args:
+            key (str): The cache key.
+            value (bytes): The serialized value.
+            tags (Iterable[str]): Invalidation tags for the entry.
+        """
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.set(self._key(key), value, ex=self._ttl_seconds)
+            for tag in tags:
+                pipe.sadd(self._tag(tag), self._key(key))
+                pipe.expire(self._tag(tag), self._ttl_seconds)
+            await pipe.execute()
+
+    async def invalidate_tags(self, *tags: str) -> None:
+        """
+        Remove every entry associated with any of the given tags.
+
+        Args:
+            tags (str): The tags to invalidate.
+        """
+        if tags:
+            await self._invalidate_tags(keys=[self._tag(tag) for tag in tags])
+
+    async def clear(self) -> None:
+        """
+        Remove every entry of this cache's namespace.
+        """
+        async for key in self._client.scan_iter(match=f"{self._namespace}:*"):
+            await self._client.delete(key)
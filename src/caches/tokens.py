@@ -0,0 +1,103 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import NamedTuple, Optional, Tuple
+
+
+class AccessTokenCacheStats(NamedTuple):
+    """
+    The counters of an access token cache.
+    """
+    hits: int
+    misses: int
+    entries: int
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class AccessTokenCache:
+    """
+    A process-local LRU cache of decoded access token payloads.
+
+    Only payloads of tokens whose signature was verified are stored, keyed by the SHA-256
+    digest of the token, so neither raw tokens nor unverified data are kept. An entry is
+    used until the `exp` claim of its token; tokens without `exp` are never cached.
+    """
+
+    def __init__(self, max_entries: int):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries (int): The maximum number of tokens kept before the least recently used is evicted.
+        """
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[bytes, Tuple[dict, float]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[dict]:
+        """
+        Return the payload of a previously verified token that has not expired yet.
+
+        Args:
+            token (str): The raw access token.
+
+        Returns:
+            Optional[dict]: The decoded payload, or None if the token has to be decoded.
+        """
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is not None:
+            payload, expires_at = entry
+            if time.time() < expires_at:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return payload
+            del self._entries[key]
+
+        self._misses += 1
+        return None
+
+    def set(self, token: str, payload: dict) -> None:
+        """
+        Store the payload of a verified token until its expiration time.
+
+        Args:
+            token (str): The raw access token.
+            payload (dict): The payload returned by the token manager.
+        """
+        expires_at = payload.get("exp")
+        if not isinstance(expires_at, (int, float)) or expires_at <= time.time():
+            return
+
+        key = self._key(token)
+        self._entries[key] = (payload, float(expires_at))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> AccessTokenCacheStats:
+        """
+        Return the hit and miss counters.
+
+        Returns:
+            AccessTokenCacheStats: The counters and the current number of entries.
+        """
+        return AccessTokenCacheStats(hits=self._hits, misses=self._misses, entries=len(self._entries))
+
+    def clear(self) -> None:
+        """
+        Remove every entry, e.g. after rotating the access token secret.
+        """
+        self._entries.clear()
@@ -1,7 +1,15 @@
 from config.settings import BaseAppSettings
 from config.dependencies import (
     get_settings,
+    reload_settings,
     get_jwt_auth_manager,
     get_accounts_email_notificator,
-    get_s3_storage_client
+    get_s3_storage_client,
+    get_movie_cache,
+    get_actor_suggestion_index,
+    get_password_context,
+    get_password_hasher,
+    get_access_token_cache,
+    start_app_services,
+    stop_app_services
 )
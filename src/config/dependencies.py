@@ -1,14 +1,22 @@
 import os
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
 
-from fastapi import Depends
+from fastapi import Depends, Request
+from passlib.context import CryptContext
+from starlette.datastructures import State
+
+from caches import AccessTokenCache, CacheInterface, InMemoryLRUCache, PrefixIndex, RedisCache
 
 from config.settings import TestingSettings, Settings, BaseAppSettings
 from notifications import EmailSenderInterface, EmailSender
-from security.interfaces import JWTAuthManagerInterface
+from security.interfaces import JWTAuthManagerInterface, PasswordHasherInterface
+from security.passwords import PasswordHashingService, build_password_context, set_default_password_context
 from security.token_manager import JWTAuthManager
 from storages import S3StorageInterface, S3StorageClient
 
 
+@lru_cache
 def get_settings() -> BaseAppSettings:
     """
     Retrieve the application settings based on the current environment.
@@ -17,28 +25,56 @@ def get_settings() -> BaseAppSettings:
     and returns a corresponding settings instance. If the environment is 'testing', it returns an instance
     of TestingSettings; otherwise, it returns an instance of Settings.
 
+    The settings are resolved once per process and shared by every caller, so the environment is
+    not parsed again for each request and generated secret defaults stay stable. Use
+    `reload_settings` to pick up changed environment variables.
+
+    The password hashing policy built from the settings is installed as the default of the
+    synchronous password helpers, so `UserModel` hashes with it without depending on `config`.
+
     Returns:
         BaseAppSettings: The settings instance appropriate for the current environment.
     """
     environment = os.getenv("ENVIRONMENT", "developing")
-    if environment == "testing":
-        return TestingSettings()
-    return Settings()
+    settings = TestingSettings() if environment == "testing" else Settings()
+    set_default_password_context(get_password_context(settings))
+    return settings
 
 
-def get_jwt_auth_manager(
-    settings: BaseAppSettings = Depends(get_settings),
-) -> JWTAuthManagerInterface:
+def reload_settings() -> BaseAppSettings:
+    """
+    Discard the cached settings and read them again from the environment.
+
+    Providers that build their objects from the settings per configuration (the movie cache, the
+    actor index, the password hasher, the access token cache) follow the new values on their next
+    call. The access token cache is also keyed on the signing key and algorithm, and the JWT manager
+    is rebuilt, so tokens signed with a rotated key are rejected at once. The other services created
+    at startup and values read at import time, such as the database engine, keep their configuration
+    until the process restarts.
+
+    If the password hashing settings changed, a new pool replaces the current one right away and
+    the previous pool is retired: its threads exit once the hashes submitted to it are done, while
+    requests that still hold it keep working.
+
+    Returns:
+        BaseAppSettings: The freshly loaded settings instance.
     """
-    Create and return a JWT authentication manager instance.
+    get_settings.cache_clear()
+    settings = get_settings()
+    if _password_hasher is not None:
+        get_password_hasher(settings)
+    return settings
 
-    This function uses the provided application settings to instantiate a JWTAuthManager, which implements
-    the JWTAuthManagerInterface. The manager is configured with secret keys for access and refresh tokens
-    as well as the JWT signing algorithm specified in the settings.
+
+def create_jwt_auth_manager(settings: BaseAppSettings) -> JWTAuthManagerInterface:
+    """
+    Create a JWT authentication manager instance.
+
+    The manager is configured with the secret keys for access and refresh tokens as well as
+    the JWT signing algorithm specified in the settings.
 
     Args:
-        settings (BaseAppSettings, optional): The application settings instance.
-        Defaults to the output of get_settings().
+        settings (BaseAppSettings): The application settings instance.
 
     Returns:
         JWTAuthManagerInterface: An instance of JWTAuthManager configured with
@@ -51,19 +87,15 @@ def get_jwt_auth_manager(
     )
 
 
-def get_accounts_email_notificator(
-    settings: BaseAppSettings = Depends(get_settings),
-) -> EmailSenderInterface:
+def create_accounts_email_notificator(settings: BaseAppSettings) -> EmailSenderInterface:
     """
-    Retrieve an instance of the EmailSenderInterface configured with the application settings.
+    Create an EmailSender configured with the application settings.
 
-    This function creates an EmailSender using the provided settings, which include details such as the email host,
-    port, credentials, TLS usage, and the directory and filenames for email templates. This allows the application
-    to send various email notifications (e.g., activation, password reset) as required.
+    The settings include details such as the email host, port, credentials, TLS usage, and the
+    directory and filenames for email templates used for activation and password reset emails.
 
     Args:
-        settings (BaseAppSettings, optional): The application settings,
-        provided via dependency injection from `get_settings`.
+        settings (BaseAppSettings): The application settings instance.
 
     Returns:
         EmailSenderInterface: An instance of EmailSender configured with the appropriate email settings.
@@ -82,19 +114,14 @@ def get_accounts_email_notificator(
     )
 
 
-def get_s3_storage_client(
-    settings: BaseAppSettings = Depends(get_settings),
-) -> S3StorageInterface:
+def create_s3_storage_client(settings: BaseAppSettings) -> S3StorageInterface:
     """
-    Retrieve an instance of the S3StorageInterface configured with the application settings.
+    Create an S3StorageClient configured with the application settings.
 
-    This function instantiates an S3StorageClient using the provided settings, which include the S3 endpoint URL,
-    access credentials, and the bucket name. The returned client can be used to interact with an S3-compatible
-    storage service for file uploads and URL generation.
+    The settings include the S3 endpoint URL, access credentials, and the bucket name.
 
     Args:
-        settings (BaseAppSettings, optional): The application settings,
-        provided via dependency injection from `get_settings`.
+        settings (BaseAppSettings): The application settings instance.
 
     Returns:
         S3StorageInterface: An instance of S3StorageClient configured with the appropriate S3 storage settings.
@@ -105,3 +132,328 @@ def get_s3_storage_client(
         secret_key=settings.S3_STORAGE_SECRET_KEY,
         bucket_name=settings.S3_BUCKET_NAME,
     )
+
+
+APP_SERVICE_FACTORIES: Dict[str, Callable[[BaseAppSettings], Any]] = {
+    "jwt_auth_manager": create_jwt_auth_manager,
+    "accounts_email_notificator": create_accounts_email_notificator,
+    "s3_storage_client": create_s3_storage_client,
+}
+
+# Application-scoped services rebuilt when `reload_settings` replaces the settings, so that rotated
+# signing keys stop verifying tokens at once. They hold no connections, so the previous instance
+# is simply dropped.
+RELOADABLE_APP_SERVICES = frozenset({"jwt_auth_manager"})
+
+
+def start_app_services(state: State, settings: BaseAppSettings) -> None:
+    """
+    Create the application-scoped services once, from the lifespan handler.
+
+    Args:
+        state (State): The application state the services are stored on.
+        settings (BaseAppSettings): The application settings.
+    """
+    for name, factory in APP_SERVICE_FACTORIES.items():
+        setattr(state, name, factory(settings))
+    state.app_service_settings = dict.fromkeys(APP_SERVICE_FACTORIES, settings)
+    get_password_hasher(settings)
+
+
+async def stop_app_services(state: State) -> None:
+    """
+    Close the application-scoped services when the application shuts down.
+
+    The services are closed in the reverse order of their creation: the password hashing
+    pool first, then the services stored on the application state, awaiting the `close`
+    method of those that hold connections (such as the S3 client's connection pool).
+
+    Args:
+        state (State): The application state the services are stored on.
+    """
+    _shutdown_password_hasher()
+    for name in reversed(APP_SERVICE_FACTORIES):
+        service = getattr(state, name, None)
+        if service is None:
+            continue
+        delattr(state, name)
+        close = getattr(service, "close", None)
+        if close is not None:
+            await close()
+    if hasattr(state, "app_service_settings"):
+        delattr(state, "app_service_settings")
+
+
+def _get_app_service(request: Request, name: str, settings: BaseAppSettings):
+    """
+    Return an application-scoped service, creating it on first use if the lifespan did not run,
+    e.g. for an application driven directly through an ASGI transport. Services listed in
+    `RELOADABLE_APP_SERVICES` are rebuilt when the settings were reloaded since their creation.
+    """
+    state = request.app.state
+    service = getattr(state, name, None)
+    built_from = getattr(state, "app_service_settings", None)
+    if built_from is None:
+        built_from = state.app_service_settings = {}
+    if service is None or (name in RELOADABLE_APP_SERVICES and built_from.get(name) is not settings):
+        service = APP_SERVICE_FACTORIES[name](settings)
+        setattr(state, name, service)
+        built_from[name] = settings
+    return service
+
+
+def get_jwt_auth_manager(
+    request: Request,
+    settings: BaseAppSettings = Depends(get_settings),
+) -> JWTAuthManagerInterface:
+    """
+    Retrieve the application-wide JWT authentication manager.
+
+    Args:
+        request (Request): The current request, used to reach the application state.
+        settings (BaseAppSettings, optional): The application settings,
+        provided via dependency injection from `get_settings`.
+
+    Returns:
+        JWTAuthManagerInterface: The JWTAuthManager created at application startup.
+    """
+    return _get_app_service(request, "jwt_auth_manager", settings)
+
+
+def get_accounts_email_notificator(
+    request: Request,
+    settings: BaseAppSettings = Depends(get_settings),
+) -> EmailSenderInterface:
+    """
+    Retrieve the application-wide email sender.
+
+    Sharing one EmailSender keeps its jinja2 environment, and with it the compiled
+    templates, alive between requests.
+
+    Args:
+        request (Request): The current request, used to reach the application state.
+        settings (BaseAppSettings, optional): The application settings,
+        provided via dependency injection from `get_settings`.
+
+    Returns:
+        EmailSenderInterface: The EmailSender created at application startup.
+    """
+    return _get_app_service(request, "accounts_email_notificator", settings)
+
+
+def get_s3_storage_client(
+    request: Request,
+    settings: BaseAppSettings = Depends(get_settings),
+) -> S3StorageInterface:
+    """
+    Retrieve the application-wide S3 storage client.
+
+    Sharing one S3StorageClient reuses its aioboto3 session between requests.
+
+    Args:
+        request (Request): The current request, used to reach the application state.
+        settings (BaseAppSettings, optional): The application settings,
+        provided via dependency injection from `get_settings`.
+
+    Returns:
+        S3StorageInterface: The S3StorageClient created at application startup.
+    """
+    return _get_app_service(request, "s3_storage_client", settings)
+
+
+@lru_cache
+def _create_movie_cache(backend: str, redis_url: str, max_entries: int, ttl_seconds: int) -> CacheInterface:
+    """
+    Create the movie response cache once per distinct configuration.
+
+    The cache must outlive single requests to be useful, so instances are memoized
+    instead of being rebuilt by every call to `get_movie_cache`.
+    """
+    if backend == "redis":
+        return RedisCache(url=redis_url, ttl_seconds=ttl_seconds, namespace="movies")
+    return InMemoryLRUCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+
+
+def get_movie_cache(
+    settings: BaseAppSettings = Depends(get_settings),
+) -> CacheInterface:
+    """
+    Retrieve the cache used for serialized movie detail and list responses.
+
+    The backend is selected with `MOVIE_CACHE_BACKEND`: `memory` (default) keeps an LRU cache
+    inside each worker process, while `redis` shares entries between workers through Redis.
+    With the `memory` backend and several workers, a write invalidates only the cache of the
+    worker that handled it; the others serve their entries until `MOVIE_CACHE_TTL_SECONDS`.
+
+    Args:
+        settings (BaseAppSettings, optional): The application settings,
+        provided via dependency injection from `get_settings`.
+
+    Returns:
+        CacheInterface: The application-wide movie cache.
+    """
+    return _create_movie_cache(
+        settings.MOVIE_CACHE_BACKEND,
+        settings.MOVIE_CACHE_REDIS_URL,
+        settings.MOVIE_CACHE_MAX_ENTRIES,
+        settings.MOVIE_CACHE_TTL_SECONDS,
+    )
+
+
+@lru_cache
+def _create_actor_suggestion_index(ttl_seconds: int) -> PrefixIndex:
+    """
+    Create the actor name index once per refresh interval setting.
+    """
+    return PrefixIndex(ttl_seconds=ttl_seconds)
+
+
+def get_actor_suggestion_index(
+    settings: BaseAppSettings = Depends(get_settings),
+) -> PrefixIndex:
+    """
+    Retrieve the in-memory index used to autocomplete actor names.
+
+    The index lives inside each worker process. It is adjusted by the movie write endpoints of
+    the same process and fully rebuilt every `ACTOR_SUGGEST_REFRESH_SECONDS` to pick up writes
+    made elsewhere.
+
+    Args:
+        settings (BaseAppSettings, optional): The application settings,
+        provided via dependency injection from `get_settings`.
+
+    Returns:
+        PrefixIndex: The application-wide actor name index.
+    """
+    return _create_actor_suggestion_index(settings.ACTOR_SUGGEST_REFRESH_SECONDS)
+
+
+@lru_cache
+def _create_access_token_cache(max_entries: int, secret_key: str, algorithm: str) -> AccessTokenCache:
+    """
+    Create the decoded access token cache once per size setting and signing configuration, so
+    payloads verified with a rotated key or algorithm are never served again.
+    """
+    return AccessTokenCache(max_entries=max_entries)
+
+
+def get_access_token_cache(
+    settings: BaseAppSettings = Depends(get_settings),
+) -> AccessTokenCache:
+    """
+    Retrieve the cache of verified access token payloads used by `get_current_user`.
+
+    The cache lives inside each worker process and holds up to `ACCESS_TOKEN_CACHE_MAX_ENTRIES`
+    tokens, each until its own expiration time. A new, empty cache is used once
+    `SECRET_KEY_ACCESS` or `JWT_SIGNING_ALGORITHM` change.
+
+    Args:
+        settings (BaseAppSettings, optional): The application settings,
+        provided via dependency injection from `get_settings`.
+
+    Returns:
+        AccessTokenCache: The application-wide access token cache.
+    """
+    return _create_access_token_cache(
+        settings.ACCESS_TOKEN_CACHE_MAX_ENTRIES,
+        settings.SECRET_KEY_ACCESS,
+        settings.JWT_SIGNING_ALGORITHM,
+    )
+
+
+@lru_cache
+def _create_password_context(
+        schemes: str,
+        bcrypt_rounds: int,
+        argon2_time_cost: int,
+        argon2_memory_cost: int,
+        argon2_parallelism: int,
+) -> CryptContext:
+    """
+    Build the password hashing policy once per configuration.
+    """
+    return build_password_context(
+        schemes=[scheme.strip() for scheme in schemes.split(",") if scheme.strip()],
+        bcrypt_rounds=bcrypt_rounds,
+        argon2_time_cost=argon2_time_cost,
+        argon2_memory_cost=argon2_memory_cost,
+        argon2_parallelism=argon2_parallelism,
+    )
+
+
+def get_password_context(
+    settings: BaseAppSettings = Depends(get_settings),
+) -> CryptContext:
+    """
+    Retrieve the password hashing policy configured by the `PASSWORD_HASH_SCHEMES`,
+    `PASSWORD_BCRYPT_*` and `PASSWORD_ARGON2_*` settings.
+
+    The password hasher and the synchronous `UserModel` password helpers share this
+    policy, so every path hashes with the same scheme and cost.
+
+    Args:
+        settings (BaseAppSettings, optional): The application settings,
+        provided via dependency injection from `get_settings`.
+
+    Returns:
+        CryptContext: The configured passlib context.
+    """
+    return _create_password_context(
+        settings.PASSWORD_HASH_SCHEMES,
+        settings.PASSWORD_BCRYPT_ROUNDS,
+        settings.PASSWORD_ARGON2_TIME_COST,
+        settings.PASSWORD_ARGON2_MEMORY_COST,
+        settings.PASSWORD_ARGON2_PARALLELISM,
+    )
+
+
+# The password hashing pool in use and the values it was built from. It is kept as an explicit
+# reference rather than in an `lru_cache`, so that the pool it replaces can be retired.
+_password_hasher: Optional[Tuple[tuple, PasswordHashingService]] = None
+
+
+def get_password_hasher(
+    settings: BaseAppSettings = Depends(get_settings),
+) -> PasswordHasherInterface:
+    """
+    Retrieve the service that hashes and verifies passwords off the event loop.
+
+    One pool is kept per worker process. When the hashing settings change, a new pool
+    replaces it and the previous one is retired once its pending hashes are done.
+
+    `PASSWORD_HASH_WORKERS` threads hash in parallel and up to `PASSWORD_HASH_MAX_PENDING`
+    further calls wait for one of them; calls beyond that are rejected so that a burst of
+    logins cannot queue up unbounded work.
+
+    New passwords are hashed with the first of the comma-separated `PASSWORD_HASH_SCHEMES`
+    (`bcrypt` or `argon2`) using the `PASSWORD_BCRYPT_*` / `PASSWORD_ARGON2_*` costs; hashes
+    made under another scheme or cost are upgraded (or downgraded) at the next login.
+
+    Args:
+        settings (BaseAppSettings, optional): The application settings,
+        provided via dependency injection from `get_settings`.
+
+    Returns:
+        PasswordHasherInterface: The application-wide password hashing service.
+    """
+    global _password_hasher
+
+    key = (settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_MAX_PENDING, get_password_context(settings))
+    if _password_hasher is None or _password_hasher[0] != key:
+        previous = _password_hasher
+        _password_hasher = (key, PasswordHashingService(max_workers=key[0], max_pending=key[1], context=key[2]))
+        if previous is not None:
+            previous[1].retire()
+    return _password_hasher[1]
+
+
+def _shutdown_password_hasher() -> None:
+    """
+    Stop the worker threads of the current password hashing pool and forget it, so that the
+    next `get_password_hasher` call creates a new pool.
+    """
+    global _password_hasher
+
+    previous, _password_hasher = _password_hasher, None
+    if previous is not None:
+        previous[1].shutdown()
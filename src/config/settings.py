@@ -20,6 +20,28 @@ class BaseAppSettings(BaseSettings):
 
     LOGIN_TIME_DAYS: int = 7
 
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", min(4, os.cpu_count() or 1)))
+    PASSWORD_HASH_MAX_PENDING: int = int(os.getenv("PASSWORD_HASH_MAX_PENDING", 32))
+    PASSWORD_HASH_SCHEMES: str = os.getenv("PASSWORD_HASH_SCHEMES", "bcrypt")
+    PASSWORD_BCRYPT_ROUNDS: int = int(os.getenv("PASSWORD_BCRYPT_ROUNDS", 14))
+    PASSWORD_ARGON2_TIME_COST: int = int(os.getenv("PASSWORD_ARGON2_TIME_COST", 3))
+    PASSWORD_ARGON2_MEMORY_COST: int = int(os.getenv("PASSWORD_ARGON2_MEMORY_COST", 65536))
+    PASSWORD_ARGON2_PARALLELISM: int = int(os.getenv("PASSWORD_ARGON2_PARALLELISM", 4))
+
+    MOVIE_COUNT_CACHE_TTL_SECONDS: int = int(os.getenv("MOVIE_COUNT_CACHE_TTL_SECONDS", 60))
+
+    # `memory` keeps the movie cache inside each worker process: with several uvicorn workers, a write
+    # only invalidates the entries of the worker that handled it, and the other workers may serve
+    # stale responses until MOVIE_CACHE_TTL_SECONDS expire. Use `redis` when running several workers.
+    MOVIE_CACHE_BACKEND: str = os.getenv("MOVIE_CACHE_BACKEND", "memory")
+    MOVIE_CACHE_REDIS_URL: str = os.getenv("MOVIE_CACHE_REDIS_URL", "redis://localhost:6379/0")
+    MOVIE_CACHE_MAX_ENTRIES: int = int(os.getenv("MOVIE_CACHE_MAX_ENTRIES", 1024))
+    MOVIE_CACHE_TTL_SECONDS: int = int(os.getenv("MOVIE_CACHE_TTL_SECONDS", 300))
+
+    ACTOR_SUGGEST_REFRESH_SECONDS: int = int(os.getenv("ACTOR_SUGGEST_REFRESH_SECONDS", 300))
+
+    ACCESS_TOKEN_CACHE_MAX_ENTRIES: int = int(os.getenv("ACCESS_TOKEN_CACHE_MAX_ENTRIES", 10000))
+
     EMAIL_HOST: str = os.getenv("EMAIL_HOST", "host")
     EMAIL_PORT: int = int(os.getenv("EMAIL_PORT", 25))
     EMAIL_HOST_USER: str = os.getenv("EMAIL_HOST_USER", "testuser")
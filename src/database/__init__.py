@@ -18,8 +18,11 @@ from database.models.movies import (
     CountryModel,
     MoviesGenresModel,
     ActorsMoviesModel,
-    MoviesLanguagesModel
+    MoviesLanguagesModel,
+    MovieFacetCountModel,
+    MovieStatsModel
 )
+from database.search import movie_search_subquery, search_terms
 from database.session_sqlite import reset_sqlite_database as reset_database
 from database.validators import accounts as accounts_validators
 
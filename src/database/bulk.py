@@ -0,0 +1,169 @@
+from typing import Dict, Iterable, Iterator, List, Sequence, Set, Tuple
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+CHUNK_SIZE = 1000
+
+
+def chunked(items: Sequence, size: int = CHUNK_SIZE) -> Iterator[Sequence]:
+    """
+    Split a sequence into consecutive slices of at most `size` items.
+
+    :param items: The sequence to split.
+    :param size: The maximum number of items per slice.
+    :return: An iterator over the slices.
+    """
+    for i in range(0, len(items), size):
+        yield items[i: i + size]
+
+
+def insert_ignoring_conflicts(db: AsyncSession, model):
+    """
+    Build an `INSERT ... ON CONFLICT DO NOTHING` for the session's database dialect.
+
+    :param db: The async database session (used to detect the dialect).
+    :param model: The SQLAlchemy model class to insert into.
+    :return: An insert statement that silently skips rows violating a unique constraint.
+    """
+    dialect = db.bind.dialect.name
+    if dialect == "postgresql":
+        return postgresql_insert(model).on_conflict_do_nothing()
+    if dialect == "sqlite":
+        return sqlite_insert(model).on_conflict_do_nothing()
+    return insert(model)
+
+
+def insert_adding_on_conflict(db: AsyncSession, model, index_elements: Sequence[str], columns: Sequence[str]):
+    """
+    Build an `INSERT ... ON CONFLICT DO UPDATE` that adds the inserted values to an existing row.
+
+    Additive upserts commute, so concurrent transactions can apply their deltas to the same
+    row without losing updates.
+
+    :param db: The async database session (used to detect the dialect).
+    :param model: The SQLAlchemy model class to insert into.
+    :param index_elements: The columns of the unique key the rows conflict on.
+    :param columns: The numeric columns whose inserted values are added on conflict.
+    :return: An insert statement to execute with a list of rows.
+    :raises NotImplementedError: If the dialect does not support `ON CONFLICT`.
+    """
+    dialect = db.bind.dialect.name
+    if dialect == "postgresql":
+        stmt = postgresql_insert(model)
+    elif dialect == "sqlite":
+        stmt = sqlite_insert(model)
+    else:
+        raise NotImplementedError(f"Upserts are not supported for the '{dialect}' dialect.")
+
+    return stmt.on_conflict_do_update(
+        index_elements=list(index_elements),
+        set_={column: getattr(model, column) + getattr(stmt.excluded, column) for column in columns},
+    )
+
+
+async def _select_ids(db: AsyncSession, model, unique_field: str, values: Sequence[str]) -> Dict[str, int]:
+    """
+    Map each existing value of `unique_field` to its primary key, one `IN (...)` query per chunk.
+    """
+    column = getattr(model, unique_field)
+    ids: Dict[str, int] = {}
+    for chunk in chunked(values):
+        result = await db.execute(select(column, model.id).where(column.in_(chunk)))
+        ids.update(result.tuples().all())
+    return ids
+
+
+async def get_or_create_bulk(
+        db: AsyncSession,
+        model,
+        values: Sequence[str],
+        unique_field: str
+) -> Dict[str, int]:
+    """
+    Resolve a list of unique values (e.g. genre names) to primary keys, creating the missing rows.
+
+    Existing rows are looked up with a single `IN (...)` query per chunk. Missing values are
+    inserted with one `INSERT ... ON CONFLICT DO NOTHING RETURNING` per chunk, so the round
+    trips do not grow with the number of values. Rows that a concurrent transaction created
+    in the meantime are skipped by the insert and picked up by a final lookup.
+
+    :param db: The async database session. The caller is responsible for committing.
+    :param model: The SQLAlchemy model class (e.g. GenreModel).
+    :param values: The values to resolve; duplicates are ignored.
+    :param unique_field: The name of the unique column holding the values (e.g. "name").
+    :return: A dict mapping each value to the id of its row.
+    """
+    unique_values: List[str] = list(dict.fromkeys(values))
+    if not unique_values:
+        return {}
+
+    ids = await _select_ids(db, model, unique_field, unique_values)
+
+    missing = [value for value in unique_values if value not in ids]
+    column = getattr(model, unique_field)
+    for chunk in chunked(missing):
+        stmt = (
+            insert_ignoring_conflicts(db, model)
+            .values([{unique_field: value} for value in chunk])
+            .returning(column, model.id)
+        )
+        result = await db.execute(stmt)
+        ids.update(result.tuples().all())
+
+    conflicted = [value for value in missing if value not in ids]
+    if conflicted:
+        ids.update(await _select_ids(db, model, unique_field, conflicted))
+
+    return ids
+
+
+async def insert_rows(db: AsyncSession, table, rows: Sequence[dict]) -> None:
+    """
+    Insert plain rows (e.g. association table rows) with one executemany per chunk.
+
+    :param db: The async database session. The caller is responsible for committing.
+    :param table: The SQLAlchemy table or model to insert into.
+    :param rows: The rows to insert, as dicts keyed by column name.
+    """
+    for chunk in chunked(rows):
+        await db.execute(insert(table), list(chunk))
+
+
+async def sync_associations(
+        db: AsyncSession,
+        table,
+        owner_column: str,
+        owner_id: int,
+        reference_column: str,
+        reference_ids: Iterable[int]
+) -> Tuple[Set[int], Set[int]]:
+    """
+    Make the association rows of one owner match a new set of references.
+
+    The current references are diffed against the wanted ones: missing rows are inserted
+    in batches, obsolete rows are removed with a single `DELETE`, and rows present in both
+    are left untouched.
+
+    :param db: The async database session. The caller is responsible for committing.
+    :param table: The association table, e.g. `MoviesGenresModel`.
+    :param owner_column: The column referencing the owner, e.g. `movie_id`.
+    :param owner_id: The id of the owner whose associations are replaced.
+    :param reference_column: The column referencing the associated rows, e.g. `genre_id`.
+    :param reference_ids: The ids the owner should be associated with afterwards.
+    :return: The added and the removed reference ids.
+    """
+    owner, reference = table.c[owner_column], table.c[reference_column]
+    result = await db.execute(select(reference).where(owner == owner_id))
+    current = set(result.scalars())
+    wanted = set(reference_ids)
+
+    removed = current - wanted
+    if removed:
+        await db.execute(delete(table).where(owner == owner_id, reference.in_(removed)))
+
+    added = wanted - current
+    await insert_rows(db, table, [{owner_column: owner_id, reference_column: ref_id} for ref_id in sorted(added)])
+    return added, removed
@@ -0,0 +1,152 @@
+import asyncio
+import time
+from enum import Enum
+from typing import Dict, Optional
+
+from sqlalchemy import select, func, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import get_settings
+from database.models.movies import MovieModel, ActorModel, ActorsMoviesModel
+
+settings = get_settings()
+
+
+class CountModeEnum(str, Enum):
+    EXACT = "exact"
+    CACHED = "cached"
+    ESTIMATE = "estimate"
+
+
+async def count_movies_per_actor(db: AsyncSession) -> Dict[str, int]:
+    """
+    Count the movies of every actor with a single grouped query.
+
+    :param db: The async database session.
+    :return: A dict mapping each actor name to its number of movies (0 for actors without movies).
+    """
+    result = await db.execute(
+        select(ActorModel.name, func.count(ActorsMoviesModel.c.movie_id))
+        .outerjoin(ActorsMoviesModel, ActorsMoviesModel.c.actor_id == ActorModel.id)
+        .group_by(ActorModel.id, ActorModel.name)
+    )
+    return dict(result.tuples().all())
+
+
+class CachedRowCount:
+    """
+    A process-local row count for a single table, kept for a limited time.
+
+    The value is refreshed with an exact `COUNT(*)` once it expires, and can be
+    adjusted in place by write paths so that it stays accurate between refreshes.
+    """
+
+    def __init__(self, model, ttl_seconds: float) -> None:
+        """
+        Initialize the cached count for the given model.
+
+        :param model: The SQLAlchemy model class whose rows are counted.
+        :param ttl_seconds: How long a computed count stays valid, in seconds.
+        """
+        self._model = model
+        self._ttl_seconds = ttl_seconds
+        self._value: Optional[int] = None
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def _get_fresh(self) -> Optional[int]:
+        if self._value is not None and time.monotonic() < self._expires_at:
+            return self._value
+        return None
+
+    def _store(self, value: int) -> None:
+        self._value = value
+        self._expires_at = time.monotonic() + self._ttl_seconds
+
+    async def count_exact(self, db: AsyncSession) -> int:
+        """
+        Run an exact `COUNT(*)` over the table and store the result.
+
+        :param db: The async database session used to run the count.
+        :return: The exact number of rows.
+        """
+        result = await db.execute(select(func.count()).select_from(self._model))
+        value = result.scalar() or 0
+        self._store(value)
+        return value
+
+    async def count_cached(self, db: AsyncSession) -> int:
+        """
+        Return the cached count, recomputing it only if it has expired.
+
+        Concurrent callers that find the value expired wait for a single refresh
+        instead of each running their own `COUNT(*)`.
+
+        :param db: The async database session used if a refresh is required.
+        :return: The cached number of rows.
+        """
+        value = self._get_fresh()
+        if value is not None:
+            return value
+
+        async with self._lock:
+            value = self._get_fresh()
+            if value is not None:
+                return value
+            return await self.count_exact(db)
+
+    async def count_estimated(self, db: AsyncSession) -> int:
+        """
+        Return the planner's row estimate from `pg_class.reltuples` on PostgreSQL.
+
+        Other backends, and PostgreSQL tables without statistics yet (never
+        analyzed, or estimated as empty), fall back to the cached count.
+
+        :param db: The async database session used to read the estimate.
+        :return: The estimated number of rows.
+        """
+        if db.bind.dialect.name == "postgresql":
+            result = await db.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)"),
+                {"table_name": self._model.__tablename__},
+            )
+            estimate = result.scalar()
+            if estimate is not None and estimate > 0:
+                return int(estimate)
+
+        return await self.count_cached(db)
+
+    async def count(self, db: AsyncSession, mode: CountModeEnum = CountModeEnum.EXACT) -> int:
+        """
+        Count the table rows using the requested strategy.
+
+        :param db: The async database session.
+        :param mode: One of `exact`, `cached` or `estimate`.
+        :return: The number of rows according to the chosen strategy.
+        """
+        if mode == CountModeEnum.CACHED:
+            return await self.count_cached(db)
+        if mode == CountModeEnum.ESTIMATE:
+            return await self.count_estimated(db)
+        return await self.count_exact(db)
+
+    def adjust(self, delta: int) -> None:
+        """
+        Shift a still-valid cached count after rows were inserted or deleted.
+
+        An expired or missing value is left alone; the next read recomputes it.
+
+        :param delta: The number of rows added (positive) or removed (negative).
+        """
+        if self._get_fresh() is not None:
+            self._value = max(self._value + delta, 0)
+
+    def invalidate(self) -> None:
+        """
+        Drop the cached value so the next read runs an exact count.
+        """
+        self._value = None
+        self._expires_at = 0.0
+
+
+movie_count = CachedRowCount(MovieModel, ttl_seconds=settings.MOVIE_COUNT_CACHE_TTL_SECONDS)
@@ -0,0 +1,99 @@
+from typing import Iterable, Optional
+
+from sqlalchemy import delete, func, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.bulk import chunked
+from database.models.movies import (
+    MovieModel,
+    GenreModel,
+    LanguageModel,
+    CountryModel,
+    MoviesGenresModel,
+    MoviesLanguagesModel,
+    MovieFacetEnum,
+    MovieFacetCountModel
+)
+
+
+FACET_SOURCES = {
+    MovieFacetEnum.GENRE: (GenreModel, GenreModel.name, MoviesGenresModel.c.genre_id),
+    MovieFacetEnum.LANGUAGE: (LanguageModel, LanguageModel.name, MoviesLanguagesModel.c.language_id),
+    MovieFacetEnum.COUNTRY: (CountryModel, CountryModel.code, MovieModel.country_id),
+}
+
+
+async def refresh_facet_counts(
+        db: AsyncSession,
+        facet: MovieFacetEnum,
+        value_ids: Optional[Iterable[int]] = None
+) -> None:
+    """
+    Recompute the materialized movie counts of a facet.
+
+    The rows of the given values are deleted and re-inserted from a grouped
+    `INSERT ... SELECT`, so values left without movies disappear. Write paths pass
+    the ids they touched, whose rows are locked first; `None` rebuilds the whole facet.
+
+    :param db: The async database session. The caller is responsible for committing.
+    :param facet: The facet to refresh.
+    :param value_ids: The genre, language or country ids to refresh, or None for all of them.
+    """
+    model, label, reference = FACET_SOURCES[facet]
+    columns = ["facet", "value_id", "name", "movie_count"]
+    stmt = (
+        select(literal(facet.value), model.id, label, func.count())
+        .join_from(model, reference.table, reference == model.id)
+        .group_by(model.id, label)
+    )
+
+    if value_ids is None:
+        await db.execute(delete(MovieFacetCountModel).where(MovieFacetCountModel.facet == facet.value))
+        await db.execute(insert(MovieFacetCountModel).from_select(columns, stmt))
+        return
+
+    for chunk in chunked(sorted(set(value_ids))):
+        # Serialize concurrent refreshes of the same values: a writer waiting here recounts
+        # after the other one has committed, so its rows include both writes.
+        await db.execute(select(model.id).where(model.id.in_(chunk)).order_by(model.id).with_for_update())
+        await db.execute(
+            delete(MovieFacetCountModel)
+            .where(MovieFacetCountModel.facet == facet.value, MovieFacetCountModel.value_id.in_(chunk))
+        )
+        await db.execute(
+            insert(MovieFacetCountModel).from_select(columns, stmt.where(model.id.in_(chunk)))
+        )
+
+
+async def refresh_movie_facets(
+        db: AsyncSession,
+        genre_ids: Optional[Iterable[int]] = None,
+        language_ids: Optional[Iterable[int]] = None,
+        country_ids: Optional[Iterable[int]] = None
+) -> None:
+    """
+    Refresh the facet counts of the genres, languages and countries touched by a movie write.
+
+    :param db: The async database session. The caller is responsible for committing.
+    :param genre_ids: The ids of the genres whose movies changed.
+    :param language_ids: The ids of the languages whose movies changed.
+    :param country_ids: The ids of the countries whose movies changed.
+    """
+    for facet, value_ids in (
+            (MovieFacetEnum.GENRE, genre_ids),
+            (MovieFacetEnum.LANGUAGE, language_ids),
+            (MovieFacetEnum.COUNTRY, country_ids),
+    ):
+        value_ids = list(value_ids or ())
+        if value_ids:
+            await refresh_facet_counts(db, facet, value_ids)
+
+
+async def rebuild_movie_facets(db: AsyncSession) -> None:
+    """
+    Recompute every facet count, e.g. after seeding the database.
+
+    :param db: The async database session. The caller is responsible for committing.
+    """
+    for facet in MovieFacetEnum:
+        await refresh_facet_counts(db, facet)
@@ -0,0 +1,28 @@
+"""add movie version and updated_at
+
+Revision ID: 5c3e8a1f9b27
+Revises: 41cdafa531cf
+Create Date: 2026-10-18 10:12:31.482913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c3e8a1f9b27'
+down_revision: Union[str, None] = '41cdafa531cf'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('movies', sa.Column('version', sa.Integer(), server_default=sa.text('1'), nullable=False))
+    op.add_column('movies', sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('movies', 'updated_at')
+    op.drop_column('movies', 'version')
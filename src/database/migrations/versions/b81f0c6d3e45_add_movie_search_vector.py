@@ -0,0 +1,52 @@
+"""add movie search vector
+
+Revision ID: b81f0c6d3e45
+Revises: 9d4b7e2c1a60
+Create Date: 2026-10-18 15:02:44.630187
+
+The `search_vector` column is maintained by a trigger and deliberately not
+mapped on `MovieModel`, so autogenerate will report it; do not drop it.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b81f0c6d3e45'
+down_revision: Union[str, None] = '9d4b7e2c1a60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE movies ADD COLUMN search_vector tsvector")
+    op.execute("""
+        CREATE OR REPLACE FUNCTION movies_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector :=
+                setweight(to_tsvector('english', coalesce(NEW.name, '')), 'A') ||
+                setweight(to_tsvector('english', coalesce(NEW.overview, '')), 'B');
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER movies_search_vector_trigger
+        BEFORE INSERT OR UPDATE OF name, overview ON movies
+        FOR EACH ROW EXECUTE FUNCTION movies_search_vector_update()
+    """)
+    op.execute("""
+        UPDATE movies SET search_vector =
+            setweight(to_tsvector('english', coalesce(name, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(overview, '')), 'B')
+    """)
+    op.create_index('ix_movies_search_vector', 'movies', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_movies_search_vector', table_name='movies', postgresql_using='gin')
+    op.execute("DROP TRIGGER IF EXISTS movies_search_vector_trigger ON movies")
+    op.execute("DROP FUNCTION IF EXISTS movies_search_vector_update()")
+    op.execute("ALTER TABLE movies DROP COLUMN search_vector")
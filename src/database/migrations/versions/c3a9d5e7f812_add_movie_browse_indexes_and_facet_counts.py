@@ -0,0 +1,52 @@
+"""add movie browse indexes and facet counts
+
+Revision ID: c3a9d5e7f812
+Revises: b81f0c6d3e45
+Create Date: 2026-10-18 17:26:09.541870
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3a9d5e7f812'
+down_revision: Union[str, None] = 'b81f0c6d3e45'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_actors_movies_actor_id_movie_id', 'actors_movies', ['actor_id', 'movie_id'], unique=False)
+    op.create_table('movie_facet_counts',
+    sa.Column('facet', sa.String(length=20), nullable=False),
+    sa.Column('value_id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('movie_count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('facet', 'value_id')
+    )
+    op.execute("""
+        INSERT INTO movie_facet_counts (facet, value_id, name, movie_count)
+        SELECT 'genre', genres.id, genres.name, count(*)
+        FROM genres JOIN movies_genres ON movies_genres.genre_id = genres.id
+        GROUP BY genres.id, genres.name
+    """)
+    op.execute("""
+        INSERT INTO movie_facet_counts (facet, value_id, name, movie_count)
+        SELECT 'language', languages.id, languages.name, count(*)
+        FROM languages JOIN movies_languages ON movies_languages.language_id = languages.id
+        GROUP BY languages.id, languages.name
+    """)
+    op.execute("""
+        INSERT INTO movie_facet_counts (facet, value_id, name, movie_count)
+        SELECT 'country', countries.id, countries.code, count(*)
+        FROM countries JOIN movies ON movies.country_id = countries.id
+        GROUP BY countries.id, countries.code
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('movie_facet_counts')
+    op.drop_index('ix_actors_movies_actor_id_movie_id', table_name='actors_movies')
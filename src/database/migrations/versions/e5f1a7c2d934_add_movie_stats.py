@@ -0,0 +1,56 @@
+"""add movie stats
+
+Revision ID: e5f1a7c2d934
+Revises: c3a9d5e7f812
+Create Date: 2026-10-18 18:02:47.316204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5f1a7c2d934'
+down_revision: Union[str, None] = 'c3a9d5e7f812'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('movie_stats',
+    sa.Column('dimension', sa.String(length=20), nullable=False),
+    sa.Column('key_id', sa.Integer(), nullable=False),
+    sa.Column('label', sa.String(length=255), nullable=False),
+    sa.Column('movie_count', sa.Integer(), nullable=False),
+    sa.Column('score_sum', sa.Float(), nullable=False),
+    sa.Column('budget_sum', sa.Float(), nullable=False),
+    sa.Column('revenue_sum', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('dimension', 'key_id')
+    )
+    op.execute("""
+        INSERT INTO movie_stats (dimension, key_id, label, movie_count, score_sum, budget_sum, revenue_sum)
+        SELECT 'year', CAST(EXTRACT(YEAR FROM date) AS INTEGER), CAST(EXTRACT(YEAR FROM date) AS INTEGER)::text,
+               count(*), sum(score), sum(budget), sum(revenue)
+        FROM movies
+        GROUP BY CAST(EXTRACT(YEAR FROM date) AS INTEGER)
+    """)
+    op.execute("""
+        INSERT INTO movie_stats (dimension, key_id, label, movie_count, score_sum, budget_sum, revenue_sum)
+        SELECT 'country', countries.id, countries.code, count(*), sum(score), sum(budget), sum(revenue)
+        FROM countries JOIN movies ON movies.country_id = countries.id
+        GROUP BY countries.id, countries.code
+    """)
+    op.execute("""
+        INSERT INTO movie_stats (dimension, key_id, label, movie_count, score_sum, budget_sum, revenue_sum)
+        SELECT 'genre', genres.id, genres.name, count(*), sum(score), sum(budget), sum(revenue)
+        FROM genres
+        JOIN movies_genres ON movies_genres.genre_id = genres.id
+        JOIN movies ON movies.id = movies_genres.movie_id
+        GROUP BY genres.id, genres.name
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('movie_stats')
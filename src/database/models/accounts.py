@@ -23,6 +23,7 @@ from sqlalchemy.orm import (
 
 from database import Base
 from database.validators import accounts as validators
+from security.interfaces import PasswordHasherInterface
 from security.passwords import hash_password, verify_password
 from security.utils import generate_secure_token
 
@@ -116,7 +117,8 @@ class UserModel(Base):
     @password.setter
     def password(self, raw_password: str) -> None:
         """
-        Set the user's password after validating its strength and hashing it.
+        Set the user's password after validating its strength and hashing it with the
+        configured password policy.
         """
         validators.validate_password_strength(raw_password)
         self._hashed_password = hash_password(raw_password)
@@ -127,6 +129,25 @@ class UserModel(Base):
         """
         return verify_password(raw_password, self._hashed_password)
 
+    async def set_password_async(self, raw_password: str, hasher: PasswordHasherInterface) -> None:
+        """
+        Validate and set the user's password, hashing it on the hasher's worker pool.
+        """
+        validators.validate_password_strength(raw_password)
+        self._hashed_password = await hasher.hash(raw_password)
+
+    async def verify_password_async(self, raw_password: str, hasher: PasswordHasherInterface) -> bool:
+        """
+        Verify the provided password on the hasher's worker pool.
+
+        A correct password whose hash does not follow the current hashing policy is rehashed;
+        the new hash is saved with the next commit of the session.
+        """
+        is_valid, new_hash = await hasher.verify_and_update(raw_password, self._hashed_password)
+        if new_hash:
+            self._hashed_password = new_hash
+        return is_valid
+
     @validates("email")
     def validate_email(self, key, value):
         return validators.validate_email(value.lower())
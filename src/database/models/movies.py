@@ -2,8 +2,25 @@ import datetime
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import String, Float, Text, DECIMAL, UniqueConstraint, Date, ForeignKey, Table, Column
-from sqlalchemy.orm import mapped_column, Mapped, relationship
+from sqlalchemy import (
+    String,
+    Float,
+    Text,
+    DECIMAL,
+    UniqueConstraint,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Table,
+    Column,
+    DDL,
+    event,
+    func,
+    text
+)
+from sqlalchemy.orm import mapped_column, Mapped, relationship, joinedload, selectinload
 from sqlalchemy import Enum as SQLAlchemyEnum
 
 from database import Base
@@ -15,6 +32,18 @@ class MovieStatusEnum(str, Enum):
     IN_PRODUCTION = "In Production"
 
 
+class MovieFacetEnum(str, Enum):
+    GENRE = "genre"
+    LANGUAGE = "language"
+    COUNTRY = "country"
+
+
+class MovieStatsDimensionEnum(str, Enum):
+    YEAR = "year"
+    COUNTRY = "country"
+    GENRE = "genre"
+
+
 MoviesGenresModel = Table(
     "movies_genres",
     Base.metadata,
@@ -24,6 +53,7 @@ MoviesGenresModel = Table(
     Column(
         "genre_id",
         ForeignKey("genres.id", ondelete="CASCADE"), primary_key=True, nullable=False),
+    Index("ix_movies_genres_genre_id_movie_id", "genre_id", "movie_id"),
 )
 
 ActorsMoviesModel = Table(
@@ -35,6 +65,7 @@ ActorsMoviesModel = Table(
     Column(
         "actor_id",
         ForeignKey("actors.id", ondelete="CASCADE"), primary_key=True, nullable=False),
+    Index("ix_actors_movies_actor_id_movie_id", "actor_id", "movie_id"),
 )
 
 MoviesLanguagesModel = Table(
@@ -42,6 +73,7 @@ MoviesLanguagesModel = Table(
     Base.metadata,
     Column("movie_id", ForeignKey("movies.id", ondelete="CASCADE"), primary_key=True),
     Column("language_id", ForeignKey("languages.id", ondelete="CASCADE"), primary_key=True),
+    Index("ix_movies_languages_language_id_movie_id", "language_id", "movie_id"),
 )
 
 
@@ -119,6 +151,12 @@ class MovieModel(Base):
     )
     budget: Mapped[float] = mapped_column(DECIMAL(15, 2), nullable=False)
     revenue: Mapped[float] = mapped_column(Float, nullable=False)
+    version: Mapped[int] = mapped_column(
+        Integer, server_default=text("1"), onupdate=text("version + 1"), nullable=False
+    )
+    updated_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
 
     country_id: Mapped[int] = mapped_column(ForeignKey("countries.id"), nullable=False)
     country: Mapped["CountryModel"] = relationship("CountryModel", back_populates="movies")
@@ -143,11 +181,107 @@ class MovieModel(Base):
 
     __table_args__ = (
         UniqueConstraint("name", "date", name="unique_movie_constraint"),
+        Index("ix_movies_score_id", "score", "id"),
+        Index("ix_movies_date_id", "date", "id"),
+        Index("ix_movies_revenue_id", "revenue", "id"),
+        Index("ix_movies_name_id", "name", "id"),
+        Index("ix_movies_status_id", "status", "id"),
+        Index("ix_movies_country_id_id", "country_id", "id"),
     )
 
     @classmethod
     def default_order_by(cls):
         return [cls.id.desc()]
 
+    @classmethod
+    def sort_columns(cls):
+        """
+        Columns the movie list can be sorted by, keyed by their public name.
+
+        Each one is backed by a `(column, id)` index, so that sorted pages, with `id`
+        as the tie-breaker, are read in index order.
+        """
+        return {
+            "id": cls.id,
+            "score": cls.score,
+            "date": cls.date,
+            "revenue": cls.revenue,
+            "name": cls.name,
+        }
+
+    @classmethod
+    def detail_load_options(cls, fields=None):
+        """
+        Loader options for building a full movie detail.
+
+        The many-to-one country is joined, while each collection is fetched with its
+        own `SELECT ... WHERE movie_id IN (...)`. Joining all collections at once would
+        return the cartesian product of genres, actors and languages for every movie.
+
+        If `fields` is given, only the relationships named in it are loaded.
+        """
+        options = {
+            "country": joinedload(cls.country),
+            "genres": selectinload(cls.genres),
+            "actors": selectinload(cls.actors),
+            "languages": selectinload(cls.languages),
+        }
+        return [option for name, option in options.items() if fields is None or name in fields]
+
     def __repr__(self):
         return f"<Movie(name='{self.name}', release_date='{self.date}', score={self.score})>"
+
+
+# SQLite does not enforce foreign keys unless every connection enables them, so the
+# association tables' ON DELETE CASCADE is applied by a trigger there instead.
+SQLITE_MOVIE_CASCADE_DDL = """
+CREATE TRIGGER movies_delete_cascade AFTER DELETE ON movies BEGIN
+    DELETE FROM movies_genres WHERE movie_id = old.id;
+    DELETE FROM actors_movies WHERE movie_id = old.id;
+    DELETE FROM movies_languages WHERE movie_id = old.id;
+END
+"""
+event.listen(
+    MovieModel.__table__, "after_create", DDL(SQLITE_MOVIE_CASCADE_DDL).execute_if(dialect="sqlite")
+)
+
+
+class MovieFacetCountModel(Base):
+    """
+    Materialized number of movies per genre, language and country.
+
+    Rows are recomputed by the movie write paths for the values they touch, in the
+    same transaction, so reading facet counts never aggregates the association tables.
+    `name` holds the genre or language name, or the country code.
+    """
+    __tablename__ = "movie_facet_counts"
+
+    facet: Mapped[str] = mapped_column(String(20), primary_key=True)
+    value_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    movie_count: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    def __repr__(self):
+        return f"<MovieFacetCount(facet='{self.facet}', name='{self.name}', movie_count={self.movie_count})>"
+
+
+class MovieStatsModel(Base):
+    """
+    Precomputed movie aggregates per release year, country and genre.
+
+    Sums are kept instead of averages so that write paths can add and subtract the
+    contribution of single movies; averages are derived when reading. `key_id` is the
+    year or the country or genre id, and `label` its display value.
+    """
+    __tablename__ = "movie_stats"
+
+    dimension: Mapped[str] = mapped_column(String(20), primary_key=True)
+    key_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    label: Mapped[str] = mapped_column(String(255), nullable=False)
+    movie_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    score_sum: Mapped[float] = mapped_column(Float, nullable=False)
+    budget_sum: Mapped[float] = mapped_column(Float, nullable=False)
+    revenue_sum: Mapped[float] = mapped_column(Float, nullable=False)
+
+    def __repr__(self):
+        return f"<MovieStats(dimension='{self.dimension}', label='{self.label}', movie_count={self.movie_count})>"
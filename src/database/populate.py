@@ -20,8 +20,9 @@ from database import (
     MovieModel, UserGroupModel, UserGroupEnum
 )
 from database import get_db_contextmanager
-
-CHUNK_SIZE = 1000
+from database.bulk import CHUNK_SIZE, get_or_create_bulk
+from database.facets import rebuild_movie_facets
+from database.stats import rebuild_movie_stats
 
 
 class CSVDatabaseSeeder:
@@ -104,51 +105,19 @@ class CSVDatabaseSeeder:
             model,
             items: List[str],
             unique_field: str
-    ) -> Dict[str, object]:
+    ) -> Dict[str, int]:
         """
         For a given model and a list of item names/keys (e.g., a list of genres),
         retrieves any existing records in the database matching these items.
         If some items are not found, they are created in bulk. Returns a dictionary
-        mapping the item string to the corresponding model instance.
+        mapping the item string to the corresponding record id.
 
         :param model: The SQLAlchemy model class (e.g., GenreModel).
         :param items: A list of string values to create or retrieve (e.g., ["Comedy", "Action"]).
         :param unique_field: The field name that should be unique (e.g., "name").
-        :return: A dict mapping each item to its model instance.
+        :return: A dict mapping each item to its record id.
         """
-        existing_dict: Dict[str, object] = {}
-
-        if items:
-            for i in range(0, len(items), CHUNK_SIZE):
-                chunk = items[i: i + CHUNK_SIZE]
-                result = await self._db_session.execute(
-                    select(model).where(getattr(model, unique_field).in_(chunk))
-                )
-                existing_in_chunk = result.scalars().all()
-                for obj in existing_in_chunk:
-                    key = getattr(obj, unique_field)
-                    existing_dict[key] = obj
-
-        new_items = [item for item in items if item not in existing_dict]
-        new_records = [{unique_field: item} for item in new_items]
-
-        if new_records:
-            for i in range(0, len(new_records), CHUNK_SIZE):
-                chunk = new_records[i: i + CHUNK_SIZE]
-                await self._db_session.execute(insert(model).values(chunk))
-                await self._db_session.flush()
-
-            for i in range(0, len(new_items), CHUNK_SIZE):
-                chunk = new_items[i: i + CHUNK_SIZE]
-                result_new = await self._db_session.execute(
-                    select(model).where(getattr(model, unique_field).in_(chunk))
-                )
-                inserted_in_chunk = result_new.scalars().all()
-                for obj in inserted_in_chunk:
-                    key = getattr(obj, unique_field)
-                    existing_dict[key] = obj
-
-        return existing_dict
+        return await get_or_create_bulk(self._db_session, model, items, unique_field)
 
     async def _bulk_insert(self, table, data_list: List[Dict[str, int]]) -> None:
         """
@@ -176,7 +145,7 @@ class CSVDatabaseSeeder:
     async def _prepare_reference_data(
             self,
             data: pd.DataFrame
-    ) -> Tuple[Dict[str, object], Dict[str, object], Dict[str, object], Dict[str, object]]:
+    ) -> Tuple[Dict[str, int], Dict[str, int], Dict[str, int], Dict[str, int]]:
         """
         Gather unique values for countries, genres, actors, and languages from the DataFrame.
         Then call _get_or_create_bulk for each to ensure they exist in the database.
@@ -212,18 +181,17 @@ class CSVDatabaseSeeder:
     def _prepare_movies_data(
             self,
             data: pd.DataFrame,
-            country_map: Dict[str, object]
+            country_map: Dict[str, int]
     ) -> List[Dict[str, object]]:
         """
         Build a list of dictionaries representing movie records to be inserted into MovieModel.
 
         :param data: The preprocessed DataFrame.
-        :param country_map: A mapping of country codes to CountryModel instances.
+        :param country_map: A mapping of country codes to CountryModel ids.
         :return: A list of dictionaries, each representing a new movie record.
         """
         movies_data: List[Dict[str, object]] = []
         for _, row in tqdm(data.iterrows(), total=data.shape[0], desc="Processing movies"):
-            country = country_map[row['country']]
             movie = {
                 "name": row['names'],
                 "date": row['date_x'],
@@ -232,7 +200,7 @@ class CSVDatabaseSeeder:
                 "status": row['status'],
                 "budget": float(row['budget_x']),
                 "revenue": float(row['revenue']),
-                "country_id": country.id
+                "country_id": country_map[row['country']]
             }
             movies_data.append(movie)
         return movies_data
@@ -241,9 +209,9 @@ class CSVDatabaseSeeder:
             self,
             data: pd.DataFrame,
             movie_ids: List[int],
-            genre_map: Dict[str, object],
-            actor_map: Dict[str, object],
-            language_map: Dict[str, object]
+            genre_map: Dict[str, int],
+            actor_map: Dict[str, int],
+            language_map: Dict[str, int]
     ) -> Tuple[List[Dict[str, int]], List[Dict[str, int]], List[Dict[str, int]]]:
         """
         Prepare three lists of dictionaries: movie-genre, movie-actor, and movie-language
@@ -251,9 +219,9 @@ class CSVDatabaseSeeder:
 
         :param data: The DataFrame containing movie info.
         :param movie_ids: The list of newly inserted movie IDs, in the same order as DataFrame rows.
-        :param genre_map: A mapping of genre names to GenreModel instances.
-        :param actor_map: A mapping of actor names to ActorModel instances.
-        :param language_map: A mapping of language names to LanguageModel instances.
+        :param genre_map: A mapping of genre names to GenreModel ids.
+        :param actor_map: A mapping of actor names to ActorModel ids.
+        :param language_map: A mapping of language names to LanguageModel ids.
         :return: A tuple of three lists:
                  (movie_genres_data, movie_actors_data, movie_languages_data),
                  each containing dictionaries for bulk insertion.
@@ -268,20 +236,17 @@ class CSVDatabaseSeeder:
             for genre_name in row['genre'].split(','):
                 genre_name = genre_name.strip()
                 if genre_name:
-                    genre = genre_map[genre_name]
-                    movie_genres_data.append({"movie_id": movie_id, "genre_id": genre.id})
+                    movie_genres_data.append({"movie_id": movie_id, "genre_id": genre_map[genre_name]})
 
             for actor_name in row['crew'].split(','):
                 actor_name = actor_name.strip()
                 if actor_name:
-                    actor = actor_map[actor_name]
-                    movie_actors_data.append({"movie_id": movie_id, "actor_id": actor.id})
+                    movie_actors_data.append({"movie_id": movie_id, "actor_id": actor_map[actor_name]})
 
             for lang_name in row['orig_lang'].split(','):
                 lang_name = lang_name.strip()
                 if lang_name:
-                    language = language_map[lang_name]
-                    movie_languages_data.append({"movie_id": movie_id, "language_id": language.id})
+                    movie_languages_data.append({"movie_id": movie_id, "language_id": language_map[lang_name]})
 
         return movie_genres_data, movie_actors_data, movie_languages_data
 
@@ -289,7 +254,8 @@ class CSVDatabaseSeeder:
         """
         Main method to seed the database with movie data from the CSV.
         It pre-processes the CSV, prepares reference data (countries, genres, actors, languages),
-        inserts all movies, then inserts many-to-many relationships (genres, actors, languages).
+        inserts all movies, then inserts many-to-many relationships (genres, actors, languages)
+        and finally computes the facet counts and movie stats.
         """
         try:
             if self._db_session.in_transaction():
@@ -318,6 +284,9 @@ class CSVDatabaseSeeder:
             await self._bulk_insert(ActorsMoviesModel, movie_actors_data)
             await self._bulk_insert(MoviesLanguagesModel, movie_languages_data)
 
+            await rebuild_movie_facets(self._db_session)
+            await rebuild_movie_stats(self._db_session)
+
             await self._db_session.commit()
             print("Seeding completed.")
 
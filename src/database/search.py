@@ -0,0 +1,115 @@
+import re
+
+from sqlalchemy import DDL, event, func, literal_column, select, column, table
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.models.movies import MovieModel
+
+SEARCH_CONFIG = "english"
+SEARCH_NAME_WEIGHT = 10.0
+SEARCH_OVERVIEW_WEIGHT = 1.0
+
+POSTGRESQL_SEARCH_DDL = [
+    "ALTER TABLE movies ADD COLUMN IF NOT EXISTS search_vector tsvector",
+    f"""
+    CREATE OR REPLACE FUNCTION movies_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(NEW.name, '')), 'A') ||
+            setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(NEW.overview, '')), 'B');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER movies_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF name, overview ON movies
+    FOR EACH ROW EXECUTE FUNCTION movies_search_vector_update()
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_movies_search_vector ON movies USING GIN (search_vector)",
+]
+
+SQLITE_SEARCH_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS movies_fts USING fts5(
+        name, overview, content='movies', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER movies_fts_insert AFTER INSERT ON movies BEGIN
+        INSERT INTO movies_fts(rowid, name, overview) VALUES (new.id, new.name, new.overview);
+    END
+    """,
+    """
+    CREATE TRIGGER movies_fts_delete AFTER DELETE ON movies BEGIN
+        INSERT INTO movies_fts(movies_fts, rowid, name, overview)
+        VALUES ('delete', old.id, old.name, old.overview);
+    END
+    """,
+    """
+    CREATE TRIGGER movies_fts_update AFTER UPDATE OF name, overview ON movies BEGIN
+        INSERT INTO movies_fts(movies_fts, rowid, name, overview)
+        VALUES ('delete', old.id, old.name, old.overview);
+        INSERT INTO movies_fts(rowid, name, overview) VALUES (new.id, new.name, new.overview);
+    END
+    """,
+]
+
+for statement in POSTGRESQL_SEARCH_DDL:
+    event.listen(MovieModel.__table__, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+for statement in SQLITE_SEARCH_DDL:
+    event.listen(MovieModel.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+event.listen(
+    MovieModel.__table__, "before_drop", DDL("DROP TABLE IF EXISTS movies_fts").execute_if(dialect="sqlite")
+)
+
+
+def search_terms(query: str) -> list:
+    """
+    Split a free-text query into the word tokens used for matching.
+
+    :param query: The raw search string.
+    :return: The word tokens, in order; empty if the query has no searchable words.
+    """
+    return re.findall(r"\w+", query)
+
+
+def movie_search_subquery(db: AsyncSession, query: str):
+    """
+    Build a subquery of `(id, rank)` pairs for the movies matching a free-text query.
+
+    On PostgreSQL the trigger-maintained `movies.search_vector` column is matched with
+    `websearch_to_tsquery` through its GIN index and ranked with `ts_rank_cd`, names
+    weighing more than overviews. On SQLite the `movies_fts` FTS5 table is matched with
+    every term of the query and ranked with `bm25`, negated so that a higher rank is
+    always a better match.
+
+    :param db: The async database session (used to detect the dialect).
+    :param query: The raw search string.
+    :return: A subquery with `id` and `rank` columns.
+    :raises NotImplementedError: If the database dialect has no full-text search support.
+    """
+    dialect = db.bind.dialect.name
+
+    if dialect == "postgresql":
+        search_vector = literal_column("movies.search_vector", type_=TSVECTOR)
+        ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+        return (
+            select(MovieModel.id.label("id"), func.ts_rank_cd(search_vector, ts_query).label("rank"))
+            .where(search_vector.op("@@")(ts_query))
+            .subquery()
+        )
+
+    if dialect == "sqlite":
+        fts_table = table("movies_fts", column("rowid"))
+        match_query = " ".join(f'"{term}"' for term in search_terms(query))
+        rank = -func.bm25(literal_column("movies_fts"), SEARCH_NAME_WEIGHT, SEARCH_OVERVIEW_WEIGHT)
+        return (
+            select(fts_table.c.rowid.label("id"), rank.label("rank"))
+            .select_from(fts_table)
+            .where(literal_column("movies_fts").op("MATCH")(match_query))
+            .subquery()
+        )
+
+    raise NotImplementedError(f"Full-text search is not supported for the '{dialect}' dialect.")
@@ -0,0 +1,189 @@
+import asyncio
+import datetime
+from typing import Dict, Iterable, List, NamedTuple, Sequence, Tuple
+
+from sqlalchemy import Integer, cast, delete, extract, func, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import get_db_contextmanager
+from database.bulk import chunked, insert_adding_on_conflict
+from database.models.movies import (
+    MovieModel,
+    GenreModel,
+    CountryModel,
+    MoviesGenresModel,
+    MovieStatsDimensionEnum,
+    MovieStatsModel
+)
+
+STATS_SUM_COLUMNS = ("movie_count", "score_sum", "budget_sum", "revenue_sum")
+
+
+class MovieStatsEntry(NamedTuple):
+    """
+    The contribution of a single movie to the `movie_stats` aggregates.
+    """
+    year: int
+    country_id: int
+    country_code: str
+    genres: Sequence[Tuple[int, str]]
+    score: float
+    budget: float
+    revenue: float
+
+    @classmethod
+    def for_movie(
+            cls,
+            date: datetime.date,
+            country_id: int,
+            country_code: str,
+            genres: Iterable[Tuple[int, str]],
+            score: float,
+            budget,
+            revenue: float
+    ) -> "MovieStatsEntry":
+        return cls(date.year, country_id, country_code, tuple(genres), float(score), float(budget), float(revenue))
+
+
+async def load_movie_stats_entries(db: AsyncSession, movie_ids: Sequence[int]) -> Dict[int, MovieStatsEntry]:
+    """
+    Load the current stats contribution of existing movies, e.g. before they are deleted or updated.
+
+    :param db: The async database session.
+    :param movie_ids: The ids of the movies to load.
+    :return: The entries keyed by movie id; unknown ids are left out.
+    """
+    movies = {}
+    genres: Dict[int, List[Tuple[int, str]]] = {}
+    for chunk in chunked(sorted(set(movie_ids))):
+        movies.update(
+            (row.id, row) for row in await db.execute(
+                select(
+                    MovieModel.id,
+                    MovieModel.date,
+                    MovieModel.country_id,
+                    CountryModel.code,
+                    MovieModel.score,
+                    MovieModel.budget,
+                    MovieModel.revenue
+                )
+                .join(CountryModel, CountryModel.id == MovieModel.country_id)
+                .where(MovieModel.id.in_(chunk))
+            )
+        )
+        for movie_id, genre_id, genre_name in await db.execute(
+                select(MoviesGenresModel.c.movie_id, GenreModel.id, GenreModel.name)
+                .join(GenreModel, GenreModel.id == MoviesGenresModel.c.genre_id)
+                .where(MoviesGenresModel.c.movie_id.in_(chunk))
+        ):
+            genres.setdefault(movie_id, []).append((genre_id, genre_name))
+
+    return {
+        movie_id: MovieStatsEntry.for_movie(
+            row.date, row.country_id, row.code, genres.get(movie_id, ()), row.score, row.budget, row.revenue
+        )
+        for movie_id, row in movies.items()
+    }
+
+
+def _stats_deltas(added: Iterable[MovieStatsEntry], removed: Iterable[MovieStatsEntry]) -> List[dict]:
+    deltas: Dict[Tuple[str, int], dict] = {}
+
+    for sign, entries in ((1, added), (-1, removed)):
+        for entry in entries:
+            keys = [
+                (MovieStatsDimensionEnum.YEAR, entry.year, str(entry.year)),
+                (MovieStatsDimensionEnum.COUNTRY, entry.country_id, entry.country_code),
+                *((MovieStatsDimensionEnum.GENRE, genre_id, name) for genre_id, name in entry.genres),
+            ]
+            for dimension, key_id, label in keys:
+                row = deltas.setdefault((dimension.value, key_id), {
+                    "dimension": dimension.value,
+                    "key_id": key_id,
+                    "label": label,
+                    "movie_count": 0,
+                    "score_sum": 0.0,
+                    "budget_sum": 0.0,
+                    "revenue_sum": 0.0,
+                })
+                row["movie_count"] += sign
+                row["score_sum"] += sign * entry.score
+                row["budget_sum"] += sign * entry.budget
+                row["revenue_sum"] += sign * entry.revenue
+
+    return [row for row in deltas.values() if any(row[column] for column in STATS_SUM_COLUMNS)]
+
+
+async def apply_movie_stats(
+        db: AsyncSession,
+        added: Iterable[MovieStatsEntry] = (),
+        removed: Iterable[MovieStatsEntry] = ()
+) -> None:
+    """
+    Incrementally update the `movie_stats` aggregates after movies were written.
+
+    The contributions of the added and removed movies are summed per year, country and
+    genre and applied with an additive upsert, so concurrent writers never overwrite each
+    other's changes. An update is the removal of the old values plus the addition of the
+    new ones. Groups left without movies are deleted.
+
+    :param db: The async database session. The caller is responsible for committing.
+    :param added: The contributions of inserted movies (or of updated movies after the change).
+    :param removed: The contributions of deleted movies (or of updated movies before the change).
+    """
+    rows = _stats_deltas(added, removed)
+    if not rows:
+        return
+
+    stmt = insert_adding_on_conflict(db, MovieStatsModel, ("dimension", "key_id"), STATS_SUM_COLUMNS)
+    for chunk in chunked(rows):
+        await db.execute(stmt, list(chunk))
+    await db.execute(delete(MovieStatsModel).where(MovieStatsModel.movie_count <= 0))
+
+
+async def rebuild_movie_stats(db: AsyncSession) -> None:
+    """
+    Recompute all `movie_stats` aggregates from the movies table.
+
+    Used after seeding and as the scheduled refresh that also corrects any floating-point
+    drift accumulated by incremental updates.
+
+    :param db: The async database session. The caller is responsible for committing.
+    """
+    year = cast(extract("year", MovieModel.date), Integer)
+    aggregates = (
+        func.count(),
+        func.sum(MovieModel.score),
+        func.sum(MovieModel.budget),
+        func.sum(MovieModel.revenue),
+    )
+    sources = (
+        select(literal(MovieStatsDimensionEnum.YEAR.value), year, cast(year, MovieStatsModel.label.type), *aggregates)
+        .group_by(year),
+        select(literal(MovieStatsDimensionEnum.COUNTRY.value), CountryModel.id, CountryModel.code, *aggregates)
+        .join(CountryModel, CountryModel.id == MovieModel.country_id)
+        .group_by(CountryModel.id, CountryModel.code),
+        select(literal(MovieStatsDimensionEnum.GENRE.value), GenreModel.id, GenreModel.name, *aggregates)
+        .join(MoviesGenresModel, MoviesGenresModel.c.movie_id == MovieModel.id)
+        .join(GenreModel, GenreModel.id == MoviesGenresModel.c.genre_id)
+        .group_by(GenreModel.id, GenreModel.name),
+    )
+    columns = ["dimension", "key_id", "label", *STATS_SUM_COLUMNS]
+
+    await db.execute(delete(MovieStatsModel))
+    for source in sources:
+        await db.execute(insert(MovieStatsModel).from_select(columns, source))
+
+
+async def main() -> None:
+    """
+    Rebuild the movie stats, e.g. from a scheduled job: `python -m database.stats`.
+    """
+    async with get_db_contextmanager() as db_session:
+        await rebuild_movie_stats(db_session)
+        await db_session.commit()
+    print("Movie stats rebuilt successfully.")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,7 +1,8 @@
 from exceptions.security import (
     BaseSecurityError,
     InvalidTokenError,
-    TokenExpiredError
+    TokenExpiredError,
+    PasswordHasherBusyError
 )
 from exceptions.email import BaseEmailError
 from exceptions.storage import (
@@ -1,14 +1,48 @@
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from sqlalchemy.exc import SQLAlchemyError
 
+from config import get_settings, get_actor_suggestion_index, start_app_services, stop_app_services
+from database import get_db_contextmanager
+from database.counts import count_movies_per_actor
 from routes import (
     movie_router,
     accounts_router,
     profiles_router
 )
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Create the application-scoped services and warm up in-memory indexes before the
+    application starts serving requests, and close the services on shutdown.
+
+    A database that is not reachable yet does not prevent startup: the indexes are
+    loaded lazily by the first request that needs them instead.
+    """
+    settings = get_settings()
+    start_app_services(app.state, settings)
+
+    actor_index = get_actor_suggestion_index(settings)
+    try:
+        async with get_db_contextmanager() as db:
+            await actor_index.refresh(lambda: count_movies_per_actor(db))
+    except (SQLAlchemyError, OSError) as error:
+        logging.warning(f"Actor suggestion index not loaded at startup: {error}")
+
+    try:
+        yield
+    finally:
+        await stop_app_services(app.state)
+
+
 app = FastAPI(
     title="Movies homework",
-    description="Description of project"
+    description="Description of project",
+    lifespan=lifespan
 )
 
 api_version_prefix = "/api/v1"
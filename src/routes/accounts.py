@@ -13,6 +13,7 @@ from config import (
     get_settings,
     BaseAppSettings,
     get_accounts_email_notificator,
+    get_password_hasher,
 )
 from database import (
     get_db,
@@ -23,7 +24,7 @@ from database import (
     PasswordResetTokenModel,
     RefreshTokenModel,
 )
-from exceptions import BaseSecurityError
+from exceptions import BaseSecurityError, PasswordHasherBusyError
 from notifications import EmailSenderInterface
 from schemas import (
     UserRegistrationRequestSchema,
@@ -37,10 +38,33 @@ from schemas import (
     TokenRefreshRequestSchema,
     TokenRefreshResponseSchema,
 )
-from security.interfaces import JWTAuthManagerInterface
+from security.interfaces import JWTAuthManagerInterface, PasswordHasherInterface
 
 router = APIRouter()
 
+PASSWORD_HASHER_BUSY_RESPONSE = {
+    "description": "Service Unavailable - Too many password operations are queued.",
+    "content": {
+        "application/json": {
+            "example": {"detail": "Too many password requests. Please try again later."}
+        }
+    },
+}
+
+
+def _password_hasher_busy() -> HTTPException:
+    """
+    Build the error returned when the password hashing queue is full.
+
+    Returns:
+        HTTPException: A 503 error asking the client to retry shortly.
+    """
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many password requests. Please try again later.",
+        headers={"Retry-After": "1"},
+    )
+
 
 @router.post(
     "/register/",
@@ -67,6 +91,7 @@ router = APIRouter()
                 }
             },
         },
+        503: PASSWORD_HASHER_BUSY_RESPONSE,
     },
 )
 async def register_user(
@@ -74,6 +99,7 @@ async def register_user(
     user_data: UserRegistrationRequestSchema,
     db: AsyncSession = Depends(get_db),
     email_sender: EmailSenderInterface = Depends(get_accounts_email_notificator),
+    password_hasher: PasswordHasherInterface = Depends(get_password_hasher),
 ) -> UserRegistrationResponseSchema:
     """
     Endpoint for user registration.
@@ -85,6 +111,7 @@ async def register_user(
     Args:
         user_data (UserRegistrationRequestSchema): The registration details including email and password.
         db (AsyncSession): The asynchronous database session.
+        password_hasher (PasswordHasherInterface): The service hashing the password off the event loop.
 
     Returns:
         UserRegistrationResponseSchema: The newly created user's details.
@@ -93,6 +120,7 @@ async def register_user(
         HTTPException:
             - 409 Conflict if a user with the same email exists.
             - 500 Internal Server Error if an error occurs during user creation.
+            - 503 Service Unavailable if the password hashing queue is full.
     """
     stmt = select(UserModel).where(UserModel.email == user_data.email)
     result = await db.execute(stmt)
@@ -112,12 +140,13 @@ async def register_user(
             detail="Default user group not found.",
         )
 
+    new_user = UserModel(email=str(user_data.email), group_id=user_group.id)
+    try:
+        await new_user.set_password_async(user_data.password, password_hasher)
+    except PasswordHasherBusyError:
+        raise _password_hasher_busy()
+
     try:
-        new_user = UserModel.create(
-            email=str(user_data.email),
-            raw_password=user_data.password,
-            group_id=user_group.id,
-        )
         db.add(new_user)
         await db.flush()
 
@@ -340,6 +369,7 @@ async def request_password_reset_token(
                 }
             },
         },
+        503: PASSWORD_HASHER_BUSY_RESPONSE,
     },
 )
 async def reset_password(
@@ -347,6 +377,7 @@ async def reset_password(
     data: PasswordResetCompleteRequestSchema,
     db: AsyncSession = Depends(get_db),
     email_sender: EmailSenderInterface = Depends(get_accounts_email_notificator),
+    password_hasher: PasswordHasherInterface = Depends(get_password_hasher),
 ) -> MessageResponseSchema:
     """
     Endpoint for resetting a user's password.
@@ -358,6 +389,7 @@ async def reset_password(
         data (PasswordResetCompleteRequestSchema): The request data containing the user's email,
          token, and new password.
         db (AsyncSession): The asynchronous database session.
+        password_hasher (PasswordHasherInterface): The service hashing the password off the event loop.
 
     Returns:
         MessageResponseSchema: A response message indicating successful password reset.
@@ -366,6 +398,7 @@ async def reset_password(
         HTTPException:
             - 400 Bad Request if the email or token is invalid, or the token has expired.
             - 500 Internal Server Error if an error occurs during the password reset process.
+            - 503 Service Unavailable if the password hashing queue is full.
     """
     stmt = select(UserModel).filter_by(email=data.email)
     result = await db.execute(stmt)
@@ -396,7 +429,11 @@ async def reset_password(
         )
 
     try:
-        user.password = data.password
+        await user.set_password_async(data.password, password_hasher)
+    except PasswordHasherBusyError:
+        raise _password_hasher_busy()
+
+    try:
         await db.run_sync(lambda s: s.delete(token_record))
         await db.commit()
 
@@ -448,6 +485,7 @@ async def reset_password(
                 }
             },
         },
+        503: PASSWORD_HASHER_BUSY_RESPONSE,
     },
 )
 async def login_user(
@@ -455,18 +493,21 @@ async def login_user(
     db: AsyncSession = Depends(get_db),
     settings: BaseAppSettings = Depends(get_settings),
     jwt_manager: JWTAuthManagerInterface = Depends(get_jwt_auth_manager),
+    password_hasher: PasswordHasherInterface = Depends(get_password_hasher),
 ) -> UserLoginResponseSchema:
     """
     Endpoint for user login.
 
     Authenticates a user using their email and password.
     If authentication is successful, creates a new refresh token and returns both access and refresh tokens.
+    A password hash made with an outdated scheme or cost is replaced in the same commit.
 
     Args:
         login_data (UserLoginRequestSchema): The login credentials.
         db (AsyncSession): The asynchronous database session.
         settings (BaseAppSettings): The application settings.
         jwt_manager (JWTAuthManagerInterface): The JWT authentication manager.
+        password_hasher (PasswordHasherInterface): The service verifying the password off the event loop.
 
     Returns:
         UserLoginResponseSchema: A response containing the access and refresh tokens.
@@ -476,12 +517,18 @@ async def login_user(
             - 401 Unauthorized if the email or password is invalid.
             - 403 Forbidden if the user account is not activated.
             - 500 Internal Server Error if an error occurs during token creation.
+            - 503 Service Unavailable if the password hashing queue is full.
     """
     stmt = select(UserModel).filter_by(email=login_data.email)
     result = await db.execute(stmt)
     user = result.scalars().first()
 
-    if not user or not user.verify_password(login_data.password):
+    try:
+        password_valid = bool(user) and await user.verify_password_async(login_data.password, password_hasher)
+    except PasswordHasherBusyError:
+        raise _password_hasher_busy()
+
+    if not password_valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password.",
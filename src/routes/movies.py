@@ -1,238 +1,1963 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select, func
+import csv
+import datetime
+import hashlib
+import io
+import json
+import zlib
+from functools import lru_cache
+from typing import AsyncIterator, Optional, List, Dict, Sequence, Tuple, Type, Union
+from urllib.parse import urlencode
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ConfigDict, ValidationError, create_model
+from sqlalchemy import JSON, and_, delete, func, or_, select, tuple_, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import load_only
+
+from caches import CacheInterface, PrefixIndex
+from config import get_movie_cache, get_actor_suggestion_index
+from database import get_db, get_db_contextmanager, MovieModel
+from database.counts import movie_count, count_movies_per_actor, CountModeEnum
+from database.facets import refresh_movie_facets
+from database.models.movies import MovieFacetEnum, MovieStatsDimensionEnum, MovieStatusEnum
+from database.search import movie_search_subquery, search_terms
+from database.stats import MovieStatsEntry, apply_movie_stats, load_movie_stats_entries
+from database import (
+    CountryModel,
+    GenreModel,
+    ActorModel,
+    LanguageModel,
+    MoviesGenresModel,
+    ActorsMoviesModel,
+    MoviesLanguagesModel,
+    MovieFacetCountModel,
+    MovieStatsModel
+)
+from database.bulk import (
+    chunked,
+    get_or_create_bulk,
+    insert_ignoring_conflicts,
+    insert_rows,
+    sync_associations
+)
+from schemas import (
+    MovieListResponseSchema,
+    MovieListItemSchema,
+    MovieDetailSchema,
+    ActorSuggestionSchema,
+    ActorSuggestionListSchema,
+    MovieFacetValueSchema,
+    MovieFacetsResponseSchema,
+    MovieStatsItemSchema,
+    MovieStatsResponseSchema,
+    MovieBatchResponseSchema
+)
+from schemas.movies import (
+    MovieCreateSchema,
+    MovieUpdateSchema,
+    MovieExportFormatEnum,
+    MovieSortFieldEnum,
+    SortOrderEnum,
+    MovieListFilterSchema,
+    MovieBulkImportStatusEnum,
+    MovieBulkImportRowSchema,
+    MovieBulkImportResponseSchema,
+    MovieBulkSelectionSchema,
+    MovieBulkUpdateSchema,
+    MovieBulkDeleteSchema,
+    MovieBulkWriteResponseSchema
+)
+from routes.utils import (
+    encode_cursor,
+    decode_cursor,
+    CursorMismatchError,
+    format_http_date,
+    is_not_modified,
+    validated_response,
+    FastJSONResponse
+)
+
+router = APIRouter(default_response_class=FastJSONResponse)
+
+BULK_IMPORT_MAX_ITEMS = 10000
+BULK_IMPORT_MAX_BYTES = 32 * 1024 * 1024
+EXPORT_BATCH_SIZE = 500
+ACTOR_SUGGEST_MAX_LIMIT = 50
+BATCH_MAX_IDS = 500
+MOVIE_LIST_CACHE_TAG = "movies:list"
+MOVIE_QUERY_CACHE_TAG = "movies:list:query"
+EXPORT_CSV_COLUMNS = [
+    "id", "name", "date", "score", "overview", "status", "budget", "revenue",
+    "country", "genres", "actors", "languages",
+]
+BROWSE_RESPONSES = {
+    400: {
+        "description": "Invalid cursor.",
+        "content": {
+            "application/json": {
+                "example": {"detail": "Invalid cursor."}
+            }
+        },
+    },
+    404: {
+        "description": "Reference or movies not found.",
+        "content": {
+            "application/json": {
+                "example": {"detail": "No movies found."}
+            }
+        },
+    }
+}
+
+
+def _movie_cache_tag(movie_id: int) -> str:
+    return f"movie:{movie_id}"
+
+
+def _pack_cached_response(etag: str, last_modified: Optional[str], payload: bytes) -> bytes:
+    return f"{etag}\n{last_modified or ''}\n".encode() + payload
+
+
+def _unpack_cached_response(value: bytes) -> Tuple[str, Optional[str], bytes]:
+    etag, last_modified, payload = value.split(b"\n", 2)
+    return etag.decode(), last_modified.decode() or None, payload
+
+
+def _validator_headers(etag: str, last_modified: Optional[str]) -> dict:
+    headers = {"ETag": etag}
+    if last_modified is not None:
+        headers["Last-Modified"] = last_modified
+    return headers
+
+
+def _json_response(payload: bytes, etag: str, last_modified: Optional[str], hit: bool) -> Response:
+    return Response(
+        content=payload,
+        media_type="application/json",
+        headers={**_validator_headers(etag, last_modified), "X-Cache": "HIT" if hit else "MISS"},
+    )
+
+
+def _not_modified_response(etag: str, last_modified: Optional[str]) -> Response:
+    return Response(status_code=304, headers=_validator_headers(etag, last_modified))
+
+
+def _movie_etag(movie_id: int, version: int, fields: Optional[Tuple[str, ...]] = None) -> str:
+    if fields is None:
+        return f'"movie-{movie_id}-v{version}"'
+    return f'"movie-{movie_id}-v{version}-{",".join(fields)}"'
+
+
+def _parse_fields(fields: Optional[str], schema: Type[BaseModel]) -> Optional[Tuple[str, ...]]:
+    """
+    Parse a comma-separated `fields` parameter against the fields of a response schema.
+
+    `id` is always included. The result keeps the schema's field order, so equivalent
+    parameters share cache entries and ETags.
+
+    :return: The selected field names, or None if all fields are requested.
+    :raises HTTPException: 400 if a name is not a field of the schema.
+    """
+    if fields is None:
+        return None
+
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested - schema.model_fields.keys()
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}. "
+                   f"Allowed fields: {', '.join(schema.model_fields)}."
+        )
+    requested.add("id")
+    selected = tuple(name for name in schema.model_fields if name in requested)
+    return None if len(selected) == len(schema.model_fields) else selected
+
+
+@lru_cache
+def _partial_schema(schema: Type[BaseModel], fields: Tuple[str, ...]) -> Type[BaseModel]:
+    """
+    Derive a model with only the given fields of `schema`.
+
+    Validating a movie with it reads just these attributes, so deferred columns and
+    relationships that were not loaded are never touched.
+    """
+    return create_model(
+        f"{schema.__name__}Partial",
+        __config__=ConfigDict(from_attributes=True),
+        **{name: (schema.model_fields[name].annotation, schema.model_fields[name]) for name in fields},
+    )
+
+
+@lru_cache
+def _partial_list_response_schema(fields: Tuple[str, ...]) -> Type[MovieListResponseSchema]:
+    return create_model(
+        "MovieListResponseSchemaPartial",
+        __base__=MovieListResponseSchema,
+        movies=(List[_partial_schema(MovieListItemSchema, fields)], ...),
+    )
+
+
+@lru_cache
+def _partial_batch_response_schema(fields: Tuple[str, ...]) -> Type[MovieBatchResponseSchema]:
+    return create_model(
+        "MovieBatchResponseSchemaPartial",
+        __base__=MovieBatchResponseSchema,
+        movies=(List[_partial_schema(MovieDetailSchema, fields)], ...),
+    )
+
+
+def _movie_column_list(fields, *required) -> list:
+    """
+    Return the scalar movie columns among `fields` plus `required`, without duplicates.
+    """
+    columns = MovieModel.__mapper__.columns
+    return [getattr(MovieModel, name) for name in dict.fromkeys((*fields, *required)) if name in columns]
+
+
+def _movie_columns(fields: Tuple[str, ...], *required) -> list:
+    """
+    Build a `load_only` option for the scalar movie columns among `fields` plus `required`.
+    """
+    return [load_only(*_movie_column_list(fields, *required))]
+
+
+def _get_movie_list_filters(
+        year_from: Optional[int] = Query(None, description="Earliest release year (inclusive)"),
+        year_to: Optional[int] = Query(None, description="Latest release year (inclusive)"),
+        date_from: Optional[datetime.date] = Query(None, description="Earliest release date (inclusive)"),
+        date_to: Optional[datetime.date] = Query(None, description="Latest release date (inclusive)"),
+        score_min: Optional[float] = Query(None, description="Minimum score (inclusive)"),
+        score_max: Optional[float] = Query(None, description="Maximum score (inclusive)"),
+        status: Optional[MovieStatusEnum] = Query(None, description="Release status"),
+        country: Optional[str] = Query(None, description="Country code, e.g. US"),
+        genre: Optional[str] = Query(None, description="Genre name"),
+        language: Optional[str] = Query(None, description="Language name"),
+) -> MovieListFilterSchema:
+    """
+    Collect the movie list filters from the query string.
+
+    The values are validated by `MovieListFilterSchema`; its errors, such as an
+    inverted range, are reported like any other invalid query parameter.
+
+    :return: The validated filters.
+    :rtype: MovieListFilterSchema
+
+    :raises RequestValidationError: If a filter value is out of range or inconsistent.
+    """
+    try:
+        return MovieListFilterSchema(
+            year_from=year_from,
+            year_to=year_to,
+            date_from=date_from,
+            date_to=date_to,
+            score_min=score_min,
+            score_max=score_max,
+            status=status,
+            country=country,
+            genre=genre,
+            language=language,
+        )
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("query", *error["loc"])} for error in e.errors(include_url=False)]
+        )
+
+
+def _movie_filter_conditions(filters: MovieListFilterSchema) -> list:
+    """
+    Translate list filters into WHERE conditions on the movies table.
+
+    Year bounds become date ranges so that they can use the date index, and
+    country, genre and language filters become `IN (subquery)` conditions that
+    are served by the `(country_id, id)` and reverse association indexes.
+    """
+    conditions = []
+    if filters.year_from is not None:
+        conditions.append(MovieModel.date >= datetime.date(filters.year_from, 1, 1))
+    if filters.year_to is not None:
+        conditions.append(MovieModel.date <= datetime.date(filters.year_to, 12, 31))
+    if filters.date_from is not None:
+        conditions.append(MovieModel.date >= filters.date_from)
+    if filters.date_to is not None:
+        conditions.append(MovieModel.date <= filters.date_to)
+    if filters.score_min is not None:
+        conditions.append(MovieModel.score >= filters.score_min)
+    if filters.score_max is not None:
+        conditions.append(MovieModel.score <= filters.score_max)
+    if filters.status is not None:
+        conditions.append(MovieModel.status == filters.status)
+    if filters.country:
+        conditions.append(MovieModel.country_id.in_(
+            select(CountryModel.id).where(CountryModel.code == filters.country)
+        ))
+    if filters.genre:
+        conditions.append(MovieModel.id.in_(
+            select(MoviesGenresModel.c.movie_id)
+            .join(GenreModel, GenreModel.id == MoviesGenresModel.c.genre_id)
+            .where(GenreModel.name == filters.genre)
+        ))
+    if filters.language:
+        conditions.append(MovieModel.id.in_(
+            select(MoviesLanguagesModel.c.movie_id)
+            .join(LanguageModel, LanguageModel.id == MoviesLanguagesModel.c.language_id)
+            .where(LanguageModel.name == filters.language)
+        ))
+    return conditions
+
+
+def _movie_list_cursor(movie, sort_by: MovieSortFieldEnum, order: SortOrderEnum) -> str:
+    values = {"id": movie.id, "sort": sort_by.value, "order": order.value}
+    if sort_by != MovieSortFieldEnum.ID:
+        value = getattr(movie, sort_by.value)
+        if isinstance(value, datetime.date):
+            value = value.isoformat()
+        values["value"] = value
+    return encode_cursor(values)
+
+
+def _decode_movie_list_cursor(cursor: str, sort_by: MovieSortFieldEnum, order: SortOrderEnum) -> Tuple[int, object]:
+    """
+    Decode a list cursor into the last id and, for non-id sorts, the last sort value.
+
+    :raises CursorMismatchError: If the cursor was issued for another sort field or direction.
+    :raises ValueError: If the cursor is malformed.
+    """
+    values = decode_cursor(cursor, sort=sort_by.value, order=order.value)
+    try:
+        last_id = int(values["id"])
+        if sort_by == MovieSortFieldEnum.ID:
+            return last_id, None
+        if sort_by == MovieSortFieldEnum.DATE:
+            return last_id, datetime.date.fromisoformat(values["value"])
+        if sort_by == MovieSortFieldEnum.NAME:
+            return last_id, str(values["value"])
+        return last_id, float(values["value"])
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor.") from e
+
+
+def _search_cursor_digest(q: str) -> str:
+    """
+    Identify the search a cursor belongs to without copying the query into it: ranks of
+    different queries are not comparable.
+    """
+    return hashlib.blake2b(" ".join(search_terms(q.lower())).encode(), digest_size=8).hexdigest()
+
+
+def _page_links(
+        path: str,
+        page: int,
+        per_page: int,
+        total_pages: int,
+        cursor_mode: bool,
+        next_cursor: Optional[str],
+        query_suffix: str = ""
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Build the previous and next page links of a paginated movie list.
+
+    In cursor mode there is no previous link and the next link carries `next_cursor`.
+    """
+    if cursor_mode:
+        next_page = f"{path}?cursor={next_cursor}&per_page={per_page}{query_suffix}" if next_cursor else None
+        return None, next_page
+
+    prev_page = f"{path}?page={page - 1}&per_page={per_page}{query_suffix}" if page > 1 else None
+    next_page = f"{path}?page={page + 1}&per_page={per_page}{query_suffix}" if page < total_pages else None
+    return prev_page, next_page
+
+
+def _movie_list_etag(cache_key: str, total_items: int, movies: Sequence) -> str:
+    """
+    Derive a strong ETag for a list page from its parameters, total and the versions of its movies.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{cache_key}|{total_items}|".encode())
+    digest.update(",".join(f"{movie.id}:{movie.version}" for movie in movies).encode())
+    return f'"{digest.hexdigest()}"'
+
+
+@router.get(
+    "/movies/",
+    response_model=MovieListResponseSchema,
+    summary="Get a paginated list of movies",
+    description=(
+            "<h3>This endpoint retrieves a paginated list of movies from the database. "
+            "Clients can specify the `page` number and the number of items per page using `per_page`. "
+            "The response includes details about the movies, total pages, and total items, "
+            "along with links to the previous and next pages if applicable.</h3>"
+            "<p>Movies can be filtered by release year or date range (`year_from`, `year_to`, "
+            "`date_from`, `date_to`), score range (`score_min`, `score_max`), `status`, `country` "
+            "code, `genre` and `language`, and sorted with `sort_by` (`id`, `score`, `date`, "
+            "`revenue` or `name`) in the given `order`. By default the newest movies come first.</p>"
+            "<p>For deep traversal, pass the `next_cursor` value of a previous response as `cursor`. "
+            "Cursor pages seek directly past the last returned movie, so every page costs the same "
+            "as the first one. When `cursor` is given, `page` is ignored.</p>"
+            "<p>`count_mode` controls how `total_items` is computed: `exact` runs a full count, "
+            "`cached` reuses a recent count kept in memory, and `estimate` reads the database "
+            "planner statistics where available. Filtered lists are always counted exactly.</p>"
+            "<p>Responses carry an `ETag` header; conditional requests with `If-None-Match` are "
+            "answered with `304 Not Modified` when the page has not changed. No `Last-Modified` "
+            "is sent, because inserts, deletions and re-sorts change a page without changing the "
+            "modification time of any movie on it.</p>"
+            "<p>`fields` selects the movie fields to return, e.g. `fields=id,name,score`; columns "
+            "that are not requested are not read from the database. `id` is always returned.</p>"
+    ),
+    responses={
+        400: {
+            "description": "Invalid cursor or unknown fields.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Invalid cursor."}
+                }
+            },
+        },
+        404: {
+            "description": "No movies found.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "No movies found."}
+                }
+            },
+        }
+    }
+)
+async def get_movie_list(
+        request: Request,
+        filters: MovieListFilterSchema = Depends(_get_movie_list_filters),
+        page: int = Query(1, ge=1, description="Page number (1-based index)"),
+        per_page: int = Query(10, ge=1, le=20, description="Number of items per page"),
+        cursor: Optional[str] = Query(
+            None,
+            description="Opaque cursor from a previous response's `next_cursor` (enables keyset pagination)"
+        ),
+        sort_by: MovieSortFieldEnum = Query(MovieSortFieldEnum.ID, description="Field to sort the movies by"),
+        order: SortOrderEnum = Query(SortOrderEnum.DESC, description="Sort direction: asc or desc"),
+        count_mode: CountModeEnum = Query(
+            CountModeEnum.EXACT,
+            description="How to compute `total_items`: exact, cached or estimate"
+        ),
+        fields: Optional[str] = Query(
+            None,
+            description="Comma-separated movie fields to return, e.g. `id,name,score` (all by default)"
+        ),
+        db: AsyncSession = Depends(get_db),
+        cache: CacheInterface = Depends(get_movie_cache),
+) -> MovieListResponseSchema:
+    """
+    Fetch a paginated list of movies from the database (asynchronously).
+
+    This function retrieves a paginated list of movies, allowing the client to specify
+    the page number and the number of items per page. It calculates the total pages
+    and provides links to the previous and next pages when applicable.
+
+    Movies can be filtered and sorted; `id` is always used as the tie-breaker, so every
+    sort has a stable order backed by a `(column, id)` index. If a `cursor` is provided,
+    the page is located with a keyset seek past the last returned `(value, id)` pair
+    instead of an offset, and the `page` parameter is ignored. Every response carries a
+    `next_cursor` that can be used to continue in cursor mode with the same sort.
+
+    Serialized pages are cached per set of pagination, filter and sort parameters and
+    tagged with the ids they contain, so writes invalidate exactly the pages they affect.
+    Filtered or sorted pages are also tagged as such, because an update can move any
+    movie into or out of them.
+    Conditional requests matching the page's ETag are answered with 304 before any
+    schema is built. The ETag covers the total and the id and version of every movie on the
+    page, so it also changes when an insert or a deletion shifts the page. There is no
+    `Last-Modified`: the newest `updated_at` on the page does not move in those cases, so
+    `If-Modified-Since` alone would keep clients on a stale page.
+
+    Only the item columns plus those needed for the cursor and the cache validators are
+    selected, and the returned rows are validated into the response schema directly,
+    without building ORM instances. With `fields`, only the requested item columns are
+    selected, and items are serialized with a schema derived from `MovieListItemSchema`
+    that holds just these fields.
+
+    :param request: The incoming request, used for conditional headers.
+    :type request: Request
+    :param filters: Optional year, date, score, status, country, genre and language filters.
+    :type filters: MovieListFilterSchema
+    :param page: The page number to retrieve (1-based index, must be >= 1).
+    :type page: int
+    :param per_page: The number of items to display per page (must be between 1 and 20).
+    :type per_page: int
+    :param cursor: An opaque cursor returned as `next_cursor` by a previous request.
+    :type cursor: Optional[str]
+    :param sort_by: The field to sort the movies by.
+    :type sort_by: MovieSortFieldEnum
+    :param order: The sort direction.
+    :type order: SortOrderEnum
+    :param count_mode: The strategy used to compute the total number of movies
+        (unfiltered lists only).
+    :type count_mode: CountModeEnum
+    :param fields: A comma-separated subset of the `MovieListItemSchema` fields to return.
+    :type fields: Optional[str]
+    :param db: The async SQLAlchemy database session (provided via dependency injection).
+    :type db: AsyncSession
+    :param cache: The movie response cache (provided via dependency injection).
+    :type cache: CacheInterface
+
+    :return: A response containing the paginated list of movies and metadata.
+    :rtype: MovieListResponseSchema
+
+    :raises HTTPException: Raises a 400 error if the cursor is malformed or a field is
+        unknown, or a 404 error if no movies are found for the requested page.
+    """
+    selected_fields = _parse_fields(fields, MovieListItemSchema)
+    last_id = last_value = None
+    if cursor is not None:
+        try:
+            last_id, last_value = _decode_movie_list_cursor(cursor, sort_by, order)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    query_params = filters.model_dump(mode="json", exclude_none=True)
+    if sort_by != MovieSortFieldEnum.ID or order != SortOrderEnum.DESC:
+        query_params.update(sort_by=sort_by.value, order=order.value)
+    narrowed = bool(query_params)
+    if selected_fields is not None:
+        query_params["fields"] = ",".join(selected_fields)
+    query_suffix = f"&{urlencode(query_params)}" if query_params else ""
+
+    position = f"cursor={cursor}" if last_id is not None else f"page={page}"
+    cache_key = f"movies:list:{position}:per_page={per_page}:count={count_mode.value}{query_suffix}"
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        etag, last_modified, payload = _unpack_cached_response(cached)
+        if is_not_modified(request, etag, last_modified):
+            return _not_modified_response(etag, last_modified)
+        return _json_response(payload, etag, last_modified, hit=True)
+
+    conditions = _movie_filter_conditions(filters)
+    if conditions:
+        count_result = await db.execute(select(func.count()).select_from(MovieModel).where(*conditions))
+        total_items = count_result.scalar_one()
+    else:
+        total_items = await movie_count.count(db, count_mode)
+
+    if not total_items:
+        raise HTTPException(status_code=404, detail="No movies found.")
+
+    descending = order == SortOrderEnum.DESC
+    sort_column = MovieModel.sort_columns()[sort_by.value]
+    if sort_by == MovieSortFieldEnum.ID:
+        order_by = MovieModel.default_order_by() if descending else [sort_column.asc()]
+    else:
+        order_by = [
+            sort_column.desc() if descending else sort_column.asc(),
+            MovieModel.id.desc() if descending else MovieModel.id.asc(),
+        ]
+    item_fields = MovieListItemSchema.model_fields if selected_fields is None else selected_fields
+    columns = _movie_column_list(item_fields, sort_by.value, "version")
+    stmt = select(*columns).where(*conditions).order_by(*order_by)
+
+    if last_id is not None:
+        id_seek = MovieModel.id < last_id if descending else MovieModel.id > last_id
+        if sort_by == MovieSortFieldEnum.ID:
+            stmt = stmt.where(id_seek)
+        else:
+            value_seek = sort_column < last_value if descending else sort_column > last_value
+            stmt = stmt.where(or_(value_seek, and_(sort_column == last_value, id_seek)))
+    else:
+        stmt = stmt.offset((page - 1) * per_page)
+
+    stmt = stmt.limit(per_page + 1)
+
+    result_movies = await db.execute(stmt)
+    movies = result_movies.all()
+
+    if not movies:
+        raise HTTPException(status_code=404, detail="No movies found.")
+
+    has_more = len(movies) > per_page
+    movies = movies[:per_page]
+
+    etag = _movie_list_etag(cache_key, total_items, movies)
+    if is_not_modified(request, etag):
+        return _not_modified_response(etag, None)
+
+    if selected_fields is None:
+        item_schema, response_schema = MovieListItemSchema, MovieListResponseSchema
+    else:
+        item_schema = _partial_schema(MovieListItemSchema, selected_fields)
+        response_schema = _partial_list_response_schema(selected_fields)
+    movie_list = [item_schema.model_validate(movie) for movie in movies]
+
+    total_pages = (total_items + per_page - 1) // per_page
+    next_cursor = _movie_list_cursor(movies[-1], sort_by, order) if has_more else None
+
+    prev_page, next_page = _page_links(
+        "/theater/movies/", page, per_page, total_pages, last_id is not None, next_cursor, query_suffix
+    )
+
+    response = response_schema(
+        movies=movie_list,
+        prev_page=prev_page,
+        next_page=next_page,
+        next_cursor=next_cursor,
+        total_pages=total_pages,
+        total_items=total_items,
+    )
+    payload = response.model_dump_json().encode()
+    tags = [MOVIE_LIST_CACHE_TAG, *(_movie_cache_tag(movie.id) for movie in movie_list)]
+    if narrowed:
+        tags.append(MOVIE_QUERY_CACHE_TAG)
+    await cache.set(cache_key, _pack_cached_response(etag, None, payload), tags=tags)
+    return _json_response(payload, etag, None, hit=False)
+
+
+@router.get(
+    "/movies/search/",
+    response_model=MovieListResponseSchema,
+    summary="Search movies by name and overview",
+    description=(
+            "<h3>Full-text search over movie names and overviews.</h3>"
+            "<p>Results are ranked by relevance, matches in the name weighing more than matches "
+            "in the overview, and use the same format as `GET /theater/movies/`. Pages can be "
+            "requested with `page` and `per_page`, or followed with the `next_cursor` of a "
+            "previous response passed as `cursor`.</p>"
+    ),
+    responses={
+        400: {
+            "description": "Invalid cursor.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Invalid cursor."}
+                }
+            },
+        },
+        404: {
+            "description": "No movies found.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "No movies found."}
+                }
+            },
+        }
+    }
+)
+async def search_movies(
+        q: str = Query(..., min_length=1, max_length=200, description="Search terms"),
+        page: int = Query(1, ge=1, description="Page number (1-based index)"),
+        per_page: int = Query(10, ge=1, le=20, description="Number of items per page"),
+        cursor: Optional[str] = Query(
+            None,
+            description="Opaque cursor from a previous response's `next_cursor` (enables keyset pagination)"
+        ),
+        db: AsyncSession = Depends(get_db),
+) -> MovieListResponseSchema:
+    """
+    Search movies by name and overview, best matches first.
+
+    Matching and ranking run in the database: a GIN-indexed `tsvector` on PostgreSQL and
+    an FTS5 table on SQLite, both kept up to date by triggers. Results are ordered by
+    rank, then by id, and cursor pages seek past the last returned `(rank, id)` pair.
+
+    :param q: The search terms.
+    :type q: str
+    :param page: The page number to retrieve (1-based index, must be >= 1).
+    :type page: int
+    :param per_page: The number of items to display per page (must be between 1 and 20).
+    :type per_page: int
+    :param cursor: An opaque cursor returned as `next_cursor` by a previous request.
+    :type cursor: Optional[str]
+    :param db: The async SQLAlchemy database session (provided via dependency injection).
+    :type db: AsyncSession
+
+    :return: A response containing the ranked page of movies and metadata.
+    :rtype: MovieListResponseSchema
+
+    :raises HTTPException: Raises a 400 error if the cursor is malformed, or
+        a 404 error if no movies match the search.
+    """
+    cursor_scope = {"sort": "rank", "order": SortOrderEnum.DESC.value, "q": _search_cursor_digest(q)}
+    last_id = last_rank = None
+    if cursor is not None:
+        try:
+            values = decode_cursor(cursor, **cursor_scope)
+            last_id, last_rank = int(values["id"]), float(values["rank"])
+        except CursorMismatchError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except (ValueError, KeyError, TypeError):
+            raise HTTPException(status_code=400, detail="Invalid cursor.")
+
+    if not search_terms(q):
+        raise HTTPException(status_code=404, detail="No movies found.")
+
+    ranked = movie_search_subquery(db, q)
+    count_result = await db.execute(select(func.count()).select_from(ranked))
+    total_items = count_result.scalar_one()
+
+    if not total_items:
+        raise HTTPException(status_code=404, detail="No movies found.")
+
+    stmt = (
+        select(MovieModel, ranked.c.rank)
+        .join(ranked, ranked.c.id == MovieModel.id)
+        .order_by(ranked.c.rank.desc(), MovieModel.id.desc())
+    )
+    if last_id is not None:
+        stmt = stmt.where(or_(
+            ranked.c.rank < last_rank,
+            and_(ranked.c.rank == last_rank, MovieModel.id < last_id),
+        ))
+    else:
+        stmt = stmt.offset((page - 1) * per_page)
+
+    result = await db.execute(stmt.limit(per_page + 1))
+    rows = result.all()
+
+    if not rows:
+        raise HTTPException(status_code=404, detail="No movies found.")
+
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+
+    total_pages = (total_items + per_page - 1) // per_page
+    last_movie, rank = rows[-1]
+    next_cursor = encode_cursor({"id": last_movie.id, "rank": rank, **cursor_scope}) if has_more else None
+
+    prev_page, next_page = _page_links(
+        "/theater/movies/search/", page, per_page, total_pages, last_id is not None, next_cursor,
+        f"&{urlencode({'q': q})}"
+    )
+
+    return validated_response(MovieListResponseSchema(
+        movies=[MovieListItemSchema.model_validate(movie) for movie, _ in rows],
+        prev_page=prev_page,
+        next_page=next_page,
+        next_cursor=next_cursor,
+        total_pages=total_pages,
+        total_items=total_items,
+    ))
+
+
+@router.get(
+    "/movies/facets/",
+    response_model=MovieFacetsResponseSchema,
+    summary="Get movie counts per genre, language and country",
+    description=(
+            "<h3>Return the number of movies of every genre, language and country.</h3>"
+            "<p>Counts are read from a precomputed aggregate that is updated together with "
+            "the movies, most common values first. Values without movies are omitted.</p>"
+    ),
+)
+async def get_movie_facets(db: AsyncSession = Depends(get_db)) -> MovieFacetsResponseSchema:
+    """
+    Return the materialized movie counts per genre, language and country.
+
+    :param db: The async SQLAlchemy database session (provided via dependency injection).
+    :type db: AsyncSession
+
+    :return: The facet values of each kind with their movie counts.
+    :rtype: MovieFacetsResponseSchema
+    """
+    result = await db.execute(
+        select(MovieFacetCountModel)
+        .order_by(MovieFacetCountModel.movie_count.desc(), MovieFacetCountModel.name)
+    )
+    facets: Dict[str, List[MovieFacetValueSchema]] = {facet.value: [] for facet in MovieFacetEnum}
+    for row in result.scalars():
+        facets[row.facet].append(
+            MovieFacetValueSchema(id=row.value_id, name=row.name, movie_count=row.movie_count)
+        )
+
+    return validated_response(MovieFacetsResponseSchema(
+        genres=facets[MovieFacetEnum.GENRE.value],
+        languages=facets[MovieFacetEnum.LANGUAGE.value],
+        countries=facets[MovieFacetEnum.COUNTRY.value],
+    ))
+
+
+@router.get(
+    "/stats/",
+    response_model=MovieStatsResponseSchema,
+    summary="Get movie score, budget and revenue aggregates",
+    description=(
+            "<h3>Return the average score and the total budget and revenue of the movies, "
+            "grouped by release year, country or genre.</h3>"
+            "<p>Aggregates are read from a precomputed summary that is updated together with "
+            "the movies, so the response time does not depend on the number of movies. "
+            "Years are sorted chronologically, countries and genres by name.</p>"
+    ),
+)
+async def get_movie_stats(
+        group_by: MovieStatsDimensionEnum = Query(
+            MovieStatsDimensionEnum.YEAR, description="The dimension to group the movies by."
+        ),
+        db: AsyncSession = Depends(get_db),
+) -> MovieStatsResponseSchema:
+    """
+    Return the materialized movie aggregates of one dimension.
+
+    :param group_by: Whether to group by release year, country or genre.
+    :type group_by: MovieStatsDimensionEnum
+    :param db: The async SQLAlchemy database session (provided via dependency injection).
+    :type db: AsyncSession
+
+    :return: One aggregate per year, country or genre that has movies.
+    :rtype: MovieStatsResponseSchema
+    """
+    order = MovieStatsModel.key_id if group_by == MovieStatsDimensionEnum.YEAR else MovieStatsModel.label
+    result = await db.execute(
+        select(MovieStatsModel).where(MovieStatsModel.dimension == group_by.value).order_by(order)
+    )
+
+    return validated_response(MovieStatsResponseSchema(
+        group_by=group_by,
+        items=[
+            MovieStatsItemSchema(
+                key=row.key_id,
+                label=row.label,
+                movie_count=row.movie_count,
+                average_score=round(row.score_sum / row.movie_count, 2),
+                total_budget=round(row.budget_sum, 2),
+                total_revenue=round(row.revenue_sum, 2),
+            )
+            for row in result.scalars()
+        ],
+    ))
+
+
+async def _facet_movie_count(db: AsyncSession, facet: MovieFacetEnum, model, value_id: int, label: str) -> int:
+    """
+    Read the materialized movie count of a genre, language or country.
+
+    :raises HTTPException: 404 if the referenced row does not exist.
+    """
+    result = await db.execute(
+        select(MovieFacetCountModel.movie_count)
+        .where(MovieFacetCountModel.facet == facet.value, MovieFacetCountModel.value_id == value_id)
+    )
+    total_items = result.scalar()
+    if total_items is None:
+        if await db.get(model, value_id) is None:
+            raise HTTPException(status_code=404, detail=f"{label} with the given ID was not found.")
+        return 0
+    return total_items
+
+
+async def _browse_movies(
+        db: AsyncSession,
+        stmt,
+        movie_id_column,
+        total_items: int,
+        page: int,
+        per_page: int,
+        cursor: Optional[str],
+        path: str
+) -> MovieListResponseSchema:
+    """
+    Paginate the movies selected by `stmt`, newest first.
+
+    Movies are ordered and sought by `movie_id_column`, the movie id column of the
+    table filtered on (e.g. `movies_genres.movie_id`), so that the page is read in
+    the order of a `(reference_id, movie_id)` index instead of being sorted.
+
+    :raises HTTPException: 400 for a malformed cursor, 404 if the page is empty.
+    """
+    last_id = None
+    if cursor is not None:
+        try:
+            last_id, _ = _decode_movie_list_cursor(cursor, MovieSortFieldEnum.ID, SortOrderEnum.DESC)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    if not total_items:
+        raise HTTPException(status_code=404, detail="No movies found.")
+
+    stmt = stmt.order_by(movie_id_column.desc())
+    if last_id is not None:
+        stmt = stmt.where(movie_id_column < last_id)
+    else:
+        stmt = stmt.offset((page - 1) * per_page)
+
+    result = await db.execute(stmt.limit(per_page + 1))
+    movies = result.scalars().all()
+
+    if not movies:
+        raise HTTPException(status_code=404, detail="No movies found.")
+
+    has_more = len(movies) > per_page
+    movies = movies[:per_page]
+
+    total_pages = (total_items + per_page - 1) // per_page
+    next_cursor = _movie_list_cursor(movies[-1], MovieSortFieldEnum.ID, SortOrderEnum.DESC) if has_more else None
+    prev_page, next_page = _page_links(path, page, per_page, total_pages, last_id is not None, next_cursor)
+
+    return validated_response(MovieListResponseSchema(
+        movies=[MovieListItemSchema.model_validate(movie) for movie in movies],
+        prev_page=prev_page,
+        next_page=next_page,
+        next_cursor=next_cursor,
+        total_pages=total_pages,
+        total_items=total_items,
+    ))
+
+
+@router.get(
+    "/genres/{genre_id}/movies/",
+    response_model=MovieListResponseSchema,
+    summary="Browse the movies of a genre",
+    description="<h3>Paginated movies of a genre, newest first, in the format of `GET /theater/movies/`.</h3>",
+    responses=BROWSE_RESPONSES
+)
+async def get_genre_movies(
+        genre_id: int,
+        page: int = Query(1, ge=1, description="Page number (1-based index)"),
+        per_page: int = Query(10, ge=1, le=20, description="Number of items per page"),
+        cursor: Optional[str] = Query(None, description="Opaque cursor from a previous response's `next_cursor`"),
+        db: AsyncSession = Depends(get_db),
+) -> MovieListResponseSchema:
+    """
+    Fetch a page of the movies of a genre.
+
+    The total comes from the materialized facet counts and the page is read through the
+    `(genre_id, movie_id)` index of `movies_genres`.
+
+    :param genre_id: The id of the genre.
+    :type genre_id: int
+    :param page: The page number to retrieve (1-based index, must be >= 1).
+    :type page: int
+    :param per_page: The number of items to display per page (must be between 1 and 20).
+    :type per_page: int
+    :param cursor: An opaque cursor returned as `next_cursor` by a previous request.
+    :type cursor: Optional[str]
+    :param db: The async SQLAlchemy database session (provided via dependency injection).
+    :type db: AsyncSession
+
+    :return: A response containing the paginated list of movies and metadata.
+    :rtype: MovieListResponseSchema
+
+    :raises HTTPException: 400 for a malformed cursor, 404 if the genre does not exist
+        or the page is empty.
+    """
+    total_items = await _facet_movie_count(db, MovieFacetEnum.GENRE, GenreModel, genre_id, "Genre")
+    stmt = (
+        select(MovieModel)
+        .join(MoviesGenresModel, MoviesGenresModel.c.movie_id == MovieModel.id)
+        .where(MoviesGenresModel.c.genre_id == genre_id)
+    )
+    return await _browse_movies(
+        db, stmt, MoviesGenresModel.c.movie_id, total_items, page, per_page, cursor,
+        f"/theater/genres/{genre_id}/movies/"
+    )
+
+
+@router.get(
+    "/languages/{language_id}/movies/",
+    response_model=MovieListResponseSchema,
+    summary="Browse the movies of a language",
+    description="<h3>Paginated movies of a language, newest first, in the format of `GET /theater/movies/`.</h3>",
+    responses=BROWSE_RESPONSES
+)
+async def get_language_movies(
+        language_id: int,
+        page: int = Query(1, ge=1, description="Page number (1-based index)"),
+        per_page: int = Query(10, ge=1, le=20, description="Number of items per page"),
+        cursor: Optional[str] = Query(None, description="Opaque cursor from a previous response's `next_cursor`"),
+        db: AsyncSession = Depends(get_db),
+) -> MovieListResponseSchema:
+    """
+    Fetch a page of the movies of a language.
+
+    The total comes from the materialized facet counts and the page is read through the
+    `(language_id, movie_id)` index of `movies_languages`.
+
+    :param language_id: The id of the language.
+    :type language_id: int
+    :param page: The page number to retrieve (1-based index, must be >= 1).
+    :type page: int
+    :param per_page: The number of items to display per page (must be between 1 and 20).
+    :type per_page: int
+    :param cursor: An opaque cursor returned as `next_cursor` by a previous request.
+    :type cursor: Optional[str]
+    :param db: The async SQLAlchemy database session (provided via dependency injection).
+    :type db: AsyncSession
+
+    :return: A response containing the paginated list of movies and metadata.
+    :rtype: MovieListResponseSchema
+
+    :raises HTTPException: 400 for a malformed cursor, 404 if the language does not exist
+        or the page is empty.
+    """
+    total_items = await _facet_movie_count(db, MovieFacetEnum.LANGUAGE, LanguageModel, language_id, "Language")
+    stmt = (
+        select(MovieModel)
+        .join(MoviesLanguagesModel, MoviesLanguagesModel.c.movie_id == MovieModel.id)
+        .where(MoviesLanguagesModel.c.language_id == language_id)
+    )
+    return await _browse_movies(
+        db, stmt, MoviesLanguagesModel.c.movie_id, total_items, page, per_page, cursor,
+        f"/theater/languages/{language_id}/movies/"
+    )
+
+
+@router.get(
+    "/countries/{country_id}/movies/",
+    response_model=MovieListResponseSchema,
+    summary="Browse the movies of a country",
+    description="<h3>Paginated movies of a country, newest first, in the format of `GET /theater/movies/`.</h3>",
+    responses=BROWSE_RESPONSES
+)
+async def get_country_movies(
+        country_id: int,
+        page: int = Query(1, ge=1, description="Page number (1-based index)"),
+        per_page: int = Query(10, ge=1, le=20, description="Number of items per page"),
+        cursor: Optional[str] = Query(None, description="Opaque cursor from a previous response's `next_cursor`"),
+        db: AsyncSession = Depends(get_db),
+) -> MovieListResponseSchema:
+    """
+    Fetch a page of the movies of a country.
+
+    The total comes from the materialized facet counts and the page is read through the
+    `(country_id, id)` index of `movies`.
+
+    :param country_id: The id of the country.
+    :type country_id: int
+    :param page: The page number to retrieve (1-based index, must be >= 1).
+    :type page: int
+    :param per_page: The number of items to display per page (must be between 1 and 20).
+    :type per_page: int
+    :param cursor: An opaque cursor returned as `next_cursor` by a previous request.
+    :type cursor: Optional[str]
+    :param db: The async SQLAlchemy database session (provided via dependency injection).
+    :type db: AsyncSession
+
+    :return: A response containing the paginated list of movies and metadata.
+    :rtype: MovieListResponseSchema
+
+    :raises HTTPException: 400 for a malformed cursor, 404 if the country does not exist
+        or the page is empty.
+    """
+    total_items = await _facet_movie_count(db, MovieFacetEnum.COUNTRY, CountryModel, country_id, "Country")
+    stmt = select(MovieModel).where(MovieModel.country_id == country_id)
+    return await _browse_movies(
+        db, stmt, MovieModel.id, total_items, page, per_page, cursor, f"/theater/countries/{country_id}/movies/"
+    )
+
+
+@router.get(
+    "/actors/{actor_id}/movies/",
+    response_model=MovieListResponseSchema,
+    summary="Browse the movies of an actor",
+    description="<h3>Paginated movies of an actor, newest first, in the format of `GET /theater/movies/`.</h3>",
+    responses=BROWSE_RESPONSES
+)
+async def get_actor_movies(
+        actor_id: int,
+        page: int = Query(1, ge=1, description="Page number (1-based index)"),
+        per_page: int = Query(10, ge=1, le=20, description="Number of items per page"),
+        cursor: Optional[str] = Query(None, description="Opaque cursor from a previous response's `next_cursor`"),
+        db: AsyncSession = Depends(get_db),
+) -> MovieListResponseSchema:
+    """
+    Fetch a page of the movies of an actor.
+
+    Actors are not part of the facet counts; the total is counted on the
+    `(actor_id, movie_id)` index of `actors_movies`, which also serves the page.
+
+    :param actor_id: The id of the actor.
+    :type actor_id: int
+    :param page: The page number to retrieve (1-based index, must be >= 1).
+    :type page: int
+    :param per_page: The number of items to display per page (must be between 1 and 20).
+    :type per_page: int
+    :param cursor: An opaque cursor returned as `next_cursor` by a previous request.
+    :type cursor: Optional[str]
+    :param db: The async SQLAlchemy database session (provided via dependency injection).
+    :type db: AsyncSession
+
+    :return: A response containing the paginated list of movies and metadata.
+    :rtype: MovieListResponseSchema
+
+    :raises HTTPException: 400 for a malformed cursor, 404 if the actor does not exist
+        or the page is empty.
+    """
+    count_result = await db.execute(
+        select(func.count()).select_from(ActorsMoviesModel).where(ActorsMoviesModel.c.actor_id == actor_id)
+    )
+    total_items = count_result.scalar_one()
+    if not total_items and await db.get(ActorModel, actor_id) is None:
+        raise HTTPException(status_code=404, detail="Actor with the given ID was not found.")
+
+    stmt = (
+        select(MovieModel)
+        .join(ActorsMoviesModel, ActorsMoviesModel.c.movie_id == MovieModel.id)
+        .where(ActorsMoviesModel.c.actor_id == actor_id)
+    )
+    return await _browse_movies(
+        db, stmt, ActorsMoviesModel.c.movie_id, total_items, page, per_page, cursor,
+        f"/theater/actors/{actor_id}/movies/"
+    )
+
+
+@router.get(
+    "/actors/suggest/",
+    response_model=ActorSuggestionListSchema,
+    summary="Autocomplete actor names",
+    description=(
+            "<h3>Suggest actors whose name, or any word of it, starts with `prefix`.</h3>"
+            "<p>Case, spaces and punctuation are ignored, so `jordan` and `michael b` both "
+            "find `MichaelB.Jordan`. Up to `limit` actors are returned, those with the most "
+            "movies first.</p>"
+    ),
+)
+async def suggest_actors(
+        prefix: str = Query(..., min_length=1, max_length=100, description="The beginning of an actor name"),
+        limit: int = Query(10, ge=1, le=ACTOR_SUGGEST_MAX_LIMIT, description="Maximum number of suggestions"),
+        db: AsyncSession = Depends(get_db),
+        actor_index: PrefixIndex = Depends(get_actor_suggestion_index),
+) -> ActorSuggestionListSchema:
+    """
+    Suggest actor names starting with a prefix, ranked by their number of movies.
+
+    Suggestions are served from an in-memory sorted index, so a lookup is a binary
+    search and does not touch the database. The index is only (re)loaded, with one
+    grouped query, when it is missing or older than its refresh interval.
+
+    :param prefix: The typed beginning of an actor name.
+    :type prefix: str
+    :param limit: The maximum number of suggestions to return.
+    :type limit: int
+    :param db: The async SQLAlchemy database session, used only to reload the index.
+    :type db: AsyncSession
+    :param actor_index: The actor name index (provided via dependency injection).
+    :type actor_index: PrefixIndex
+
+    :return: The matching actor names with their movie counts.
+    :rtype: ActorSuggestionListSchema
+    """
+    await actor_index.refresh(lambda: count_movies_per_actor(db))
+    return validated_response(ActorSuggestionListSchema(suggestions=[
+        ActorSuggestionSchema(name=name, movie_count=movie_count)
+        for name, movie_count in actor_index.suggest(prefix, limit)
+    ]))
+
+
+@router.post(
+    "/movies/",
+    response_model=MovieDetailSchema,
+    summary="Add a new movie",
+    description=(
+            "<h3>This endpoint allows clients to add a new movie to the database. "
+            "It accepts details such as name, date, genres, actors, languages, and "
+            "other attributes. The associated country, genres, actors, and languages "
+            "will be created or linked automatically.</h3>"
+    ),
+    responses={
+        201: {
+            "description": "Movie created successfully.",
+        },
+        400: {
+            "description": "Invalid input.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Invalid input data."}
+                }
+            },
+        }
+    },
+    status_code=201
+)
+async def create_movie(
+        movie_data: MovieCreateSchema,
+        db: AsyncSession = Depends(get_db),
+        cache: CacheInterface = Depends(get_movie_cache),
+        actor_index: PrefixIndex = Depends(get_actor_suggestion_index),
+) -> MovieDetailSchema:
+    """
+    Add a new movie to the database.
+
+    This endpoint allows the creation of a new movie with details such as
+    name, release date, genres, actors, and languages. It automatically
+    handles linking or creating related entities. Each kind of related entity
+    is resolved in bulk: one lookup for all names and at most one insert for
+    the missing ones, regardless of how many names are given.
+
+    :param movie_data: The data required to create a new movie.
+    :type movie_data: MovieCreateSchema
+    :param db: The SQLAlchemy async database session (provided via dependency injection).
+    :type db: AsyncSession
+    :param cache: The movie response cache, whose list pages are invalidated.
+    :type cache: CacheInterface
+    :param actor_index: The actor name index, updated with the movie's actors.
+    :type actor_index: PrefixIndex
+
+    :return: The created movie with all details.
+    :rtype: MovieDetailSchema
+
+    :raises HTTPException:
+        - 409 if a movie with the same name and date already exists.
+        - 400 if input data is invalid (e.g., violating a constraint).
+    """
+    existing_stmt = select(MovieModel).where(
+        (MovieModel.name == movie_data.name),
+        (MovieModel.date == movie_data.date)
+    )
+    existing_result = await db.execute(existing_stmt)
+    existing_movie = existing_result.scalars().first()
+
+    if existing_movie:
+        raise HTTPException(
+            status_code=409,
+            detail=(
+                f"A movie with the name '{movie_data.name}' and release date "
+                f"'{movie_data.date}' already exists."
+            )
+        )
+
+    try:
+        country_ids = await get_or_create_bulk(db, CountryModel, [movie_data.country], "code")
+        genre_ids = await get_or_create_bulk(db, GenreModel, movie_data.genres, "name")
+        actor_ids = await get_or_create_bulk(db, ActorModel, movie_data.actors, "name")
+        language_ids = await get_or_create_bulk(db, LanguageModel, movie_data.languages, "name")
+
+        movie = MovieModel(
+            name=movie_data.name,
+            date=movie_data.date,
+            score=movie_data.score,
+            overview=movie_data.overview,
+            status=movie_data.status,
+            budget=movie_data.budget,
+            revenue=movie_data.revenue,
+            country_id=country_ids[movie_data.country],
+        )
+        db.add(movie)
+        await db.flush()
+
+        for table, column, ids in (
+                (MoviesGenresModel, "genre_id", genre_ids),
+                (ActorsMoviesModel, "actor_id", actor_ids),
+                (MoviesLanguagesModel, "language_id", language_ids),
+        ):
+            await insert_rows(db, table, [{"movie_id": movie.id, column: ref_id} for ref_id in ids.values()])
+
+        await refresh_movie_facets(db, genre_ids.values(), language_ids.values(), [movie.country_id])
+        await apply_movie_stats(db, added=[MovieStatsEntry.for_movie(
+            movie_data.date,
+            movie.country_id,
+            movie_data.country,
+            [(genre_id, name) for name, genre_id in genre_ids.items()],
+            movie_data.score,
+            movie_data.budget,
+            movie_data.revenue
+        )])
+        await db.commit()
+        movie_count.adjust(1)
+        actor_index.adjust({name: 1 for name in actor_ids})
+        await cache.invalidate_tags(MOVIE_LIST_CACHE_TAG)
+
+        stmt = (
+            select(MovieModel)
+            .options(*MovieModel.detail_load_options())
+            .where(MovieModel.id == movie.id)
+            .execution_options(populate_existing=True)
+        )
+        result = await db.execute(stmt)
+
+        return validated_response(MovieDetailSchema.model_validate(result.scalars().one()), status_code=201)
+
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Invalid input data.")
+
+
+def _bulk_import_too_large() -> HTTPException:
+    return HTTPException(
+        status_code=413,
+        detail=f"A bulk import may contain at most {BULK_IMPORT_MAX_ITEMS} movies "
+               f"and {BULK_IMPORT_MAX_BYTES // (1024 * 1024)} MiB."
+    )
+
+
+async def _read_bulk_records(request: Request) -> List[Union[bytes, object]]:
+    """
+    Read the raw records of a bulk import request.
+
+    NDJSON bodies (`application/x-ndjson`) are consumed as a stream and split into lines
+    as chunks arrive; the lines are validated individually later so that one malformed
+    line does not reject the whole batch. Any other body must be a JSON array.
+
+    The body size is checked against `BULK_IMPORT_MAX_BYTES` from `Content-Length` and
+    while streaming, so an oversized body is rejected before it is buffered or parsed.
+
+    :param request: The incoming request.
+    :return: A list of raw NDJSON lines or decoded JSON array items.
+    :raises HTTPException: 400 if a JSON body is malformed or not an array,
+        413 if the body exceeds `BULK_IMPORT_MAX_BYTES` or the number of records
+        exceeds `BULK_IMPORT_MAX_ITEMS`.
+    """
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > BULK_IMPORT_MAX_BYTES:
+        raise _bulk_import_too_large()
+
+    ndjson = "ndjson" in request.headers.get("content-type", "")
+    records: List[Union[bytes, object]] = []
+    buffer = bytearray()
+    received = 0
+
+    async for chunk in request.stream():
+        received += len(chunk)
+        if received > BULK_IMPORT_MAX_BYTES:
+            raise _bulk_import_too_large()
+        if not ndjson:
+            buffer += chunk
+            continue
+
+        # Only the new chunk is searched for line ends; the buffer holds the unfinished line.
+        start = 0
+        end = chunk.find(b"\n")
+        while end != -1:
+            buffer += chunk[start:end]
+            if buffer.strip():
+                records.append(bytes(buffer))
+            buffer.clear()
+            start = end + 1
+            end = chunk.find(b"\n", start)
+        buffer += chunk[start:]
+        if len(records) > BULK_IMPORT_MAX_ITEMS:
+            raise _bulk_import_too_large()
+
+    if ndjson:
+        if buffer.strip():
+            records.append(bytes(buffer))
+    else:
+        try:
+            records = json.loads(buffer)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid JSON payload.")
+        if not isinstance(records, list):
+            raise HTTPException(status_code=400, detail="Expected a JSON array of movies.")
+
+    if len(records) > BULK_IMPORT_MAX_ITEMS:
+        raise _bulk_import_too_large()
+    return records
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}" if err["loc"] else err["msg"]
+        for err in error.errors()
+    )
+
+
+@router.post(
+    "/movies/bulk/",
+    response_model=MovieBulkImportResponseSchema,
+    summary="Import movies in bulk",
+    description=(
+            "<h3>Import many movies in a single request and transaction.</h3>"
+            "<p>The body is either a JSON array of movies or an NDJSON stream "
+            "(`Content-Type: application/x-ndjson`) with one movie per line, each in the "
+            "same format as for `POST /theater/movies/`. Movies whose name and release date "
+            "already exist, in the database or earlier in the payload, are skipped. The "
+            "response reports the outcome of every record by its position in the input.</p>"
+    ),
+    responses={
+        400: {
+            "description": "Malformed payload.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Expected a JSON array of movies."}
+                }
+            },
+        },
+        413: {
+            "description": "Too many records or too large a body.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "A bulk import may contain at most 10000 movies and 32 MiB."}
+                }
+            },
+        },
+    },
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"type": "array", "items": {"$ref": "#/components/schemas/MovieCreateSchema"}}
+                },
+                "application/x-ndjson": {
+                    "schema": {"type": "string"}
+                },
+            },
+        }
+    },
+)
+async def import_movies(
+        request: Request,
+        db: AsyncSession = Depends(get_db),
+        cache: CacheInterface = Depends(get_movie_cache),
+        actor_index: PrefixIndex = Depends(get_actor_suggestion_index),
+) -> MovieBulkImportResponseSchema:
+    """
+    Import a batch of movies with a fixed number of queries per chunk.
+
+    Records are validated one by one and de-duplicated on (name, date). Countries,
+    genres, actors and languages of the whole batch are resolved with one bulk
+    get-or-create per kind, then movies and association rows are inserted in chunks.
+
+    :param request: The incoming request carrying a JSON array or NDJSON body.
+    :type request: Request
+    :param db: The SQLAlchemy async database session (provided via dependency injection).
+    :type db: AsyncSession
+    :param cache: The movie response cache, whose list pages are invalidated.
+    :type cache: CacheInterface
+    :param actor_index: The actor name index, updated with the actors of the created movies.
+    :type actor_index: PrefixIndex
+
+    :return: A per-record report of created, duplicate and invalid movies.
+    :rtype: MovieBulkImportResponseSchema
+
+    :raises HTTPException:
+        - 400 if the payload cannot be parsed or violates a database constraint.
+        - 413 if the payload contains too many records or bytes.
+    """
+    records = await _read_bulk_records(request)
+    results: List[MovieBulkImportRowSchema] = []
+
+    candidates: Dict[Tuple[str, object], Tuple[int, MovieCreateSchema]] = {}
+    for index, record in enumerate(records):
+        try:
+            if isinstance(record, bytes):
+                movie_data = MovieCreateSchema.model_validate_json(record)
+            else:
+                movie_data = MovieCreateSchema.model_validate(record)
+        except ValidationError as e:
+            results.append(MovieBulkImportRowSchema(
+                index=index, status=MovieBulkImportStatusEnum.INVALID, detail=_format_validation_error(e)
+            ))
+            continue
+
+        key = (movie_data.name, movie_data.date)
+        if key in candidates:
+            results.append(MovieBulkImportRowSchema(
+                index=index,
+                status=MovieBulkImportStatusEnum.DUPLICATE,
+                detail=f"Duplicate of record {candidates[key][0]}."
+            ))
+            continue
+        candidates[key] = (index, movie_data)
+
+    try:
+        keys = list(candidates)
+        for chunk in chunked(keys):
+            existing = await db.execute(
+                select(MovieModel.name, MovieModel.date)
+                .where(tuple_(MovieModel.name, MovieModel.date).in_(chunk))
+            )
+            for key in existing.tuples():
+                index, _ = candidates.pop(key)
+                results.append(MovieBulkImportRowSchema(
+                    index=index, status=MovieBulkImportStatusEnum.DUPLICATE, detail="Movie already exists."
+                ))
+
+        movies = list(candidates.values())
+        country_ids = await get_or_create_bulk(db, CountryModel, [m.country for _, m in movies], "code")
+        genre_ids = await get_or_create_bulk(db, GenreModel, [g for _, m in movies for g in m.genres], "name")
+        actor_ids = await get_or_create_bulk(db, ActorModel, [a for _, m in movies for a in m.actors], "name")
+        language_ids = await get_or_create_bulk(
+            db, LanguageModel, [lang for _, m in movies for lang in m.languages], "name"
+        )
+
+        movie_ids: Dict[Tuple[str, object], int] = {}
+        for chunk in chunked(movies):
+            stmt = (
+                insert_ignoring_conflicts(db, MovieModel)
+                .values([
+                    {
+                        **movie_data.model_dump(include={
+                            "name", "date", "score", "overview", "status", "budget", "revenue"
+                        }),
+                        "country_id": country_ids[movie_data.country],
+                    }
+                    for _, movie_data in chunk
+                ])
+                .returning(MovieModel.id, MovieModel.name, MovieModel.date)
+            )
+            result = await db.execute(stmt)
+            movie_ids.update(((name, date), movie_id) for movie_id, name, date in result.tuples())
+
+        genre_rows, actor_rows, language_rows = [], [], []
+        actor_deltas: Dict[str, int] = {}
+        stats_entries: List[MovieStatsEntry] = []
+        for index, movie_data in movies:
+            movie_id = movie_ids.get((movie_data.name, movie_data.date))
+            if movie_id is None:
+                results.append(MovieBulkImportRowSchema(
+                    index=index, status=MovieBulkImportStatusEnum.DUPLICATE, detail="Movie already exists."
+                ))
+                continue
+
+            results.append(MovieBulkImportRowSchema(
+                index=index, status=MovieBulkImportStatusEnum.CREATED, id=movie_id
+            ))
+            genre_rows.extend(
+                {"movie_id": movie_id, "genre_id": genre_ids[name]} for name in dict.fromkeys(movie_data.genres)
+            )
+            actor_rows.extend(
+                {"movie_id": movie_id, "actor_id": actor_ids[name]} for name in dict.fromkeys(movie_data.actors)
+            )
+            for name in dict.fromkeys(movie_data.actors):
+                actor_deltas[name] = actor_deltas.get(name, 0) + 1
+            language_rows.extend(
+                {"movie_id": movie_id, "language_id": language_ids[name]}
+                for name in dict.fromkeys(movie_data.languages)
+            )
+            stats_entries.append(MovieStatsEntry.for_movie(
+                movie_data.date,
+                country_ids[movie_data.country],
+                movie_data.country,
+                [(genre_ids[name], name) for name in dict.fromkeys(movie_data.genres)],
+                movie_data.score,
+                movie_data.budget,
+                movie_data.revenue
+            ))
 
-from database import get_db, MovieModel
-from database import (
-    CountryModel,
-    GenreModel,
-    ActorModel,
-    LanguageModel
-)
-from schemas import (
-    MovieListResponseSchema,
-    MovieListItemSchema,
-    MovieDetailSchema
-)
-from schemas.movies import MovieCreateSchema, MovieUpdateSchema
+        await insert_rows(db, MoviesGenresModel, genre_rows)
+        await insert_rows(db, ActorsMoviesModel, actor_rows)
+        await insert_rows(db, MoviesLanguagesModel, language_rows)
+
+        await refresh_movie_facets(
+            db,
+            genre_ids=[row["genre_id"] for row in genre_rows],
+            language_ids=[row["language_id"] for row in language_rows],
+            country_ids=[country_ids[movie_data.country] for _, movie_data in movies],
+        )
+        await apply_movie_stats(db, added=stats_entries)
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Invalid input data.")
 
-router = APIRouter()
+    results.sort(key=lambda row: row.index)
+    created = sum(row.status == MovieBulkImportStatusEnum.CREATED for row in results)
+    movie_count.adjust(created)
+    actor_index.adjust(actor_deltas)
+    if created:
+        await cache.invalidate_tags(MOVIE_LIST_CACHE_TAG)
 
+    return validated_response(MovieBulkImportResponseSchema(
+        created=created,
+        duplicates=sum(row.status == MovieBulkImportStatusEnum.DUPLICATE for row in results),
+        invalid=sum(row.status == MovieBulkImportStatusEnum.INVALID for row in results),
+        results=results,
+    ))
 
-@router.get(
-    "/movies/",
-    response_model=MovieListResponseSchema,
-    summary="Get a paginated list of movies",
+
+async def _bulk_target_ids(db: AsyncSession, selection: MovieBulkSelectionSchema) -> List[int]:
+    """
+    Resolve a bulk selection to the ids of the movies it currently matches.
+    """
+    if selection.ids is not None:
+        ids = list(dict.fromkeys(selection.ids))
+        existing = set()
+        for chunk in chunked(ids):
+            result = await db.execute(select(MovieModel.id).where(MovieModel.id.in_(chunk)))
+            existing.update(result.scalars())
+        return [movie_id for movie_id in ids if movie_id in existing]
+
+    result = await db.execute(
+        select(MovieModel.id).where(*_movie_filter_conditions(selection.filters)).order_by(MovieModel.id)
+    )
+    return list(result.scalars())
+
+
+def _bulk_missing_ids(selection: MovieBulkSelectionSchema, affected_ids) -> List[int]:
+    if selection.ids is None:
+        return []
+    affected_ids = set(affected_ids)
+    return [movie_id for movie_id in dict.fromkeys(selection.ids) if movie_id not in affected_ids]
+
+
+@router.patch(
+    "/movies/bulk/",
+    response_model=MovieBulkWriteResponseSchema,
+    summary="Update many movies at once",
     description=(
-            "<h3>This endpoint retrieves a paginated list of movies from the database. "
-            "Clients can specify the `page` number and the number of items per page using `per_page`. "
-            "The response includes details about the movies, total pages, and total items, "
-            "along with links to the previous and next pages if applicable.</h3>"
+            "<h3>Apply the same changes to a list of movies (`ids`) or to every movie "
+            "matching `filters`.</h3>"
+            "<p>Filters are the same as in the movie list (`year_from`, `status`, `genre`, ...). "
+            "All movies are updated with set-based `UPDATE` statements in one transaction; the "
+            "response reports how many movies were updated and which of the given ids do not "
+            "exist.</p>"
     ),
     responses={
-        404: {
-            "description": "No movies found.",
+        400: {
+            "description": "The changes violate a constraint.",
             "content": {
                 "application/json": {
-                    "example": {"detail": "No movies found."}
+                    "example": {"detail": "Invalid input data."}
                 }
             },
-        }
+        },
     }
 )
-async def get_movie_list(
-        page: int = Query(1, ge=1, description="Page number (1-based index)"),
-        per_page: int = Query(10, ge=1, le=20, description="Number of items per page"),
+async def bulk_update_movies(
+        payload: MovieBulkUpdateSchema,
         db: AsyncSession = Depends(get_db),
-) -> MovieListResponseSchema:
+        cache: CacheInterface = Depends(get_movie_cache),
+) -> MovieBulkWriteResponseSchema:
     """
-    Fetch a paginated list of movies from the database (asynchronously).
+    Update every selected movie with one `UPDATE ... RETURNING` per chunk of ids, or a
+    single one for a filter selection.
 
-    This function retrieves a paginated list of movies, allowing the client to specify
-    the page number and the number of items per page. It calculates the total pages
-    and provides links to the previous and next pages when applicable.
+    If the score, budget, revenue or date change, the selected ids and their previous
+    values are read first so that the stats can be updated with the difference.
 
-    :param page: The page number to retrieve (1-based index, must be >= 1).
-    :type page: int
-    :param per_page: The number of items to display per page (must be between 1 and 20).
-    :type per_page: int
-    :param db: The async SQLAlchemy database session (provided via dependency injection).
+    :param payload: The selection (ids or filters) and the changes to apply.
+    :type payload: MovieBulkUpdateSchema
+    :param db: The SQLAlchemy async database session (provided via dependency injection).
     :type db: AsyncSession
+    :param cache: The movie response cache; the updated movies and all filtered or sorted
+        list pages are invalidated.
+    :type cache: CacheInterface
 
-    :return: A response containing the paginated list of movies and metadata.
-    :rtype: MovieListResponseSchema
+    :return: The number of updated movies and the given ids that were not found.
+    :rtype: MovieBulkWriteResponseSchema
 
-    :raises HTTPException: Raises a 404 error if no movies are found for the requested page.
+    :raises HTTPException: Raises a 400 error if the changes violate a constraint,
+        e.g. renaming several movies with the same date to the same name.
     """
-    offset = (page - 1) * per_page
+    changes = payload.changes.model_dump(exclude_unset=True)
+    stats_changed = bool(changes.keys() & {"date", "score", "budget", "revenue"})
 
-    count_stmt = select(func.count(MovieModel.id))
-    result_count = await db.execute(count_stmt)
-    total_items = result_count.scalar() or 0
+    old_stats: Dict[int, MovieStatsEntry] = {}
+    if stats_changed:
+        target_ids = await _bulk_target_ids(db, payload)
+        old_stats = await load_movie_stats_entries(db, target_ids)
+        conditions = [MovieModel.id.in_(chunk) for chunk in chunked(target_ids)]
+    elif payload.ids is not None:
+        conditions = [MovieModel.id.in_(chunk) for chunk in chunked(list(dict.fromkeys(payload.ids)))]
+    else:
+        conditions = [and_(*_movie_filter_conditions(payload.filters))]
 
-    if not total_items:
-        raise HTTPException(status_code=404, detail="No movies found.")
+    updated = []
+    try:
+        for condition in conditions:
+            result = await db.execute(
+                update(MovieModel)
+                .where(condition)
+                .values(**changes)
+                .returning(MovieModel.id, MovieModel.date, MovieModel.score, MovieModel.budget, MovieModel.revenue)
+                .execution_options(synchronize_session=False)
+            )
+            updated.extend(result.all())
+
+        if stats_changed:
+            await apply_movie_stats(
+                db,
+                added=[
+                    old_stats[row.id]._replace(
+                        year=row.date.year,
+                        score=float(row.score),
+                        budget=float(row.budget),
+                        revenue=float(row.revenue)
+                    )
+                    for row in updated
+                ],
+                removed=[old_stats[row.id] for row in updated],
+            )
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Invalid input data.")
 
-    order_by = MovieModel.default_order_by()
-    stmt = select(MovieModel)
-    if order_by:
-        stmt = stmt.order_by(*order_by)
+    if updated:
+        await cache.invalidate_tags(*(_movie_cache_tag(row.id) for row in updated), MOVIE_QUERY_CACHE_TAG)
 
-    stmt = stmt.offset(offset).limit(per_page)
+    return validated_response(MovieBulkWriteResponseSchema(
+        affected=len(updated),
+        missing_ids=_bulk_missing_ids(payload, (row.id for row in updated)),
+    ))
 
-    result_movies = await db.execute(stmt)
-    movies = result_movies.scalars().all()
 
-    if not movies:
-        raise HTTPException(status_code=404, detail="No movies found.")
+@router.delete(
+    "/movies/bulk/",
+    response_model=MovieBulkWriteResponseSchema,
+    summary="Delete many movies at once",
+    description=(
+            "<h3>Delete a list of movies (`ids`) or every movie matching `filters`.</h3>"
+            "<p>Filters are the same as in the movie list. All movies are deleted with set-based "
+            "`DELETE` statements in one transaction; the response reports how many movies were "
+            "deleted and which of the given ids do not exist.</p>"
+    ),
+)
+async def bulk_delete_movies(
+        payload: MovieBulkDeleteSchema,
+        db: AsyncSession = Depends(get_db),
+        cache: CacheInterface = Depends(get_movie_cache),
+        actor_index: PrefixIndex = Depends(get_actor_suggestion_index),
+) -> MovieBulkWriteResponseSchema:
+    """
+    Delete every selected movie with one `DELETE ... RETURNING id` per chunk of ids.
 
-    movie_list = [MovieListItemSchema.model_validate(movie) for movie in movies]
+    As in the single delete, association rows are removed by `ON DELETE CASCADE`, and
+    the values needed for the facet counts, stats and actor index are read per chunk
+    with grouped queries beforehand.
 
-    total_pages = (total_items + per_page - 1) // per_page
+    :param payload: The selection (ids or filters) of the movies to delete.
+    :type payload: MovieBulkDeleteSchema
+    :param db: The SQLAlchemy async database session (provided via dependency injection).
+    :type db: AsyncSession
+    :param cache: The movie response cache; the deleted movies and the list pages are invalidated.
+    :type cache: CacheInterface
+    :param actor_index: The actor name index, whose counts for the movies' actors are decreased.
+    :type actor_index: PrefixIndex
 
-    response = MovieListResponseSchema(
-        movies=movie_list,
-        prev_page=f"/theater/movies/?page={page - 1}&per_page={per_page}" if page > 1 else None,
-        next_page=f"/theater/movies/?page={page + 1}&per_page={per_page}" if page < total_pages else None,
-        total_pages=total_pages,
-        total_items=total_items,
+    :return: The number of deleted movies and the given ids that were not found.
+    :rtype: MovieBulkWriteResponseSchema
+    """
+    target_ids = await _bulk_target_ids(db, payload)
+    stats_entries = await load_movie_stats_entries(db, target_ids)
+
+    actor_deltas: Dict[str, int] = {}
+    language_ids = set()
+    deleted_ids = []
+    for chunk in chunked(target_ids):
+        actor_counts = await db.execute(
+            select(ActorModel.name, func.count())
+            .join(ActorsMoviesModel, ActorsMoviesModel.c.actor_id == ActorModel.id)
+            .where(ActorsMoviesModel.c.movie_id.in_(chunk))
+            .group_by(ActorModel.name)
+        )
+        for name, count in actor_counts.tuples():
+            actor_deltas[name] = actor_deltas.get(name, 0) - count
+        languages = await db.execute(
+            select(MoviesLanguagesModel.c.language_id.distinct()).where(MoviesLanguagesModel.c.movie_id.in_(chunk))
+        )
+        language_ids.update(languages.scalars())
+
+        result = await db.execute(delete(MovieModel).where(MovieModel.id.in_(chunk)).returning(MovieModel.id))
+        deleted_ids.extend(result.scalars())
+
+    removed = [stats_entries[movie_id] for movie_id in deleted_ids]
+    await refresh_movie_facets(
+        db,
+        [genre_id for entry in removed for genre_id, _ in entry.genres],
+        language_ids,
+        [entry.country_id for entry in removed],
     )
-    return response
+    await apply_movie_stats(db, removed=removed)
+    await db.commit()
 
+    if deleted_ids:
+        movie_count.adjust(-len(deleted_ids))
+        actor_index.adjust(actor_deltas)
+        await cache.invalidate_tags(*(_movie_cache_tag(movie_id) for movie_id in deleted_ids), MOVIE_LIST_CACHE_TAG)
 
-@router.post(
-    "/movies/",
-    response_model=MovieDetailSchema,
-    summary="Add a new movie",
+    return validated_response(MovieBulkWriteResponseSchema(
+        affected=len(deleted_ids),
+        missing_ids=_bulk_missing_ids(payload, deleted_ids),
+    ))
+
+
+def _serialize_export_batch(movies: List[MovieModel], export_format: MovieExportFormatEnum) -> bytes:
+    """
+    Serialize one batch of fully loaded movies as NDJSON lines or CSV rows.
+    """
+    details = [MovieDetailSchema.model_validate(movie) for movie in movies]
+
+    if export_format == MovieExportFormatEnum.NDJSON:
+        return "".join(detail.model_dump_json() + "\n" for detail in details).encode()
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for detail in details:
+        writer.writerow([
+            detail.id,
+            detail.name,
+            detail.date.isoformat(),
+            detail.score,
+            detail.overview,
+            detail.status.value,
+            detail.budget,
+            detail.revenue,
+            detail.country.code,
+            ",".join(genre.name for genre in detail.genres),
+            ",".join(actor.name for actor in detail.actors),
+            ",".join(language.name for language in detail.languages),
+        ])
+    return buffer.getvalue().encode()
+
+
+async def _export_movies(export_format: MovieExportFormatEnum, use_gzip: bool) -> AsyncIterator[bytes]:
+    """
+    Stream the whole catalog in id order, one batch of `EXPORT_BATCH_SIZE` movies at a time.
+
+    Movies are read through a server-side cursor (`stream_scalars` with `yield_per`), and the
+    collections of each batch are loaded with one `IN (...)` query per relationship, so memory
+    use depends on the batch size only. The session is opened here rather than injected,
+    because the response body is produced after the endpoint has returned.
+    """
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16) if use_gzip else None
+
+    def encode(data: bytes) -> bytes:
+        return compressor.compress(data) if compressor else data
+
+    if export_format == MovieExportFormatEnum.CSV:
+        header = io.StringIO()
+        csv.writer(header).writerow(EXPORT_CSV_COLUMNS)
+        yield encode(header.getvalue().encode())
+
+    async with get_db_contextmanager() as db:
+        stmt = (
+            select(MovieModel)
+            .options(*MovieModel.detail_load_options())
+            .order_by(MovieModel.id)
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        result = await db.stream_scalars(stmt)
+        async for movies in result.partitions():
+            chunk = encode(_serialize_export_batch(movies, export_format))
+            if chunk:
+                yield chunk
+            db.expunge_all()
+
+    if compressor:
+        yield compressor.flush()
+
+
+@router.get(
+    "/movies/export/",
+    summary="Export the full movie catalog",
     description=(
-            "<h3>This endpoint allows clients to add a new movie to the database. "
-            "It accepts details such as name, date, genres, actors, languages, and "
-            "other attributes. The associated country, genres, actors, and languages "
-            "will be created or linked automatically.</h3>"
+            "<h3>Stream every movie with its country, genres, actors and languages.</h3>"
+            "<p>`format=ndjson` (default) returns one `MovieDetailSchema` JSON object per line; "
+            "`format=csv` returns a CSV file with a header row, where genres, actors and languages "
+            "are comma-separated lists. The body is gzip-compressed on the fly when the client "
+            "sends `Accept-Encoding: gzip`.</p>"
     ),
+    response_class=StreamingResponse,
     responses={
-        201: {
-            "description": "Movie created successfully.",
-        },
-        400: {
-            "description": "Invalid input.",
+        200: {
+            "description": "The catalog export.",
             "content": {
-                "application/json": {
-                    "example": {"detail": "Invalid input data."}
-                }
+                "application/x-ndjson": {},
+                "text/csv": {},
             },
         }
     },
-    status_code=201
 )
-async def create_movie(
-        movie_data: MovieCreateSchema,
-        db: AsyncSession = Depends(get_db)
-) -> MovieDetailSchema:
+async def export_movies(
+        request: Request,
+        export_format: MovieExportFormatEnum = Query(
+            MovieExportFormatEnum.NDJSON, alias="format", description="Export format: ndjson or csv"
+        ),
+) -> StreamingResponse:
     """
-    Add a new movie to the database.
+    Stream the full movie catalog as NDJSON or CSV.
 
-    This endpoint allows the creation of a new movie with details such as
-    name, release date, genres, actors, and languages. It automatically
-    handles linking or creating related entities.
+    :param request: The incoming request, used to negotiate gzip compression.
+    :type request: Request
+    :param export_format: The output format, `ndjson` or `csv`.
+    :type export_format: MovieExportFormatEnum
 
-    :param movie_data: The data required to create a new movie.
-    :type movie_data: MovieCreateSchema
-    :param db: The SQLAlchemy async database session (provided via dependency injection).
-    :type db: AsyncSession
+    :return: A streaming response with the exported catalog.
+    :rtype: StreamingResponse
+    """
+    use_gzip = "gzip" in request.headers.get("accept-encoding", "").lower()
 
-    :return: The created movie with all details.
-    :rtype: MovieDetailSchema
+    if export_format == MovieExportFormatEnum.CSV:
+        media_type, filename = "text/csv", "movies.csv"
+    else:
+        media_type, filename = "application/x-ndjson", "movies.ndjson"
 
-    :raises HTTPException:
-        - 409 if a movie with the same name and date already exists.
-        - 400 if input data is invalid (e.g., violating a constraint).
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"', "Vary": "Accept-Encoding"}
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+
+    return StreamingResponse(_export_movies(export_format, use_gzip), media_type=media_type, headers=headers)
+
+
+@router.get(
+    "/movies/batch/",
+    response_model=MovieBatchResponseSchema,
+    summary="Get the details of several movies by ID",
+    description=(
+            "<h3>Fetch the details of up to "
+            f"{BATCH_MAX_IDS} movies in one request, e.g. `?ids=3,1,2`.</h3>"
+            "<p>Movies are returned in the requested order, without duplicates; ids that do not "
+            "exist are listed in `missing_ids`. The response takes the same number of queries "
+            "whatever the number of ids. `fields` selects the returned fields as in the "
+            "detail endpoint.</p>"
+    ),
+    responses={
+        400: {
+            "description": "Invalid or too many ids, or unknown fields.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Invalid ids: expected a comma-separated list of integers."}
+                }
+            },
+        },
+    }
+)
+async def get_movies_batch(
+        ids: str = Query(..., description="Comma-separated movie ids, e.g. `3,1,2`"),
+        fields: Optional[str] = Query(
+            None,
+            description="Comma-separated fields to return, e.g. `name,score,genres` (all by default)"
+        ),
+        db: AsyncSession = Depends(get_db),
+) -> MovieBatchResponseSchema:
     """
-    existing_stmt = select(MovieModel).where(
-        (MovieModel.name == movie_data.name),
-        (MovieModel.date == movie_data.date)
-    )
-    existing_result = await db.execute(existing_stmt)
-    existing_movie = existing_result.scalars().first()
+    Retrieve the details of several movies at once.
 
-    if existing_movie:
-        raise HTTPException(
-            status_code=409,
-            detail=(
-                f"A movie with the name '{movie_data.name}' and release date "
-                f"'{movie_data.date}' already exists."
-            )
-        )
+    All movies are read with one `SELECT ... WHERE id IN (...)`, joined with their
+    country, and each collection with one more `SELECT ... IN` query, so the number
+    of queries does not grow with the number of ids.
+
+    :param ids: The comma-separated ids of the movies to retrieve.
+    :type ids: str
+    :param fields: A comma-separated subset of the `MovieDetailSchema` fields to return.
+    :type fields: Optional[str]
+    :param db: The SQLAlchemy database session (provided via dependency injection).
+    :type db: AsyncSession
+
+    :return: The found movies in the requested order and the ids that were not found.
+    :rtype: MovieBatchResponseSchema
 
+    :raises HTTPException: Raises a 400 error if the ids are malformed or too many,
+        or if a field is unknown.
+    """
     try:
-        country_stmt = select(CountryModel).where(CountryModel.code == movie_data.country)
-        country_result = await db.execute(country_stmt)
-        country = country_result.scalars().first()
-        if not country:
-            country = CountryModel(code=movie_data.country)
-            db.add(country)
-            await db.flush()
-
-        genres = []
-        for genre_name in movie_data.genres:
-            genre_stmt = select(GenreModel).where(GenreModel.name == genre_name)
-            genre_result = await db.execute(genre_stmt)
-            genre = genre_result.scalars().first()
-
-            if not genre:
-                genre = GenreModel(name=genre_name)
-                db.add(genre)
-                await db.flush()
-            genres.append(genre)
-
-        actors = []
-        for actor_name in movie_data.actors:
-            actor_stmt = select(ActorModel).where(ActorModel.name == actor_name)
-            actor_result = await db.execute(actor_stmt)
-            actor = actor_result.scalars().first()
-
-            if not actor:
-                actor = ActorModel(name=actor_name)
-                db.add(actor)
-                await db.flush()
-            actors.append(actor)
-
-        languages = []
-        for language_name in movie_data.languages:
-            lang_stmt = select(LanguageModel).where(LanguageModel.name == language_name)
-            lang_result = await db.execute(lang_stmt)
-            language = lang_result.scalars().first()
-
-            if not language:
-                language = LanguageModel(name=language_name)
-                db.add(language)
-                await db.flush()
-            languages.append(language)
+        movie_ids = list(dict.fromkeys(int(value) for value in ids.split(",") if value.strip()))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid ids: expected a comma-separated list of integers.")
+    if not movie_ids:
+        raise HTTPException(status_code=400, detail="Invalid ids: expected a comma-separated list of integers.")
+    if len(movie_ids) > BATCH_MAX_IDS:
+        raise HTTPException(status_code=400, detail=f"Too many ids: at most {BATCH_MAX_IDS} are allowed.")
 
-        movie = MovieModel(
-            name=movie_data.name,
-            date=movie_data.date,
-            score=movie_data.score,
-            overview=movie_data.overview,
-            status=movie_data.status,
-            budget=movie_data.budget,
-            revenue=movie_data.revenue,
-            country=country,
-            genres=genres,
-            actors=actors,
-            languages=languages,
-        )
-        db.add(movie)
-        await db.commit()
-        await db.refresh(movie, ["genres", "actors", "languages"])
+    selected_fields = _parse_fields(fields, MovieDetailSchema)
+    stmt = (
+        select(MovieModel)
+        .options(*MovieModel.detail_load_options(selected_fields))
+        .where(MovieModel.id.in_(movie_ids))
+    )
+    detail_schema = MovieDetailSchema
+    if selected_fields is not None:
+        stmt = stmt.options(*_movie_columns(selected_fields))
+        detail_schema = _partial_schema(MovieDetailSchema, selected_fields)
 
-        return MovieDetailSchema.model_validate(movie)
+    result = await db.execute(stmt)
+    movies = {movie.id: movie for movie in result.unique().scalars()}
 
-    except IntegrityError:
-        await db.rollback()
-        raise HTTPException(status_code=400, detail="Invalid input data.")
+    response_schema = MovieBatchResponseSchema
+    if selected_fields is not None:
+        response_schema = _partial_batch_response_schema(selected_fields)
+    payload = response_schema(
+        movies=[detail_schema.model_validate(movies[movie_id]) for movie_id in movie_ids if movie_id in movies],
+        missing_ids=[movie_id for movie_id in movie_ids if movie_id not in movies],
+    )
+    return validated_response(payload)
 
 
 @router.get(
@@ -244,8 +1969,21 @@ async def create_movie(
             "This endpoint retrieves all available details for the movie, such as "
             "its name, genre, crew, budget, and revenue. If the movie with the given "
             "ID is not found, a 404 error will be returned.</h3>"
+            "<p>Responses carry `ETag` and `Last-Modified` headers; conditional requests with "
+            "`If-None-Match` or `If-Modified-Since` are answered with `304 Not Modified` when the "
+            "movie has not changed.</p>"
+            "<p>`fields` selects the fields to return, e.g. `fields=name,score,genres`; columns and "
+            "relationships that are not requested are not loaded. `id` is always returned.</p>"
     ),
     responses={
+        400: {
+            "description": "Unknown fields.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Unknown fields: title. Allowed fields: name, date, score, ..."}
+                }
+            },
+        },
         404: {
             "description": "Movie not found.",
             "content": {
@@ -257,35 +1995,75 @@ async def create_movie(
     }
 )
 async def get_movie_by_id(
+        request: Request,
         movie_id: int,
+        fields: Optional[str] = Query(
+            None,
+            description="Comma-separated fields to return, e.g. `name,score,genres` (all by default)"
+        ),
         db: AsyncSession = Depends(get_db),
+        cache: CacheInterface = Depends(get_movie_cache),
 ) -> MovieDetailSchema:
     """
     Retrieve detailed information about a specific movie by its ID.
 
     This function fetches detailed information about a movie identified by its unique ID.
-    If the movie does not exist, a 404 error is returned.
+    If the movie does not exist, a 404 error is returned. The serialized detail is served
+    from the cache when present. Conditional requests are checked against the movie's
+    version with a single-row lookup before the relationships are loaded.
+
+    With `fields`, only the requested columns and relationships are loaded and the
+    detail is serialized with a schema derived from `MovieDetailSchema` that holds just
+    these fields. Each field selection is cached and validated separately.
 
+    :param request: The incoming request, used for conditional headers.
+    :type request: Request
     :param movie_id: The unique identifier of the movie to retrieve.
     :type movie_id: int
+    :param fields: A comma-separated subset of the `MovieDetailSchema` fields to return.
+    :type fields: Optional[str]
     :param db: The SQLAlchemy database session (provided via dependency injection).
     :type db: AsyncSession
+    :param cache: The movie response cache (provided via dependency injection).
+    :type cache: CacheInterface
 
     :return: The details of the requested movie.
     :rtype: MovieDetailResponseSchema
 
-    :raises HTTPException: Raises a 404 error if the movie with the given ID is not found.
+    :raises HTTPException: Raises a 400 error if a field is unknown, or a 404 error if
+        the movie with the given ID is not found.
     """
+    selected_fields = _parse_fields(fields, MovieDetailSchema)
+    cache_key = f"movie:{movie_id}"
+    if selected_fields is not None:
+        cache_key = f"{cache_key}:fields={','.join(selected_fields)}"
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        etag, last_modified, payload = _unpack_cached_response(cached)
+        if is_not_modified(request, etag, last_modified):
+            return _not_modified_response(etag, last_modified)
+        return _json_response(payload, etag, last_modified, hit=True)
+
+    if "if-none-match" in request.headers or "if-modified-since" in request.headers:
+        version_result = await db.execute(
+            select(MovieModel.version, MovieModel.updated_at).where(MovieModel.id == movie_id)
+        )
+        version_row = version_result.first()
+        if version_row is not None:
+            etag = _movie_etag(movie_id, version_row.version, selected_fields)
+            last_modified = format_http_date(version_row.updated_at)
+            if is_not_modified(request, etag, last_modified):
+                return _not_modified_response(etag, last_modified)
+
     stmt = (
         select(MovieModel)
-        .options(
-            joinedload(MovieModel.country),
-            joinedload(MovieModel.genres),
-            joinedload(MovieModel.actors),
-            joinedload(MovieModel.languages),
-        )
+        .options(*MovieModel.detail_load_options(selected_fields))
         .where(MovieModel.id == movie_id)
     )
+    detail_schema = MovieDetailSchema
+    if selected_fields is not None:
+        stmt = stmt.options(*_movie_columns(selected_fields, "version", "updated_at"))
+        detail_schema = _partial_schema(MovieDetailSchema, selected_fields)
 
     result = await db.execute(stmt)
     movie = result.scalars().first()
@@ -296,7 +2074,86 @@ async def get_movie_by_id(
             detail="Movie with the given ID was not found."
         )
 
-    return MovieDetailSchema.model_validate(movie)
+    etag = _movie_etag(movie.id, movie.version, selected_fields)
+    last_modified = format_http_date(movie.updated_at)
+    payload = detail_schema.model_validate(movie).model_dump_json().encode()
+    await cache.set(
+        cache_key,
+        _pack_cached_response(etag, last_modified, payload),
+        tags=[_movie_cache_tag(movie_id)]
+    )
+    return _json_response(payload, etag, last_modified, hit=False)
+
+
+def _json_array_agg(db: AsyncSession, *columns):
+    """
+    Aggregate the rows of a subquery into a JSON array, one element (or array of columns) per row.
+    """
+    if db.bind.dialect.name == "postgresql":
+        element = func.json_build_array(*columns) if len(columns) > 1 else columns[0]
+        return func.json_agg(element, type_=JSON)
+    element = func.json_array(*columns) if len(columns) > 1 else columns[0]
+    return func.json_group_array(element, type_=JSON)
+
+
+async def _load_movie_for_delete(
+        db: AsyncSession,
+        movie_id: int
+) -> Optional[Tuple[MovieStatsEntry, List[str], List[int]]]:
+    """
+    Read everything a single movie delete must undo in the derived data with one statement.
+
+    The movie row and its country code are joined with correlated subqueries that aggregate
+    the movie's genres, actor names and language ids into JSON arrays.
+
+    :return: The movie's stats entry, actor names and language ids, or None if the movie does not exist.
+    """
+    genres = (
+        select(_json_array_agg(db, GenreModel.id, GenreModel.name))
+        .join(MoviesGenresModel, MoviesGenresModel.c.genre_id == GenreModel.id)
+        .where(MoviesGenresModel.c.movie_id == MovieModel.id)
+        .scalar_subquery()
+    )
+    actors = (
+        select(_json_array_agg(db, ActorModel.name))
+        .join(ActorsMoviesModel, ActorsMoviesModel.c.actor_id == ActorModel.id)
+        .where(ActorsMoviesModel.c.movie_id == MovieModel.id)
+        .scalar_subquery()
+    )
+    languages = (
+        select(_json_array_agg(db, MoviesLanguagesModel.c.language_id))
+        .where(MoviesLanguagesModel.c.movie_id == MovieModel.id)
+        .scalar_subquery()
+    )
+    result = await db.execute(
+        select(
+            MovieModel.date,
+            MovieModel.country_id,
+            CountryModel.code,
+            MovieModel.score,
+            MovieModel.budget,
+            MovieModel.revenue,
+            genres.label("genres"),
+            actors.label("actors"),
+            languages.label("languages")
+        )
+        .join(CountryModel, CountryModel.id == MovieModel.country_id)
+        .where(MovieModel.id == movie_id)
+    )
+    row = result.first()
+    if row is None:
+        return None
+
+    stats_entry = MovieStatsEntry.for_movie(
+        row.date,
+        row.country_id,
+        row.code,
+        ((genre_id, name) for genre_id, name in row.genres or ()),
+        row.score,
+        row.budget,
+        row.revenue
+    )
+    return stats_entry, list(row.actors or ()), list(row.languages or ())
 
 
 @router.delete(
@@ -325,6 +2182,8 @@ async def get_movie_by_id(
 async def delete_movie(
         movie_id: int,
         db: AsyncSession = Depends(get_db),
+        cache: CacheInterface = Depends(get_movie_cache),
+        actor_index: PrefixIndex = Depends(get_actor_suggestion_index),
 ):
     """
     Delete a specific movie by its ID.
@@ -332,28 +2191,53 @@ async def delete_movie(
     This function deletes a movie identified by its unique ID.
     If the movie does not exist, a 404 error is raised.
 
+    The movie is removed with a single `DELETE ... RETURNING id`; its genre, actor and
+    language associations are removed by the database through `ON DELETE CASCADE`.
+    The values needed to update the facet counts, stats and actor index are read first
+    with a single grouped query.
+
     :param movie_id: The unique identifier of the movie to delete.
     :type movie_id: int
     :param db: The SQLAlchemy database session (provided via dependency injection).
     :type db: AsyncSession
+    :param cache: The movie response cache, whose entries for the movie and list pages are invalidated.
+    :type cache: CacheInterface
+    :param actor_index: The actor name index, whose counts for the movie's actors are decreased.
+    :type actor_index: PrefixIndex
 
     :raises HTTPException: Raises a 404 error if the movie with the given ID is not found.
 
     :return: A response indicating the successful deletion of the movie.
     :rtype: None
     """
-    stmt = select(MovieModel).where(MovieModel.id == movie_id)
-    result = await db.execute(stmt)
-    movie = result.scalars().first()
+    loaded = await _load_movie_for_delete(db, movie_id)
+    if loaded is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Movie with the given ID was not found."
+        )
+    stats_entry, actor_names, language_ids = loaded
+    actor_deltas = {name: -1 for name in actor_names}
 
-    if not movie:
+    result = await db.execute(delete(MovieModel).where(MovieModel.id == movie_id).returning(MovieModel.id))
+    if result.scalar() is None:
+        await db.rollback()
         raise HTTPException(
             status_code=404,
             detail="Movie with the given ID was not found."
         )
 
-    await db.delete(movie)
+    await refresh_movie_facets(
+        db,
+        [genre_id for genre_id, _ in stats_entry.genres],
+        language_ids,
+        [stats_entry.country_id]
+    )
+    await apply_movie_stats(db, removed=[stats_entry])
     await db.commit()
+    movie_count.adjust(-1)
+    actor_index.adjust(actor_deltas)
+    await cache.invalidate_tags(_movie_cache_tag(movie_id), MOVIE_LIST_CACHE_TAG)
 
     return {"detail": "Movie deleted successfully."}
 
@@ -389,6 +2273,8 @@ async def update_movie(
         movie_id: int,
         movie_data: MovieUpdateSchema,
         db: AsyncSession = Depends(get_db),
+        cache: CacheInterface = Depends(get_movie_cache),
+        actor_index: PrefixIndex = Depends(get_actor_suggestion_index),
 ):
     """
     Update a specific movie by its ID.
@@ -396,36 +2282,102 @@ async def update_movie(
     This function updates a movie identified by its unique ID.
     If the movie does not exist, a 404 error is raised.
 
+    The changes are applied with a single `UPDATE ... RETURNING`, which also bumps the
+    movie's version. If the score, budget, revenue, date or genres change, the movie's
+    previous values are read first to update the stats.
+
+    Given genre, actor or language lists replace the current ones: missing names are
+    created in bulk, and each association table is updated with the difference between
+    the current and the new rows, leaving unchanged rows untouched.
+
     :param movie_id: The unique identifier of the movie to update.
     :type movie_id: int
     :param movie_data: The updated data for the movie.
     :type movie_data: MovieUpdateSchema
     :param db: The SQLAlchemy database session (provided via dependency injection).
     :type db: AsyncSession
+    :param cache: The movie response cache; the movie's detail, the list pages containing
+        it and all filtered or sorted list pages are invalidated.
+    :type cache: CacheInterface
+    :param actor_index: The actor name index, updated with added and removed actors.
+    :type actor_index: PrefixIndex
 
     :raises HTTPException: Raises a 404 error if the movie with the given ID is not found.
 
     :return: A response indicating the successful update of the movie.
     :rtype: None
     """
-    stmt = select(MovieModel).where(MovieModel.id == movie_id)
-    result = await db.execute(stmt)
-    movie = result.scalars().first()
+    changes = movie_data.model_dump(exclude_unset=True)
+    relations = {}
+    for name in ("genres", "actors", "languages"):
+        names = changes.pop(name, None)
+        if names is not None:
+            relations[name] = names
 
-    if not movie:
-        raise HTTPException(
-            status_code=404,
-            detail="Movie with the given ID was not found."
-        )
+    old_stats = None
+    if changes.keys() & {"date", "score", "budget", "revenue"} or "genres" in relations:
+        old_stats = (await load_movie_stats_entries(db, [movie_id])).get(movie_id)
 
-    for field, value in movie_data.model_dump(exclude_unset=True).items():
-        setattr(movie, field, value)
+    if changes or relations:
+        stmt = (
+            update(MovieModel)
+            .where(MovieModel.id == movie_id)
+            # Relationship-only changes still bump the version and modification time.
+            .values(**(changes or {"updated_at": func.now()}))
+            .returning(MovieModel.date, MovieModel.score, MovieModel.budget, MovieModel.revenue)
+            .execution_options(synchronize_session=False)
+        )
+    else:
+        stmt = select(MovieModel.date, MovieModel.score, MovieModel.budget, MovieModel.revenue).where(
+            MovieModel.id == movie_id
+        )
 
+    actor_deltas: Dict[str, int] = {}
     try:
+        movie = (await db.execute(stmt)).first()
+        if movie is None:
+            raise HTTPException(
+                status_code=404,
+                detail="Movie with the given ID was not found."
+            )
+
+        touched: Dict[str, set] = {}
+        genre_ids: Dict[str, int] = {}
+        for name, model, table, column in (
+                ("genres", GenreModel, MoviesGenresModel, "genre_id"),
+                ("actors", ActorModel, ActorsMoviesModel, "actor_id"),
+                ("languages", LanguageModel, MoviesLanguagesModel, "language_id"),
+        ):
+            if name not in relations:
+                continue
+            ids = await get_or_create_bulk(db, model, relations[name], "name")
+            if name == "genres":
+                genre_ids = ids
+            added, removed = await sync_associations(db, table, "movie_id", movie_id, column, ids.values())
+            touched[name] = added | removed
+            if name == "actors":
+                actor_deltas.update((actor, 1) for actor, actor_id in ids.items() if actor_id in added)
+                if removed:
+                    removed_names = await db.execute(select(ActorModel.name).where(ActorModel.id.in_(removed)))
+                    actor_deltas.update((actor, -1) for actor in removed_names.scalars())
+
+        await refresh_movie_facets(db, touched.get("genres"), touched.get("languages"))
+        if old_stats is not None:
+            new_stats = old_stats._replace(
+                year=movie.date.year,
+                score=float(movie.score),
+                budget=float(movie.budget),
+                revenue=float(movie.revenue)
+            )
+            if "genres" in relations:
+                new_stats = new_stats._replace(genres=tuple((genre_id, name) for name, genre_id in genre_ids.items()))
+            await apply_movie_stats(db, added=[new_stats], removed=[old_stats])
         await db.commit()
-        await db.refresh(movie)
     except IntegrityError:
         await db.rollback()
         raise HTTPException(status_code=400, detail="Invalid input data.")
 
+    actor_index.adjust(actor_deltas)
+    await cache.invalidate_tags(_movie_cache_tag(movie_id), MOVIE_QUERY_CACHE_TAG)
+
     return {"detail": "Movie updated successfully."}
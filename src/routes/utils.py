@@ -1,8 +1,19 @@
-from fastapi import Depends, HTTPException, status, Request, Security
+import base64
+import binascii
+import json
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Optional
+
+from fastapi import Depends, HTTPException, status, Request, Response, Security
+from fastapi.responses import JSONResponse
 from fastapi.security import HTTPBearer
+from pydantic import BaseModel
+from pydantic_core import to_json
 from security.interfaces import JWTAuthManagerInterface
 from exceptions import BaseSecurityError, TokenExpiredError, InvalidTokenError
-from config import get_jwt_auth_manager
+from caches import AccessTokenCache
+from config import get_jwt_auth_manager, get_access_token_cache
 from security import get_token
 from validation import (
     validate_name,
@@ -18,11 +29,15 @@ bearer_scheme = HTTPBearer(auto_error=False)
 async def get_current_user(
     request: Request,
     jwt_manager: JWTAuthManagerInterface = Depends(get_jwt_auth_manager),
+    token_cache: AccessTokenCache = Depends(get_access_token_cache),
     credentials=Security(bearer_scheme),
 ):
     token = get_token(request)
     try:
-        payload = jwt_manager.decode_access_token(token)
+        payload = token_cache.get(token)
+        if payload is None:
+            payload = jwt_manager.decode_access_token(token)
+            token_cache.set(token, payload)
         user_id = payload.get("user_id")
     except TokenExpiredError as e:
         raise HTTPException(
@@ -65,3 +80,116 @@ async def validate_profile_data(
         raise ValueError("Info field cannot be empty or contain only spaces.")
     if avatar:
         validate_image(avatar)
+
+
+def encode_cursor(values: dict) -> str:
+    """
+    Encode keyset pagination values into an opaque, URL-safe cursor string.
+
+    :param values: The column values of the last row on the current page (e.g. {"id": 42}).
+    :return: A base64url-encoded cursor without padding.
+    """
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+class CursorMismatchError(ValueError):
+    """Raised when a well-formed cursor was issued for another sort order or query."""
+
+    def __init__(self, message="Cursor does not match the requested sort order."):
+        super().__init__(message)
+
+
+def decode_cursor(cursor: str, **scope) -> dict:
+    """
+    Decode a cursor produced by `encode_cursor` back into its pagination values.
+
+    A cursor only identifies a position within one ordering, so issuers store the sort field,
+    direction and, where relevant, the query in it. Passing them as `scope` rejects a cursor
+    replayed against another ordering instead of silently returning the wrong window.
+
+    :param cursor: The opaque cursor string received from the client.
+    :param scope: Values the cursor must carry unchanged, e.g. `sort="score", order="desc"`.
+    :return: The decoded pagination values.
+    :raises ValueError: If the cursor is malformed, is not a JSON object or lacks a scope value.
+    :raises CursorMismatchError: If the cursor was issued for another scope.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError("Invalid cursor.") from e
+
+    if not isinstance(values, dict) or any(key not in values for key in scope):
+        raise ValueError("Invalid cursor.")
+    if any(values[key] != value for key, value in scope.items()):
+        raise CursorMismatchError()
+    return values
+
+
+def format_http_date(value: datetime) -> str:
+    """
+    Format a datetime as an HTTP date (e.g. for the `Last-Modified` header).
+
+    Naive datetimes are treated as UTC, which is how SQLite returns `CURRENT_TIMESTAMP`.
+
+    :param value: The datetime to format.
+    :return: The IMF-fixdate representation in GMT.
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[str] = None) -> bool:
+    """
+    Evaluate the request's conditional headers against the current representation.
+
+    `If-None-Match` takes precedence over `If-Modified-Since`, as required by RFC 9110.
+
+    :param request: The incoming request.
+    :param etag: The strong ETag of the current representation, including quotes.
+    :param last_modified: The HTTP date of the last modification, if known.
+    :return: True if the client's copy is still valid and a 304 response can be sent.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in candidates or etag in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None and last_modified is not None:
+        try:
+            return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+
+    return False
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    A JSON response rendered by pydantic-core's Rust serializer instead of `json.dumps`.
+
+    It accepts the same content as `JSONResponse` (FastAPI passes it the output of
+    `jsonable_encoder`) and produces the same compact JSON.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+def validated_response(schema: BaseModel, status_code: int = 200) -> Response:
+    """
+    Serialize an already validated response schema directly to JSON.
+
+    Returning a `Response` makes FastAPI skip the `response_model` round trip, which
+    dumps the schema to a dict, validates that dict against the response model again
+    and runs it through `jsonable_encoder` before rendering. The route's `response_model`
+    is still used for the OpenAPI schema.
+
+    :param schema: The response schema instance built by the route.
+    :param status_code: The HTTP status code of the response.
+    :return: A JSON response with the serialized schema.
+    """
+    return Response(content=schema.model_dump_json(), status_code=status_code, media_type="application/json")
@@ -3,7 +3,24 @@ from schemas.movies import (
     MovieListResponseSchema,
     MovieListItemSchema,
     MovieCreateSchema,
-    MovieUpdateSchema
+    MovieUpdateSchema,
+    MovieExportFormatEnum,
+    MovieSortFieldEnum,
+    SortOrderEnum,
+    MovieListFilterSchema,
+    MovieBulkImportStatusEnum,
+    MovieBulkImportRowSchema,
+    MovieBulkImportResponseSchema,
+    MovieBulkUpdateSchema,
+    MovieBulkDeleteSchema,
+    MovieBulkWriteResponseSchema,
+    ActorSuggestionSchema,
+    ActorSuggestionListSchema,
+    MovieFacetValueSchema,
+    MovieFacetsResponseSchema,
+    MovieStatsItemSchema,
+    MovieStatsResponseSchema,
+    MovieBatchResponseSchema
 )
 from schemas.accounts import (
     UserRegistrationRequestSchema,
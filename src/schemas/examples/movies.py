@@ -14,6 +14,7 @@ movie_list_response_schema_example = {
     ],
     "prev_page": "/theater/movies/?page=1&per_page=1",
     "next_page": "/theater/movies/?page=3&per_page=1",
+    "next_cursor": "eyJpZCI6OTkzM30",
     "total_pages": 9933,
     "total_items": 9933
 }
@@ -73,4 +74,62 @@ movie_update_schema_example = {
     "status": "Released",
     "budget": 1000000.00,
     "revenue": 5000000.00,
+    "genres": ["Drama", "Thriller"],
+}
+
+movie_bulk_import_response_schema_example = {
+    "created": 1,
+    "duplicates": 1,
+    "invalid": 1,
+    "results": [
+        {"index": 0, "status": "created", "id": 10001, "detail": None},
+        {"index": 1, "status": "duplicate", "id": None, "detail": "Movie already exists."},
+        {"index": 2, "status": "invalid", "id": None, "detail": "score: Input should be less than or equal to 100"}
+    ]
+}
+
+actor_suggestion_list_schema_example = {
+    "suggestions": [
+        {"name": "MichaelB.Jordan", "movie_count": 3},
+        {"name": "MichaelJackson", "movie_count": 1}
+    ]
+}
+
+movie_facets_response_schema_example = {
+    "genres": [{"id": 1, "name": "Drama", "movie_count": 2345}],
+    "languages": [{"id": 1, "name": "English", "movie_count": 5210}],
+    "countries": [{"id": 1, "name": "US", "movie_count": 4312}]
+}
+
+movie_stats_response_schema_example = {
+    "group_by": "year",
+    "items": [
+        {
+            "key": 2022,
+            "label": "2022",
+            "movie_count": 412,
+            "average_score": 68.4,
+            "total_budget": 21350000000.0,
+            "total_revenue": 58710000000.0
+        }
+    ]
+}
+
+movie_batch_response_schema_example = {
+    "movies": [movie_detail_schema_example],
+    "missing_ids": [424242]
+}
+
+movie_bulk_update_schema_example = {
+    "filters": {"status": "Post Production", "date_to": "2024-12-31"},
+    "changes": {"status": "Released"}
+}
+
+movie_bulk_delete_schema_example = {
+    "ids": [101, 102, 424242]
+}
+
+movie_bulk_write_response_schema_example = {
+    "affected": 2,
+    "missing_ids": [424242]
 }
@@ -1,9 +1,11 @@
 from datetime import date, datetime
+from datetime import date as DateType
+from enum import Enum
 from typing import Optional, List
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
-from database.models.movies import MovieStatusEnum
+from database.models.movies import MovieStatusEnum, MovieStatsDimensionEnum
 from schemas.examples.movies import (
     country_schema_example,
     language_schema_example,
@@ -13,7 +15,15 @@ from schemas.examples.movies import (
     movie_list_response_schema_example,
     movie_create_schema_example,
     movie_detail_schema_example,
-    movie_update_schema_example
+    movie_update_schema_example,
+    movie_bulk_import_response_schema_example,
+    actor_suggestion_list_schema_example,
+    movie_facets_response_schema_example,
+    movie_stats_response_schema_example,
+    movie_batch_response_schema_example,
+    movie_bulk_update_schema_example,
+    movie_bulk_delete_schema_example,
+    movie_bulk_write_response_schema_example
 )
 
 
@@ -134,6 +144,7 @@ class MovieListResponseSchema(BaseModel):
     movies: List[MovieListItemSchema]
     prev_page: Optional[str]
     next_page: Optional[str]
+    next_cursor: Optional[str] = None
     total_pages: int
     total_items: int
 
@@ -147,6 +158,50 @@ class MovieListResponseSchema(BaseModel):
     }
 
 
+class MovieSortFieldEnum(str, Enum):
+    ID = "id"
+    SCORE = "score"
+    DATE = "date"
+    REVENUE = "revenue"
+    NAME = "name"
+
+
+class SortOrderEnum(str, Enum):
+    ASC = "asc"
+    DESC = "desc"
+
+
+class MovieListFilterSchema(BaseModel):
+    year_from: Optional[int] = Field(None, ge=1, le=9999)
+    year_to: Optional[int] = Field(None, ge=1, le=9999)
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+    score_min: Optional[float] = Field(None, ge=0, le=100)
+    score_max: Optional[float] = Field(None, ge=0, le=100)
+    status: Optional[MovieStatusEnum] = None
+    country: Optional[str] = Field(None, max_length=3)
+    genre: Optional[str] = Field(None, max_length=255)
+    language: Optional[str] = Field(None, max_length=255)
+
+    @field_validator("country")
+    @classmethod
+    def normalize_country(cls, value: Optional[str]) -> Optional[str]:
+        return value.upper() if value else value
+
+    @field_validator("genre", "language")
+    @classmethod
+    def normalize_names(cls, value: Optional[str]) -> Optional[str]:
+        return value.title() if value else value
+
+    @model_validator(mode="after")
+    def validate_ranges(self):
+        for lower, upper in (("year_from", "year_to"), ("date_from", "date_to"), ("score_min", "score_max")):
+            lower_value, upper_value = getattr(self, lower), getattr(self, upper)
+            if lower_value is not None and upper_value is not None and lower_value > upper_value:
+                raise ValueError(f"'{lower}' cannot be greater than '{upper}'.")
+        return self
+
+
 class MovieCreateSchema(BaseModel):
     name: str
     date: date
@@ -182,12 +237,16 @@ class MovieCreateSchema(BaseModel):
 
 class MovieUpdateSchema(BaseModel):
     name: Optional[str] = None
-    date: Optional[date] = None
+    # A `date` annotation would resolve to the field's own `None` default in the class namespace.
+    date: Optional[DateType] = None
     score: Optional[float] = Field(None, ge=0, le=100)
     overview: Optional[str] = None
     status: Optional[MovieStatusEnum] = None
     budget: Optional[float] = Field(None, ge=0)
     revenue: Optional[float] = Field(None, ge=0)
+    genres: Optional[List[str]] = None
+    actors: Optional[List[str]] = None
+    languages: Optional[List[str]] = None
 
     model_config = {
         "from_attributes": True,
@@ -197,3 +256,173 @@ class MovieUpdateSchema(BaseModel):
             ]
         }
     }
+
+    @field_validator("genres", "actors", "languages", mode="before")
+    @classmethod
+    def normalize_list_fields(cls, value: Optional[List[str]]) -> Optional[List[str]]:
+        return [item.title() for item in value] if value is not None else value
+
+
+class MovieExportFormatEnum(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class MovieBulkImportStatusEnum(str, Enum):
+    CREATED = "created"
+    DUPLICATE = "duplicate"
+    INVALID = "invalid"
+
+
+class MovieBulkImportRowSchema(BaseModel):
+    index: int
+    status: MovieBulkImportStatusEnum
+    id: Optional[int] = None
+    detail: Optional[str] = None
+
+
+class MovieBulkImportResponseSchema(BaseModel):
+    created: int
+    duplicates: int
+    invalid: int
+    results: List[MovieBulkImportRowSchema]
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                movie_bulk_import_response_schema_example
+            ]
+        }
+    }
+
+
+class MovieBulkSelectionSchema(BaseModel):
+    ids: Optional[List[int]] = Field(None, min_length=1, max_length=10000)
+    filters: Optional[MovieListFilterSchema] = None
+
+    @model_validator(mode="after")
+    def validate_selection(self):
+        if (self.ids is None) == (self.filters is None):
+            raise ValueError("Exactly one of 'ids' or 'filters' is required.")
+        if self.filters is not None and not self.filters.model_dump(exclude_none=True):
+            raise ValueError("'filters' must contain at least one filter.")
+        return self
+
+
+class MovieBulkUpdateSchema(MovieBulkSelectionSchema):
+    changes: MovieUpdateSchema
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                movie_bulk_update_schema_example
+            ]
+        }
+    }
+
+    @model_validator(mode="after")
+    def validate_changes(self):
+        if not self.changes.model_fields_set:
+            raise ValueError("'changes' must contain at least one field.")
+        if self.changes.model_fields_set & {"genres", "actors", "languages"}:
+            raise ValueError("Genres, actors and languages cannot be changed in bulk.")
+        return self
+
+
+class MovieBulkDeleteSchema(MovieBulkSelectionSchema):
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                movie_bulk_delete_schema_example
+            ]
+        }
+    }
+
+
+class MovieBulkWriteResponseSchema(BaseModel):
+    affected: int
+    missing_ids: List[int]
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                movie_bulk_write_response_schema_example
+            ]
+        }
+    }
+
+
+class ActorSuggestionSchema(BaseModel):
+    name: str
+    movie_count: int
+
+
+class ActorSuggestionListSchema(BaseModel):
+    suggestions: List[ActorSuggestionSchema]
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                actor_suggestion_list_schema_example
+            ]
+        }
+    }
+
+
+class MovieFacetValueSchema(BaseModel):
+    id: int
+    name: str
+    movie_count: int
+
+    model_config = {
+        "from_attributes": True
+    }
+
+
+class MovieFacetsResponseSchema(BaseModel):
+    genres: List[MovieFacetValueSchema]
+    languages: List[MovieFacetValueSchema]
+    countries: List[MovieFacetValueSchema]
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                movie_facets_response_schema_example
+            ]
+        }
+    }
+
+
+class MovieStatsItemSchema(BaseModel):
+    key: int
+    label: str
+    movie_count: int
+    average_score: float
+    total_budget: float
+    total_revenue: float
+
+
+class MovieStatsResponseSchema(BaseModel):
+    group_by: MovieStatsDimensionEnum
+    items: List[MovieStatsItemSchema]
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                movie_stats_response_schema_example
+            ]
+        }
+    }
+
+
+class MovieBatchResponseSchema(BaseModel):
+    movies: List[MovieDetailSchema]
+    missing_ids: List[int]
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                movie_batch_response_schema_example
+            ]
+        }
+    }
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from datetime import timedelta
-from typing import Optional
+from typing import Optional, Tuple
 
 
 class JWTAuthManagerInterface(ABC):
@@ -50,3 +50,31 @@ class JWTAuthManagerInterface(ABC):
         Verify an access token or raise an error if invalid.
         """
         pass
+
+
+class PasswordHasherInterface(ABC):
+    """
+    Interface for password hashing.
+    Defines coroutines that hash and verify passwords without blocking the event loop.
+    """
+
+    @abstractmethod
+    async def hash(self, password: str) -> str:
+        """
+        Hash a plain-text password.
+        """
+        pass
+
+    @abstractmethod
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """
+        Verify a plain-text password against its hash.
+        """
+        pass
+
+    @abstractmethod
+    async def verify_and_update(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """
+        Verify a plain-text password and return a new hash if the stored one is outdated.
+        """
+        pass
@@ -1,29 +1,121 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, NamedTuple, Optional, Sequence, Tuple, TypeVar
+
 from passlib.context import CryptContext
+from passlib.hash import argon2
+
+from exceptions import PasswordHasherBusyError
+from security.interfaces import PasswordHasherInterface
+
+T = TypeVar("T")
+
+SUPPORTED_PASSWORD_SCHEMES = ("bcrypt", "argon2")
+
+
+def build_password_context(
+        schemes: Sequence[str] = ("bcrypt",),
+        bcrypt_rounds: int = 14,
+        argon2_time_cost: int = 3,
+        argon2_memory_cost: int = 65536,
+        argon2_parallelism: int = 4,
+) -> CryptContext:
+    """
+    Build the password hashing policy.
+
+    New passwords are hashed with the first scheme; the other schemes are only accepted for
+    existing hashes. Any hash made with another scheme or with other cost parameters than the
+    configured ones (higher or lower) is reported by `needs_update`, so it is transparently
+    replaced at the next successful login.
+
+    Args:
+        schemes (Sequence[str]): The accepted schemes, preferred one first.
+        bcrypt_rounds (int): The bcrypt cost factor (log2 of the number of rounds).
+        argon2_time_cost (int): The number of argon2 iterations.
+        argon2_memory_cost (int): The argon2 memory usage in KiB.
+        argon2_parallelism (int): The number of argon2 lanes.
+
+    Returns:
+        CryptContext: The configured passlib context.
+
+    Raises:
+        ValueError: If a scheme is unknown, or argon2 is requested without the `argon2-cffi` package.
+    """
+    unknown = [scheme for scheme in schemes if scheme not in SUPPORTED_PASSWORD_SCHEMES]
+    if not schemes or unknown:
+        raise ValueError(
+            f"Unsupported password schemes: {', '.join(unknown) or 'none given'}. "
+            f"Use {', '.join(SUPPORTED_PASSWORD_SCHEMES)}."
+        )
+    if "argon2" in schemes and not argon2.has_backend():
+        raise ValueError("The argon2 password scheme requires the argon2-cffi package.")
+
+    options = {}
+    if "bcrypt" in schemes:
+        # Equal minimum and maximum rounds flag both cheaper and costlier hashes as outdated.
+        options.update(
+            bcrypt__rounds=bcrypt_rounds,
+            bcrypt__min_rounds=bcrypt_rounds,
+            bcrypt__max_rounds=bcrypt_rounds,
+        )
+    if "argon2" in schemes:
+        options.update(
+            argon2__rounds=argon2_time_cost,
+            argon2__min_rounds=argon2_time_cost,
+            argon2__max_rounds=argon2_time_cost,
+            argon2__memory_cost=argon2_memory_cost,
+            argon2__parallelism=argon2_parallelism,
+        )
+
+    return CryptContext(schemes=list(schemes), deprecated="auto", **options)
+
 
-pwd_context = CryptContext(
-    schemes=["bcrypt"],
-    bcrypt__rounds=14,
-    deprecated="auto"
-)
+# The policy used by the synchronous helpers when no context is passed. The application installs
+# the one built from its settings with `set_default_password_context`, on startup and on reload.
+_default_context = build_password_context()
 
 
-def hash_password(password: str) -> str:
+def set_default_password_context(context: CryptContext) -> None:
+    """
+    Replace the password hashing policy used by `hash_password` and `verify_password` by default.
+
+    Args:
+        context (CryptContext): The new policy, see `build_password_context`.
+    """
+    global _default_context
+    _default_context = context
+
+
+def get_default_password_context() -> CryptContext:
+    """
+    Return the password hashing policy used by `hash_password` and `verify_password` by default.
+
+    Returns:
+        CryptContext: The current default policy.
+    """
+    return _default_context
+
+
+def hash_password(password: str, context: Optional[CryptContext] = None) -> str:
     """
     Hash a plain-text password using the configured password context.
 
-    This function takes a plain-text password and returns its bcrypt hash.
-    The bcrypt algorithm is used with a specified number of rounds for enhanced security.
+    This function takes a plain-text password and returns its hash, made with the context's
+    preferred scheme and cost.
 
     Args:
         password (str): The plain-text password to hash.
+        context (Optional[CryptContext]): The password hashing policy; defaults to the configured one.
 
     Returns:
         str: The resulting hashed password.
     """
-    return pwd_context.hash(password)
+    return (context or _default_context).hash(password)
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+def verify_password(plain_password: str, hashed_password: str, context: Optional[CryptContext] = None) -> bool:
     """
     Verify a plain-text password against its hashed version.
 
@@ -33,8 +125,204 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Args:
         plain_password (str): The plain-text password provided by the user.
         hashed_password (str): The hashed password stored in the database.
+        context (Optional[CryptContext]): The password hashing policy; defaults to the configured one.
 
     Returns:
         bool: True if the password is correct, False otherwise.
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return (context or _default_context).verify(plain_password, hashed_password)
+
+
+class PasswordHashingStats(NamedTuple):
+    """
+    A snapshot of the password hashing queue, e.g. for logging or a metrics exporter.
+    """
+    workers: int
+    max_pending: int
+    in_flight: int
+    queued: int
+    peak_pending: int
+    completed: int
+    rejected: int
+    mean_queue_wait_ms: float
+
+
+class PasswordHashingService(PasswordHasherInterface):
+    """
+    Hash and verify passwords on a bounded thread pool instead of the event loop.
+
+    bcrypt releases the GIL while it works, so up to `max_workers` hashes run in parallel
+    while the event loop keeps serving other requests. At most `max_pending` further calls
+    wait for a free worker; beyond that, calls fail fast with `PasswordHasherBusyError`
+    instead of piling up behind seconds of queued work. The first rejection after the queue
+    fills up logs a warning with the `stats()` snapshot.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int, context: CryptContext):
+        """
+        Initialize the service with its own worker threads.
+
+        Args:
+            max_workers (int): The number of passwords hashed in parallel.
+            max_pending (int): The number of calls allowed to wait for a free worker.
+            context (CryptContext): The passlib context doing the actual hashing.
+        """
+        self._context = context
+        self._max_workers = max_workers
+        self._max_pending = max_pending
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._retired = False
+        self._pending = 0
+        self._peak_pending = 0
+        self._completed = 0
+        self._rejected = 0
+        self._saturated = False
+        self._queue_wait_seconds = 0.0
+
+    def stats(self) -> PasswordHashingStats:
+        """
+        Return the current queue depth and counters.
+
+        Returns:
+            PasswordHashingStats: The snapshot of the queue.
+        """
+        return PasswordHashingStats(
+            workers=self._max_workers,
+            max_pending=self._max_pending,
+            in_flight=min(self._pending, self._max_workers),
+            queued=max(self._pending - self._max_workers, 0),
+            peak_pending=self._peak_pending,
+            completed=self._completed,
+            rejected=self._rejected,
+            mean_queue_wait_ms=self._queue_wait_seconds * 1000 / self._completed if self._completed else 0.0,
+        )
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        if self._pending >= self._max_workers + self._max_pending:
+            self._rejected += 1
+            if not self._saturated:
+                self._saturated = True
+                logging.warning(f"Password hashing queue is full, rejecting calls: {self.stats()}")
+            raise PasswordHasherBusyError()
+
+        submitted_at = time.perf_counter()
+
+        def job():
+            return time.perf_counter(), func(*args)
+
+        # The slot is taken only once the job is accepted, and released when the worker is
+        # done rather than when the caller stops waiting: a cancelled call keeps its thread
+        # busy until the hash finishes. The counters are only touched from the event loop
+        # thread, so they need no lock.
+        loop = self._loop = asyncio.get_running_loop()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="password-hash")
+        future = self._executor.submit(job)
+        self._pending += 1
+        self._peak_pending = max(self._peak_pending, self._pending)
+        future.add_done_callback(lambda _: self._release_threadsafe(loop))
+        started_at, result = await asyncio.wrap_future(future, loop=loop)
+
+        self._completed += 1
+        self._queue_wait_seconds += started_at - submitted_at
+        return result
+
+    def _release(self) -> None:
+        self._pending -= 1
+        if self._saturated and self._pending < self._max_workers + self._max_pending:
+            self._saturated = False
+        self._release_if_idle()
+
+    def _release_if_idle(self) -> None:
+        if self._retired and self._pending == 0:
+            self._release_executor(wait=False)
+
+    def _release_executor(self, wait: bool) -> None:
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _release_threadsafe(self, loop: asyncio.AbstractEventLoop) -> None:
+        try:
+            loop.call_soon_threadsafe(self._release)
+        except RuntimeError:
+            # The loop is already closed, so nothing reads the counters anymore.
+            pass
+
+    async def hash(self, password: str) -> str:
+        """
+        Hash a plain-text password on the worker pool.
+
+        Args:
+            password (str): The plain-text password to hash.
+
+        Returns:
+            str: The resulting hashed password.
+
+        Raises:
+            PasswordHasherBusyError: If the queue is full.
+        """
+        return await self._run(self._context.hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """
+        Verify a plain-text password against its hash on the worker pool.
+
+        Args:
+            password (str): The plain-text password provided by the user.
+            hashed_password (str): The hashed password stored in the database.
+
+        Returns:
+            bool: True if the password is correct, False otherwise.
+
+        Raises:
+            PasswordHasherBusyError: If the queue is full.
+        """
+        return await self._run(self._context.verify, password, hashed_password)
+
+    async def verify_and_update(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """
+        Verify a password and rehash it if its hash does not follow the current policy.
+
+        Args:
+            password (str): The plain-text password provided by the user.
+            hashed_password (str): The hashed password stored in the database.
+
+        Returns:
+            Tuple[bool, Optional[str]]: Whether the password is correct, and the replacement hash
+            if it is correct but was hashed with an outdated scheme or cost.
+
+        Raises:
+            PasswordHasherBusyError: If the queue is full.
+        """
+        return await self._run(self._context.verify_and_update, password, hashed_password)
+
+    def retire(self) -> None:
+        """
+        Release the worker threads once the calls already submitted have finished.
+
+        The service stays usable: callers that still hold it, e.g. a request that resolved
+        its dependencies before a settings reload, get a new worker thread that is released
+        again as soon as their call is done. It may be called from any thread.
+        """
+        self._retired = True
+        if self._loop is None:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._release_if_idle)
+        except RuntimeError:
+            # The loop is already closed, so no call can be running anymore.
+            self._release_executor(wait=False)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the worker threads, e.g. when the application shuts down.
+
+        Later calls are still served, by a worker thread that is released when they finish.
+
+        Args:
+            wait (bool): Whether to wait for running hashes to finish.
+        """
+        self._retired = True
+        self._release_executor(wait=wait)
@@ -24,3 +24,9 @@ class S3StorageInterface(ABC):
         :return: The full URL to access the file.
         """
         pass
+
+    async def close(self) -> None:
+        """
+        Release the connections held by the storage client, e.g. on application shutdown.
+        """
+        pass
@@ -1,4 +1,6 @@
-from typing import Union
+import asyncio
+from contextlib import AsyncExitStack
+from typing import Optional, Union
 
 import aioboto3
 from botocore.exceptions import (
@@ -39,6 +41,34 @@ class S3StorageClient(S3StorageInterface):
             aws_access_key_id=self._access_key,
             aws_secret_access_key=self._secret_key,
         )
+        self._client = None
+        self._client_stack: Optional[AsyncExitStack] = None
+        self._client_lock = asyncio.Lock()
+
+    async def _get_client(self):
+        """
+        Return the shared S3 client, opening it on first use.
+
+        The client keeps its HTTP connection pool between uploads instead of connecting
+        again for every file; `close` releases it.
+        """
+        async with self._client_lock:
+            if self._client is None:
+                stack = AsyncExitStack()
+                self._client = await stack.enter_async_context(
+                    self._session.client("s3", endpoint_url=self._endpoint_url)
+                )
+                self._client_stack = stack
+            return self._client
+
+    async def close(self) -> None:
+        """
+        Close the shared S3 client and its connection pool, if it was opened.
+        """
+        async with self._client_lock:
+            stack, self._client_stack, self._client = self._client_stack, None, None
+            if stack is not None:
+                await stack.aclose()
 
     async def upload_file(self, file_name: str, file_data: Union[bytes, bytearray]) -> None:
         """
@@ -53,15 +83,13 @@ class S3StorageClient(S3StorageInterface):
             S3FileUploadError: If the file upload fails due to a BotoCore error.
         """
         try:
-            async with self._session.client(
-                "s3", endpoint_url=self._endpoint_url
-            ) as client:
-                await client.put_object(
-                    Bucket=self._bucket_name,
-                    Key=file_name,
-                    Body=file_data,
-                    ContentType="image/jpeg"
-                )
+            client = await self._get_client()
+            await client.put_object(
+                Bucket=self._bucket_name,
+                Key=file_name,
+                Body=file_data,
+                ContentType="image/jpeg"
+            )
         except (ConnectionError, HTTPClientError, NoCredentialsError) as e:
             raise S3ConnectionError(f"Failed to connect to S3 storage: {str(e)}") from e
         except BotoCoreError as e:
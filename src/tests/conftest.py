@@ -3,7 +3,15 @@ from httpx import AsyncClient, ASGITransport
 from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from config import get_settings, get_accounts_email_notificator, get_s3_storage_client
+from caches import AccessTokenCache, InMemoryLRUCache, PrefixIndex
+from config import (
+    get_settings,
+    get_accounts_email_notificator,
+    get_s3_storage_client,
+    get_movie_cache,
+    get_actor_suggestion_index,
+    get_access_token_cache
+)
 from database import (
     reset_database,
     get_db_contextmanager,
@@ -88,6 +96,39 @@ async def s3_storage_fake():
     return FakeS3Storage()
 
 
+@pytest_asyncio.fixture(scope="function")
+async def movie_cache(settings):
+    """
+    Provide an empty in-memory movie response cache.
+
+    A fresh cache per test keeps cached responses from leaking between tests,
+    since the database is reset for every test function.
+    """
+    return InMemoryLRUCache(
+        max_entries=settings.MOVIE_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.MOVIE_CACHE_TTL_SECONDS
+    )
+
+
+@pytest_asyncio.fixture(scope="function")
+async def actor_index(settings):
+    """
+    Provide an actor suggestion index that has not been loaded yet.
+
+    Like the movie cache, the index is recreated per test so that it is loaded
+    from the freshly reset database.
+    """
+    return PrefixIndex(ttl_seconds=settings.ACTOR_SUGGEST_REFRESH_SECONDS)
+
+
+@pytest_asyncio.fixture(scope="function")
+async def access_token_cache(settings):
+    """
+    Provide an empty cache of decoded access tokens.
+    """
+    return AccessTokenCache(max_entries=settings.ACCESS_TOKEN_CACHE_MAX_ENTRIES)
+
+
 @pytest_asyncio.fixture(scope="session")
 async def s3_client(settings):
     """
@@ -104,14 +145,18 @@ async def s3_client(settings):
 
 
 @pytest_asyncio.fixture(scope="function")
-async def client(email_sender_stub, s3_storage_fake):
+async def client(email_sender_stub, s3_storage_fake, movie_cache, actor_index, access_token_cache):
     """
     Provide an asynchronous HTTP client for testing.
 
-    Overrides the dependencies for email sender and S3 storage with test doubles.
+    Overrides the dependencies for email sender, S3 storage, the movie cache, the
+    actor suggestion index and the access token cache with test doubles.
     """
     app.dependency_overrides[get_accounts_email_notificator] = lambda: email_sender_stub
     app.dependency_overrides[get_s3_storage_client] = lambda: s3_storage_fake
+    app.dependency_overrides[get_movie_cache] = lambda: movie_cache
+    app.dependency_overrides[get_actor_suggestion_index] = lambda: actor_index
+    app.dependency_overrides[get_access_token_cache] = lambda: access_token_cache
 
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as async_client:
         yield async_client
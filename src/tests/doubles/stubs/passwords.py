@@ -0,0 +1,36 @@
+from typing import Optional, Tuple
+
+from exceptions import PasswordHasherBusyError
+from security.interfaces import PasswordHasherInterface
+
+
+class BusyPasswordHasher(PasswordHasherInterface):
+
+    async def hash(self, password: str) -> str:
+        """
+        Stub implementation of a hasher whose queue is always full.
+
+        Args:
+            password (str): The plain-text password to hash.
+        """
+        raise PasswordHasherBusyError()
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """
+        Stub implementation of a hasher whose queue is always full.
+
+        Args:
+            password (str): The plain-text password provided by the user.
+            hashed_password (str): The hashed password stored in the database.
+        """
+        raise PasswordHasherBusyError()
+
+    async def verify_and_update(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """
+        Stub implementation of a hasher whose queue is always full.
+
+        Args:
+            password (str): The plain-text password provided by the user.
+            hashed_password (str): The hashed password stored in the database.
+        """
+        raise PasswordHasherBusyError()
@@ -6,6 +6,7 @@ from sqlalchemy import select, delete, func
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import joinedload
 
+from config import get_password_hasher
 from database import (
     UserModel,
     ActivationTokenModel,
@@ -14,6 +15,9 @@ from database import (
     UserGroupEnum,
     RefreshTokenModel
 )
+from main import app
+from security.passwords import PasswordHashingService, build_password_context
+from tests.doubles.stubs.passwords import BusyPasswordHasher
 
 
 @pytest.mark.asyncio
@@ -992,3 +996,46 @@ async def test_refresh_access_token_user_not_found(client, db_session, jwt_manag
 
     assert refresh_response.status_code == 404, "Expected status code 404 for non-existent user."
     assert refresh_response.json()["detail"] == "User not found.", "Unexpected error message."
+
+
+@pytest.mark.asyncio
+async def test_login_user_password_hasher_busy(client, db_session, seed_user_groups):
+    """
+    Test that login fails fast with 503 and a Retry-After header when the password hashing queue is full.
+    """
+    user = UserModel.create(email="busy@example.com", raw_password="StrongPassword123!", group_id=1)
+    user.is_active = True
+    db_session.add(user)
+    await db_session.commit()
+
+    app.dependency_overrides[get_password_hasher] = lambda: BusyPasswordHasher()
+
+    login_payload = {"email": "busy@example.com", "password": "StrongPassword123!"}
+    response = await client.post("/api/v1/accounts/login/", json=login_payload)
+
+    assert response.status_code == 503, "Expected status code 503 when the hashing queue is full."
+    assert response.headers["Retry-After"] == "1", "Expected the client to be asked to retry."
+    assert response.json()["detail"] == "Too many password requests. Please try again later."
+
+
+@pytest.mark.asyncio
+async def test_login_user_rehashes_outdated_password_hash(client, db_session, seed_user_groups):
+    """
+    Test that a successful login replaces a password hash made with another cost than the policy.
+    """
+    app.dependency_overrides[get_password_hasher] = lambda: PasswordHashingService(
+        max_workers=1, max_pending=1, context=build_password_context(bcrypt_rounds=5)
+    )
+    user = UserModel(email="rehash@example.com", group_id=1, is_active=True)
+    user._hashed_password = build_password_context(bcrypt_rounds=4).hash("StrongPassword123!")
+    db_session.add(user)
+    await db_session.commit()
+
+    login_payload = {"email": "rehash@example.com", "password": "StrongPassword123!"}
+    response = await client.post("/api/v1/accounts/login/", json=login_payload)
+    assert response.status_code == 201, "Expected status code 201 for successful login."
+
+    await db_session.refresh(user)
+    assert user._hashed_password.startswith("$2b$05$"), "Expected the hash to be upgraded to the policy cost."
+    assert build_password_context(bcrypt_rounds=5).verify("StrongPassword123!", user._hashed_password), \
+        "Expected the upgraded hash to verify the same password."
@@ -1,15 +1,24 @@
+import csv
+import datetime
+import io
+import json
 import random
+from unittest.mock import patch
 
 import pytest
-from sqlalchemy import select, func
+from sqlalchemy import event, func, select
 from sqlalchemy.orm import joinedload
 
 from database import MovieModel
+from database.counts import movie_count
 from database import (
     GenreModel,
     ActorModel,
     LanguageModel,
-    CountryModel
+    CountryModel,
+    MoviesGenresModel,
+    ActorsMoviesModel,
+    MoviesLanguagesModel
 )
 
 
@@ -517,6 +526,26 @@ async def test_update_movie_success(client, db_session, seed_database):
     assert updated_movie.score == update_data["score"], "Movie score was not updated."
 
 
+@pytest.mark.asyncio
+async def test_update_movie_date(client, db_session, seed_database):
+    """
+    Test that PATCH accepts a new release date and stores it.
+    """
+    stmt = select(MovieModel).limit(1)
+    result = await db_session.execute(stmt)
+    movie = result.scalars().first()
+    assert movie is not None, "No movies found in the database to update."
+    movie_id = movie.id
+
+    response = await client.patch(f"/api/v1/theater/movies/{movie_id}/", json={"date": "1999-12-31"})
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+
+    await db_session.rollback()
+
+    result_check = await db_session.execute(select(MovieModel.date).where(MovieModel.id == movie_id))
+    assert result_check.scalar_one() == datetime.date(1999, 12, 31), "Movie date was not updated."
+
+
 @pytest.mark.asyncio
 async def test_update_movie_not_found(client):
     """
@@ -536,3 +565,1217 @@ async def test_update_movie_not_found(client):
     assert response_data["detail"] == expected_detail, (
         f"Expected detail message: {expected_detail}, but got: {response_data['detail']}"
     )
+
+
+@pytest.mark.asyncio
+async def test_get_movies_cursor_pagination_matches_offset(client, db_session, seed_database):
+    """
+    Test that following `next_cursor` walks the same movies, in the same order,
+    as the offset-based `page`/`per_page` traversal.
+    """
+    per_page = 4
+
+    stmt = select(MovieModel.id).order_by(MovieModel.id.desc())
+    result = await db_session.execute(stmt)
+    expected_ids = list(result.scalars().all())
+
+    response = await client.get(f"/api/v1/theater/movies/?page=1&per_page={per_page}")
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    response_data = response.json()
+
+    returned_ids = [movie["id"] for movie in response_data["movies"]]
+    next_cursor = response_data["next_cursor"]
+
+    while next_cursor:
+        response = await client.get(f"/api/v1/theater/movies/?cursor={next_cursor}&per_page={per_page}")
+        assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+        response_data = response.json()
+
+        assert response_data["prev_page"] is None, "Expected prev_page to be None in cursor mode."
+        if response_data["next_cursor"]:
+            assert response_data["next_page"] == (
+                f"/theater/movies/?cursor={response_data['next_cursor']}&per_page={per_page}"
+            ), "Next page link should carry the cursor in cursor mode."
+        else:
+            assert response_data["next_page"] is None, "Expected next_page to be None on the last cursor page."
+
+        returned_ids.extend(movie["id"] for movie in response_data["movies"])
+        next_cursor = response_data["next_cursor"]
+
+    assert returned_ids == expected_ids, (
+        f"Cursor traversal does not match id-desc ordering. Expected: {expected_ids}, got: {returned_ids}"
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "W10", "eyJmb28iOjF9"])
+async def test_get_movies_invalid_cursor(client, seed_database, cursor):
+    """
+    Test that a malformed or foreign cursor is rejected with a 400 error.
+    """
+    response = await client.get(f"/api/v1/theater/movies/?cursor={cursor}")
+    assert response.status_code == 400, f"Expected status code 400, but got {response.status_code}"
+    assert response.json() == {"detail": "Invalid cursor."}
+
+
+@pytest.mark.asyncio
+async def test_get_movies_cached_count_follows_writes(client, db_session, seed_database):
+    """
+    Test that `count_mode=cached` serves the total from memory and that creating
+    and deleting a movie keep the cached total in step with the database.
+    """
+    movie_count.invalidate()
+
+    count_result = await db_session.execute(select(func.count(MovieModel.id)))
+    total_items = count_result.scalar_one()
+
+    response = await client.get("/api/v1/theater/movies/?count_mode=cached")
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    assert response.json()["total_items"] == total_items, "Cached total does not match the database."
+
+    movie_data = {
+        "name": "Cached Count Movie",
+        "date": "2020-01-01",
+        "score": 50.0,
+        "overview": "Counting test.",
+        "status": "Released",
+        "budget": 1000.00,
+        "revenue": 2000.00,
+        "country": "US",
+        "genres": ["Drama"],
+        "actors": ["Count Actor"],
+        "languages": ["English"]
+    }
+    response = await client.post("/api/v1/theater/movies/", json=movie_data)
+    assert response.status_code == 201, f"Expected status code 201, but got {response.status_code}"
+    movie_id = response.json()["id"]
+
+    response = await client.get("/api/v1/theater/movies/?count_mode=cached")
+    assert response.json()["total_items"] == total_items + 1, "Cached total was not adjusted on create."
+
+    response = await client.delete(f"/api/v1/theater/movies/{movie_id}/")
+    assert response.status_code == 204, f"Expected status code 204, but got {response.status_code}"
+
+    response = await client.get("/api/v1/theater/movies/?count_mode=cached")
+    assert response.json()["total_items"] == total_items, "Cached total was not adjusted on delete."
+
+    movie_count.invalidate()
+
+
+@pytest.mark.asyncio
+async def test_get_movies_estimate_count_falls_back_on_sqlite(client, db_session, seed_database):
+    """
+    Test that `count_mode=estimate` falls back to a real count on backends without planner statistics.
+    """
+    movie_count.invalidate()
+
+    count_result = await db_session.execute(select(func.count(MovieModel.id)))
+    total_items = count_result.scalar_one()
+
+    response = await client.get("/api/v1/theater/movies/?count_mode=estimate")
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    assert response.json()["total_items"] == total_items, "Estimated total does not match the database."
+
+    response = await client.get("/api/v1/theater/movies/?count_mode=approximate")
+    assert response.status_code == 422, f"Expected status code 422, but got {response.status_code}"
+
+    movie_count.invalidate()
+
+
+@pytest.mark.asyncio
+async def test_create_movie_reuses_existing_and_deduplicates_related_models(client, db_session):
+    """
+    Test that creating a movie links already existing genres/actors/languages instead of
+    duplicating them, and that repeated names in the payload are linked only once.
+    """
+    base_data = {
+        "date": "2021-05-05",
+        "score": 70.0,
+        "overview": "Shared cast.",
+        "status": "Released",
+        "budget": 1000.00,
+        "revenue": 2000.00,
+        "country": "us",
+        "languages": ["English"]
+    }
+
+    first = await client.post("/api/v1/theater/movies/", json={
+        **base_data,
+        "name": "First Movie",
+        "genres": ["Drama"],
+        "actors": ["Jane Doe"],
+    })
+    assert first.status_code == 201, f"Expected status code 201, but got {first.status_code}"
+
+    second = await client.post("/api/v1/theater/movies/", json={
+        **base_data,
+        "name": "Second Movie",
+        "genres": ["Drama", "drama", "Thriller"],
+        "actors": ["Jane Doe", "John Roe"],
+    })
+    assert second.status_code == 201, f"Expected status code 201, but got {second.status_code}"
+    second_data = second.json()
+
+    assert sorted(genre["name"] for genre in second_data["genres"]) == ["Drama", "Thriller"], (
+        "Duplicated genre names should be linked only once."
+    )
+    assert second_data["country"]["code"] == "US", "Country code should be normalized to upper case."
+    assert second_data["country"]["id"] == first.json()["country"]["id"], "Existing country was not reused."
+
+    first_actor_id = first.json()["actors"][0]["id"]
+    assert first_actor_id in {actor["id"] for actor in second_data["actors"]}, "Existing actor was not reused."
+
+    for model, expected in ((GenreModel, 2), (ActorModel, 2), (LanguageModel, 1), (CountryModel, 1)):
+        result = await db_session.execute(select(func.count(model.id)))
+        assert result.scalar_one() == expected, f"Unexpected number of {model.__tablename__} rows."
+
+
+def _bulk_movie(name, **overrides):
+    movie = {
+        "name": name,
+        "date": "2022-02-02",
+        "score": 60.0,
+        "overview": "Bulk imported.",
+        "status": "Released",
+        "budget": 1000.00,
+        "revenue": 2000.00,
+        "country": "FR",
+        "genres": ["Drama", "Comedy"],
+        "actors": ["Bulk Actor", "Other Actor"],
+        "languages": ["French"]
+    }
+    movie.update(overrides)
+    return movie
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_movies_json_array(client, db_session, seed_database):
+    """
+    Test that a JSON array import creates new movies with their relations, skips duplicates
+    (in the database and within the payload) and reports invalid records by index.
+    """
+    result = await db_session.execute(select(MovieModel).limit(1))
+    existing_movie = result.scalars().first()
+
+    payload = [
+        _bulk_movie("Bulk One"),
+        _bulk_movie("Bulk Two", genres=["Action"], actors=["Bulk Actor"]),
+        _bulk_movie("Bulk One"),
+        _bulk_movie("Bulk Invalid", score=150),
+        _bulk_movie(existing_movie.name, date=existing_movie.date.isoformat()),
+    ]
+
+    response = await client.post("/api/v1/theater/movies/bulk/", json=payload)
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    response_data = response.json()
+
+    assert response_data["created"] == 2, f"Expected 2 created movies, got {response_data['created']}"
+    assert response_data["duplicates"] == 2, f"Expected 2 duplicates, got {response_data['duplicates']}"
+    assert response_data["invalid"] == 1, f"Expected 1 invalid record, got {response_data['invalid']}"
+
+    statuses = [row["status"] for row in response_data["results"]]
+    assert statuses == ["created", "created", "duplicate", "invalid", "duplicate"], f"Unexpected statuses: {statuses}"
+    assert [row["index"] for row in response_data["results"]] == list(range(len(payload)))
+    assert "score" in response_data["results"][3]["detail"], "Invalid record should report the failing field."
+
+    created_id = response_data["results"][1]["id"]
+    detail = await client.get(f"/api/v1/theater/movies/{created_id}/")
+    assert detail.status_code == 200, f"Expected status code 200, but got {detail.status_code}"
+    detail_data = detail.json()
+    assert detail_data["name"] == "Bulk Two"
+    assert [genre["name"] for genre in detail_data["genres"]] == ["Action"]
+    assert [actor["name"] for actor in detail_data["actors"]] == ["Bulk Actor"]
+    assert detail_data["country"]["code"] == "FR"
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_movies_ndjson(client, db_session):
+    """
+    Test that an NDJSON body is imported line by line and that a malformed line
+    is reported as invalid without rejecting the rest of the batch.
+    """
+    lines = [
+        json.dumps(_bulk_movie("Stream One")),
+        "{not json",
+        "",
+        json.dumps(_bulk_movie("Stream Two")),
+    ]
+    response = await client.post(
+        "/api/v1/theater/movies/bulk/",
+        content="\n".join(lines) + "\n",
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    response_data = response.json()
+
+    assert response_data["created"] == 2, f"Expected 2 created movies, got {response_data['created']}"
+    assert response_data["invalid"] == 1, f"Expected 1 invalid record, got {response_data['invalid']}"
+
+    result = await db_session.execute(select(func.count(MovieModel.id)))
+    assert result.scalar_one() == 2, "Expected exactly two movies in the database."
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_movies_splits_streamed_ndjson_chunks(client, db_session):
+    """
+    Test that NDJSON lines split across arbitrary body chunks are reassembled.
+    """
+    body = (json.dumps(_bulk_movie("Chunk One")) + "\n" + json.dumps(_bulk_movie("Chunk Two"))).encode()
+
+    async def chunks():
+        for start in range(0, len(body), 7):
+            yield body[start:start + 7]
+
+    response = await client.post(
+        "/api/v1/theater/movies/bulk/",
+        content=chunks(),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    assert response.json()["created"] == 2, "Expected both streamed lines to be imported."
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("content_type", ["application/json", "application/x-ndjson"])
+async def test_bulk_import_movies_rejects_oversized_body_before_parsing(client, db_session, content_type):
+    """
+    Test that a body over the byte limit is rejected with 413 before it is parsed, whether
+    its size is announced by `Content-Length` or only discovered while streaming.
+    """
+    body = json.dumps([_bulk_movie(f"Large {index}") for index in range(5)]).encode()
+
+    async def chunks():
+        for start in range(0, len(body), 64):
+            yield body[start:start + 64]
+
+    with patch("routes.movies.BULK_IMPORT_MAX_BYTES", 256), patch("routes.movies.json.loads") as loads:
+        for content in (body, chunks()):
+            response = await client.post(
+                "/api/v1/theater/movies/bulk/", content=content, headers={"Content-Type": content_type}
+            )
+            assert response.status_code == 413, f"Expected status code 413, but got {response.status_code}"
+        loads.assert_not_called()
+
+    result = await db_session.execute(select(func.count(MovieModel.id)))
+    assert result.scalar_one() == 0, "Expected nothing to be imported."
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_movies_rejects_non_array(client):
+    """
+    Test that a JSON body that is not an array is rejected with a 400 error.
+    """
+    response = await client.post("/api/v1/theater/movies/bulk/", json=_bulk_movie("Single"))
+    assert response.status_code == 400, f"Expected status code 400, but got {response.status_code}"
+    assert response.json() == {"detail": "Expected a JSON array of movies."}
+
+
+@pytest.mark.asyncio
+async def test_export_movies_ndjson(client, db_session, seed_database):
+    """
+    Test that the NDJSON export streams every movie, in id order, with its relations.
+    """
+    result = await db_session.execute(select(MovieModel.id).order_by(MovieModel.id))
+    expected_ids = list(result.scalars().all())
+
+    response = await client.get("/api/v1/theater/movies/export/", headers={"Accept-Encoding": "identity"})
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert "content-encoding" not in response.headers, "Export must not be compressed without gzip support."
+
+    movies = [json.loads(line) for line in response.text.splitlines()]
+    assert [movie["id"] for movie in movies] == expected_ids, "Export does not contain every movie in id order."
+    assert {"country", "genres", "actors", "languages"} <= set(movies[0]), "Export rows are missing relations."
+
+
+@pytest.mark.asyncio
+async def test_export_movies_csv_gzip(client, db_session, seed_database):
+    """
+    Test that the CSV export has a header row plus one row per movie and is gzip-encoded on request.
+    """
+    result = await db_session.execute(select(func.count(MovieModel.id)))
+    total_movies = result.scalar_one()
+
+    response = await client.get(
+        "/api/v1/theater/movies/export/?format=csv",
+        headers={"Accept-Encoding": "gzip"}
+    )
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    assert response.headers["content-encoding"] == "gzip", "Expected a gzip-encoded export."
+    assert response.headers["content-type"].startswith("text/csv")
+
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0][:3] == ["id", "name", "date"], f"Unexpected CSV header: {rows[0]}"
+    assert len(rows) == total_movies + 1, f"Expected {total_movies} data rows, got {len(rows) - 1}"
+
+
+@pytest.mark.asyncio
+async def test_movie_detail_is_cached_and_invalidated_on_update(client, db_session, seed_database):
+    """
+    Test that movie details are served from the cache and that updating the movie
+    invalidates its detail and the list pages containing it, but not other pages.
+    """
+    result = await db_session.execute(select(MovieModel.id).order_by(MovieModel.id.desc()).limit(1))
+    movie_id = result.scalar_one()
+
+    first = await client.get(f"/api/v1/theater/movies/{movie_id}/")
+    second = await client.get(f"/api/v1/theater/movies/{movie_id}/")
+    assert first.headers["X-Cache"] == "MISS", "Expected the first detail request to miss the cache."
+    assert second.headers["X-Cache"] == "HIT", "Expected the second detail request to hit the cache."
+    assert first.json() == second.json(), "Cached detail differs from the original response."
+
+    await client.get("/api/v1/theater/movies/?page=1&per_page=5")
+    await client.get("/api/v1/theater/movies/?page=2&per_page=5")
+
+    response = await client.patch(f"/api/v1/theater/movies/{movie_id}/", json={"name": "Renamed Movie"})
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+
+    detail = await client.get(f"/api/v1/theater/movies/{movie_id}/")
+    assert detail.headers["X-Cache"] == "MISS", "Expected the updated movie's detail to be invalidated."
+    assert detail.json()["name"] == "Renamed Movie", "Detail still shows the old name."
+
+    page_one = await client.get("/api/v1/theater/movies/?page=1&per_page=5")
+    assert page_one.headers["X-Cache"] == "MISS", "Expected the page containing the movie to be invalidated."
+    assert page_one.json()["movies"][0]["name"] == "Renamed Movie", "List page still shows the old name."
+
+    page_two = await client.get("/api/v1/theater/movies/?page=2&per_page=5")
+    assert page_two.headers["X-Cache"] == "HIT", "Expected an unrelated page to stay cached."
+
+
+@pytest.mark.asyncio
+async def test_movie_list_cache_invalidated_on_create_and_delete(client, db_session, seed_database):
+    """
+    Test that creating or deleting a movie invalidates every cached list page.
+    """
+    before = await client.get("/api/v1/theater/movies/?page=3&per_page=5")
+    total_items = before.json()["total_items"]
+
+    response = await client.post("/api/v1/theater/movies/", json=_bulk_movie("Cache Buster"))
+    assert response.status_code == 201, f"Expected status code 201, but got {response.status_code}"
+    movie_id = response.json()["id"]
+
+    after_create = await client.get("/api/v1/theater/movies/?page=3&per_page=5")
+    assert after_create.headers["X-Cache"] == "MISS", "Expected list pages to be invalidated on create."
+    assert after_create.json()["total_items"] == total_items + 1
+
+    await client.get(f"/api/v1/theater/movies/{movie_id}/")
+    response = await client.delete(f"/api/v1/theater/movies/{movie_id}/")
+    assert response.status_code == 204, f"Expected status code 204, but got {response.status_code}"
+
+    detail = await client.get(f"/api/v1/theater/movies/{movie_id}/")
+    assert detail.status_code == 404, "Deleted movie is still served from the cache."
+
+    after_delete = await client.get("/api/v1/theater/movies/?page=3&per_page=5")
+    assert after_delete.headers["X-Cache"] == "MISS", "Expected list pages to be invalidated on delete."
+    assert after_delete.json()["total_items"] == total_items
+
+
+@pytest.mark.asyncio
+async def test_movie_detail_conditional_requests(client, db_session, seed_database, movie_cache):
+    """
+    Test that the detail endpoint emits an ETag, answers a matching `If-None-Match` with 304
+    (from the cache and from the database) and changes the ETag after an update.
+    """
+    result = await db_session.execute(select(MovieModel.id).limit(1))
+    movie_id = result.scalar_one()
+    url = f"/api/v1/theater/movies/{movie_id}/"
+
+    response = await client.get(url)
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    etag = response.headers["ETag"]
+    assert etag.startswith('"') and not etag.startswith("W/"), f"Expected a strong ETag, got {etag}"
+    assert "Last-Modified" in response.headers, "Expected a Last-Modified header."
+
+    cached = await client.get(url, headers={"If-None-Match": etag})
+    assert cached.status_code == 304, f"Expected status code 304 from the cache, but got {cached.status_code}"
+    assert cached.content == b"", "A 304 response must not have a body."
+    assert cached.headers["ETag"] == etag
+
+    await movie_cache.clear()
+    uncached = await client.get(url, headers={"If-None-Match": f'"other", {etag}'})
+    assert uncached.status_code == 304, f"Expected status code 304 from the database, but got {uncached.status_code}"
+
+    since = await client.get(url, headers={"If-Modified-Since": response.headers["Last-Modified"]})
+    assert since.status_code == 304, f"Expected status code 304 for If-Modified-Since, but got {since.status_code}"
+
+    await client.patch(url, json={"score": 12.5})
+
+    updated = await client.get(url, headers={"If-None-Match": etag})
+    assert updated.status_code == 200, f"Expected status code 200 after an update, but got {updated.status_code}"
+    assert updated.headers["ETag"] != etag, "Expected the ETag to change after an update."
+    assert updated.json()["score"] == 12.5
+
+
+@pytest.mark.asyncio
+async def test_movie_list_conditional_requests(client, db_session, seed_database):
+    """
+    Test that list pages answer a matching `If-None-Match` with 304 and change their ETag
+    when a movie on the page is updated.
+    """
+    url = "/api/v1/theater/movies/?page=1&per_page=5"
+
+    response = await client.get(url)
+    etag = response.headers["ETag"]
+
+    not_modified = await client.get(url, headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304, f"Expected status code 304, but got {not_modified.status_code}"
+
+    movie_id = response.json()["movies"][0]["id"]
+    await client.patch(f"/api/v1/theater/movies/{movie_id}/", json={"overview": "Changed."})
+
+    modified = await client.get(url, headers={"If-None-Match": etag})
+    assert modified.status_code == 200, f"Expected status code 200 after an update, but got {modified.status_code}"
+    assert modified.headers["ETag"] != etag, "Expected the list ETag to change after an update."
+
+
+@pytest.mark.asyncio
+async def test_movie_list_if_modified_since_after_delete(client, db_session, seed_database):
+    """
+    Test that deleting a movie from a list page is not hidden from a client revalidating with
+    `If-Modified-Since`: the page changed although no remaining movie was modified.
+    """
+    url = "/api/v1/theater/movies/?page=1&per_page=5"
+
+    response = await client.get(url)
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    assert "Last-Modified" not in response.headers, "List pages must not send a page-level Last-Modified."
+    page_ids = [movie["id"] for movie in response.json()["movies"]]
+
+    detail = await client.get(f"/api/v1/theater/movies/{page_ids[0]}/")
+    since = detail.headers["Last-Modified"]
+
+    delete_response = await client.delete(f"/api/v1/theater/movies/{page_ids[-1]}/")
+    assert delete_response.status_code == 204, f"Expected status code 204, but got {delete_response.status_code}"
+
+    revalidated = await client.get(url, headers={"If-Modified-Since": since})
+    assert revalidated.status_code == 200, (
+        f"Expected status code 200 after a deletion, but got {revalidated.status_code}"
+    )
+    assert page_ids[-1] not in [movie["id"] for movie in revalidated.json()["movies"]]
+
+    stale = await client.get(url, headers={"If-None-Match": response.headers["ETag"]})
+    assert stale.status_code == 200, "Expected the page ETag to change after a deletion."
+
+
+@pytest.mark.asyncio
+async def test_get_movies_filters_match_database(client, db_session, seed_database):
+    """
+    Test that combined filters return exactly the movies matching them in the database.
+    """
+    stmt = (
+        select(MovieModel.id)
+        .join(MovieModel.genres)
+        .where(
+            GenreModel.name == "Action",
+            MovieModel.score >= 60,
+            MovieModel.date >= datetime.date(2022, 1, 1),
+        )
+        .order_by(MovieModel.id.desc())
+    )
+    result = await db_session.execute(stmt)
+    expected_ids = list(result.scalars().all())
+    assert expected_ids, "Seed data should contain Action movies scored 60+ since 2022."
+
+    url = "/api/v1/theater/movies/?genre=action&score_min=60&year_from=2022&per_page=20"
+    returned_ids = []
+    while url:
+        response = await client.get(url)
+        assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+        response_data = response.json()
+        assert response_data["total_items"] == len(expected_ids), (
+            f"Expected total_items {len(expected_ids)}, got {response_data['total_items']}"
+        )
+        returned_ids.extend(movie["id"] for movie in response_data["movies"])
+        next_page = response_data["next_page"]
+        if next_page:
+            assert "genre=Action" in next_page and "score_min=60.0" in next_page, (
+                f"Expected the filters to be kept in the next page link, got {next_page}"
+            )
+        url = f"/api/v1{next_page}" if next_page else None
+
+    assert returned_ids == expected_ids, f"Expected ids {expected_ids}, got {returned_ids}"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sort_by, order", [("score", "desc"), ("name", "asc"), ("date", "asc"), ("revenue", "desc")])
+async def test_get_movies_sorted_cursor_traversal(client, db_session, seed_database, sort_by, order):
+    """
+    Test that a sorted list walked with `next_cursor` returns every movie once, in sort order,
+    with `id` breaking ties.
+    """
+    column = getattr(MovieModel, sort_by)
+    order_by = [column.desc(), MovieModel.id.desc()] if order == "desc" else [column.asc(), MovieModel.id.asc()]
+    result = await db_session.execute(select(MovieModel.id).order_by(*order_by))
+    expected_ids = list(result.scalars().all())
+
+    response = await client.get(f"/api/v1/theater/movies/?per_page=20&sort_by={sort_by}&order={order}")
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    response_data = response.json()
+    returned_ids = [movie["id"] for movie in response_data["movies"]]
+
+    while response_data["next_cursor"]:
+        response = await client.get(f"/api/v1{response_data['next_page']}")
+        assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+        response_data = response.json()
+        returned_ids.extend(movie["id"] for movie in response_data["movies"])
+
+    assert returned_ids == expected_ids, f"Cursor traversal does not match {sort_by} {order} ordering."
+
+
+@pytest.mark.asyncio
+async def test_get_movies_rejects_invalid_filters_and_foreign_cursor(client, seed_database):
+    """
+    Test that inverted ranges are rejected and that a cursor cannot be reused with another
+    sort field or direction.
+    """
+    response = await client.get("/api/v1/theater/movies/?score_min=80&score_max=20")
+    assert response.status_code == 422, f"Expected status code 422, but got {response.status_code}"
+
+    response = await client.get("/api/v1/theater/movies/?sort_by=score&order=desc&per_page=5")
+    next_cursor = response.json()["next_cursor"]
+
+    response = await client.get(f"/api/v1/theater/movies/?sort_by=score&order=desc&cursor={next_cursor}")
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+
+    for query in ("sort_by=name&order=desc", "sort_by=score&order=asc", "sort_by=id&order=desc"):
+        response = await client.get(f"/api/v1/theater/movies/?{query}&cursor={next_cursor}")
+        assert response.status_code == 400, f"Expected status code 400 for {query}, but got {response.status_code}"
+        assert response.json() == {"detail": "Cursor does not match the requested sort order."}
+
+    response = await client.get("/api/v1/theater/movies/?per_page=5")
+    id_cursor = response.json()["next_cursor"]
+    response = await client.get(f"/api/v1/theater/movies/?order=asc&cursor={id_cursor}")
+    assert response.status_code == 400, "Expected an id-sorted cursor to be rejected for the other direction."
+
+
+@pytest.mark.asyncio
+async def test_search_movies_ranks_and_follows_changes(client, db_session, seed_database):
+    """
+    Test that search matches names and overviews, ranks name matches first,
+    pages with cursors, and reflects updates and deletions.
+    """
+    response = await client.get("/api/v1/theater/movies/search/?q=exorcist&per_page=1")
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    response_data = response.json()
+    assert response_data["total_items"] >= 2, "Expected several movies matching 'exorcist'."
+
+    first = response_data["movies"][0]
+    assert "exorcist" in first["name"].lower(), f"Expected a name match to rank first, got {first['name']}"
+
+    returned_ids = [first["id"]]
+    while response_data["next_cursor"]:
+        response = await client.get(f"/api/v1{response_data['next_page']}")
+        assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+        response_data = response.json()
+        returned_ids.extend(movie["id"] for movie in response_data["movies"])
+
+    assert len(returned_ids) == len(set(returned_ids)), "Cursor pages should not repeat movies."
+
+    stmt = select(func.count(MovieModel.id)).where(
+        MovieModel.name.ilike("%exorcist%") | MovieModel.overview.ilike("%exorcist%")
+    )
+    expected_total = (await db_session.execute(stmt)).scalar_one()
+    assert len(returned_ids) == expected_total, f"Expected {expected_total} matches, got {len(returned_ids)}"
+
+    movie_id = returned_ids[0]
+    await client.patch(f"/api/v1/theater/movies/{movie_id}/", json={"name": "Zzyzx Road Trip"})
+    response = await client.get("/api/v1/theater/movies/search/?q=zzyzx")
+    assert [movie["id"] for movie in response.json()["movies"]] == [movie_id], (
+        "Expected the renamed movie to be found by its new name."
+    )
+
+    await client.delete(f"/api/v1/theater/movies/{movie_id}/")
+    response = await client.get("/api/v1/theater/movies/search/?q=zzyzx")
+    assert response.status_code == 404, f"Expected status code 404 after deletion, but got {response.status_code}"
+
+
+@pytest.mark.asyncio
+async def test_search_movies_requires_query_and_rejects_bad_cursor(client, seed_database):
+    """
+    Test that an empty query is rejected and a malformed cursor returns 400.
+    """
+    response = await client.get("/api/v1/theater/movies/search/")
+    assert response.status_code == 422, f"Expected status code 422, but got {response.status_code}"
+
+    response = await client.get("/api/v1/theater/movies/search/?q=!!!")
+    assert response.status_code == 404, f"Expected status code 404, but got {response.status_code}"
+
+    response = await client.get("/api/v1/theater/movies/search/?q=war&cursor=not-a-cursor")
+    assert response.status_code == 400, f"Expected status code 400, but got {response.status_code}"
+
+    response = await client.get("/api/v1/theater/movies/search/?q=exorcist&per_page=1")
+    next_cursor = response.json()["next_cursor"]
+    response = await client.get(f"/api/v1/theater/movies/search/?q=Exorcist&per_page=1&cursor={next_cursor}")
+    assert response.status_code == 200, "Expected the cursor to be accepted for the same search."
+    response = await client.get(f"/api/v1/theater/movies/search/?q=war&per_page=1&cursor={next_cursor}")
+    assert response.status_code == 400, "Expected a cursor of another search to be rejected."
+    assert response.json() == {"detail": "Cursor does not match the requested sort order."}
+
+
+@pytest.mark.asyncio
+async def test_filtered_list_cache_invalidated_on_update(client, db_session, seed_database):
+    """
+    Test that an update moving a movie into a cached filtered page invalidates that page,
+    even though the page did not contain the movie before.
+    """
+    result = await db_session.execute(select(MovieModel.id).order_by(MovieModel.score.asc()).limit(1))
+    movie_id = result.scalar_one()
+
+    url = "/api/v1/theater/movies/?score_min=80&per_page=20"
+    await client.get(url)
+    cached = await client.get(url)
+    assert cached.headers["X-Cache"] == "HIT", "Expected the filtered page to be cached."
+    assert movie_id not in [movie["id"] for movie in cached.json()["movies"]]
+
+    await client.patch(f"/api/v1/theater/movies/{movie_id}/", json={"score": 95})
+
+    response = await client.get(url)
+    assert response.headers["X-Cache"] == "MISS", "Expected filtered pages to be invalidated by an update."
+    assert movie_id in [movie["id"] for movie in response.json()["movies"]], (
+        "Expected the updated movie to appear in the filtered list."
+    )
+
+
+@pytest.mark.asyncio
+async def test_suggest_actors_matches_database_counts_and_follows_writes(client, db_session, seed_database):
+    """
+    Test that actor suggestions report movie counts from the database and are updated
+    by movie creation and deletion.
+    """
+    stmt = (
+        select(ActorModel.name, func.count(MovieModel.id))
+        .join(ActorModel.movies)
+        .group_by(ActorModel.id, ActorModel.name)
+        .order_by(func.count(MovieModel.id).desc(), ActorModel.name)
+        .limit(1)
+    )
+    name, movie_count_in_db = (await db_session.execute(stmt)).one()
+
+    response = await client.get(f"/api/v1/theater/actors/suggest/?prefix={name[:4]}&limit=50")
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    suggestions = {item["name"]: item["movie_count"] for item in response.json()["suggestions"]}
+    assert suggestions[name] == movie_count_in_db, (
+        f"Expected {name} to have {movie_count_in_db} movies, got {suggestions.get(name)}"
+    )
+
+    movie_data = {
+        "name": "Suggestion Test",
+        "date": "2020-01-01",
+        "score": 50,
+        "overview": "Overview.",
+        "status": "Released",
+        "budget": 1000,
+        "revenue": 2000,
+        "country": "US",
+        "genres": ["Drama"],
+        "actors": [name, "Quorra Quixote"],
+        "languages": ["English"],
+    }
+    response = await client.post("/api/v1/theater/movies/", json=movie_data)
+    assert response.status_code == 201, f"Expected status code 201, but got {response.status_code}"
+    movie_id = response.json()["id"]
+
+    response = await client.get("/api/v1/theater/actors/suggest/?prefix=quix")
+    assert response.json()["suggestions"] == [{"name": "Quorra Quixote", "movie_count": 1}]
+    response = await client.get(f"/api/v1/theater/actors/suggest/?prefix={name}")
+    assert response.json()["suggestions"][0] == {"name": name, "movie_count": movie_count_in_db + 1}
+
+    await client.delete(f"/api/v1/theater/movies/{movie_id}/")
+    response = await client.get("/api/v1/theater/actors/suggest/?prefix=quorra")
+    assert response.json()["suggestions"] == [{"name": "Quorra Quixote", "movie_count": 0}]
+
+
+async def _facet_counts_from_associations(db_session):
+    genres = await db_session.execute(
+        select(GenreModel.id, func.count(MovieModel.id)).join(GenreModel.movies).group_by(GenreModel.id)
+    )
+    countries = await db_session.execute(
+        select(CountryModel.id, func.count(MovieModel.id)).join(CountryModel.movies).group_by(CountryModel.id)
+    )
+    return dict(genres.tuples().all()), dict(countries.tuples().all())
+
+
+@pytest.mark.asyncio
+async def test_movie_facets_follow_create_and_delete(client, db_session, seed_database):
+    """
+    Test that the materialized facet counts match the association tables after seeding,
+    creating and deleting movies.
+    """
+    async def assert_facets_match():
+        response = await client.get("/api/v1/theater/movies/facets/")
+        assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+        data = response.json()
+        expected_genres, expected_countries = await _facet_counts_from_associations(db_session)
+        assert {item["id"]: item["movie_count"] for item in data["genres"]} == expected_genres
+        assert {item["id"]: item["movie_count"] for item in data["countries"]} == expected_countries
+        counts = [item["movie_count"] for item in data["genres"]]
+        assert counts == sorted(counts, reverse=True), "Expected the most common genres first."
+        return data
+
+    await assert_facets_match()
+
+    movie_data = {
+        "name": "Facet Test",
+        "date": "2021-05-05",
+        "score": 70,
+        "overview": "Overview.",
+        "status": "Released",
+        "budget": 1000,
+        "revenue": 2000,
+        "country": "ZZ",
+        "genres": ["Drama", "Brand New Genre"],
+        "actors": ["Someone"],
+        "languages": ["English"],
+    }
+    response = await client.post("/api/v1/theater/movies/", json=movie_data)
+    assert response.status_code == 201, f"Expected status code 201, but got {response.status_code}"
+    data = await assert_facets_match()
+    assert {"name": "ZZ", "movie_count": 1} in [
+        {"name": item["name"], "movie_count": item["movie_count"]} for item in data["countries"]
+    ]
+
+    imported = await client.post(
+        "/api/v1/theater/movies/bulk/", json=[{**movie_data, "name": "Facet Import", "genres": ["Imported Genre"]}]
+    )
+    assert imported.json()["created"] == 1, f"Expected one imported movie, got {imported.json()}"
+    await assert_facets_match()
+
+    await client.delete(f"/api/v1/theater/movies/{response.json()['id']}/")
+    data = await assert_facets_match()
+    assert "Brand New Genre" not in [item["name"] for item in data["genres"]], (
+        "Expected genres without movies to be omitted."
+    )
+
+
+@pytest.mark.asyncio
+async def test_browse_movies_by_genre_and_actor(client, db_session, seed_database):
+    """
+    Test that browse endpoints return every movie of a genre or actor, newest first,
+    and report unknown references with 404.
+    """
+    genre = (await db_session.execute(select(GenreModel).where(GenreModel.name == "Action"))).scalar_one()
+    result = await db_session.execute(
+        select(MovieModel.id).join(MovieModel.genres).where(GenreModel.id == genre.id).order_by(MovieModel.id.desc())
+    )
+    expected_ids = list(result.scalars().all())
+
+    response = await client.get(f"/api/v1/theater/genres/{genre.id}/movies/?per_page=3")
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    response_data = response.json()
+    assert response_data["total_items"] == len(expected_ids)
+    returned_ids = [movie["id"] for movie in response_data["movies"]]
+    while response_data["next_page"]:
+        response_data = (await client.get(f"/api/v1{response_data['next_page']}")).json()
+        returned_ids.extend(movie["id"] for movie in response_data["movies"])
+    assert returned_ids == expected_ids, f"Expected {expected_ids}, got {returned_ids}"
+
+    cursor_page = await client.get(
+        f"/api/v1/theater/genres/{genre.id}/movies/?per_page=3&cursor={response.json()['next_cursor']}"
+    )
+    assert [movie["id"] for movie in cursor_page.json()["movies"]] == expected_ids[3:6]
+
+    actor = (await db_session.execute(select(ActorModel).limit(1))).scalar_one()
+    result = await db_session.execute(
+        select(MovieModel.id).join(MovieModel.actors).where(ActorModel.id == actor.id).order_by(MovieModel.id.desc())
+    )
+    response = await client.get(f"/api/v1/theater/actors/{actor.id}/movies/?per_page=20")
+    assert [movie["id"] for movie in response.json()["movies"]] == list(result.scalars().all())
+
+    response = await client.get("/api/v1/theater/genres/999999/movies/")
+    assert response.status_code == 404, f"Expected status code 404, but got {response.status_code}"
+    assert response.json() == {"detail": "Genre with the given ID was not found."}
+
+
+async def _movie_stats_from_movies(db_session):
+    result = await db_session.execute(
+        select(MovieModel).options(joinedload(MovieModel.country), joinedload(MovieModel.genres))
+    )
+    groups = {"year": {}, "country": {}, "genre": {}}
+    for movie in result.unique().scalars():
+        keys = [("year", movie.date.year), ("country", movie.country.code)]
+        keys.extend(("genre", genre.name) for genre in movie.genres)
+        for dimension, label in keys:
+            count, score, budget, revenue = groups[dimension].get(str(label), (0, 0.0, 0.0, 0.0))
+            groups[dimension][str(label)] = (
+                count + 1, score + movie.score, budget + float(movie.budget), revenue + movie.revenue
+            )
+    return {
+        dimension: {
+            label: (count, round(score / count, 2), round(budget, 2), round(revenue, 2))
+            for label, (count, score, budget, revenue) in items.items()
+        }
+        for dimension, items in groups.items()
+    }
+
+
+@pytest.mark.asyncio
+async def test_movie_stats_follow_writes(client, db_session, seed_database):
+    """
+    Test that the precomputed stats per year, country and genre match the movies after
+    seeding, creating, importing, updating and deleting movies.
+    """
+    async def assert_stats_match():
+        expected = await _movie_stats_from_movies(db_session)
+        for dimension in ("year", "country", "genre"):
+            response = await client.get(f"/api/v1/theater/stats/?group_by={dimension}")
+            assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+            data = response.json()
+            assert data["group_by"] == dimension
+            actual = {
+                item["label"]: (
+                    item["movie_count"], item["average_score"], item["total_budget"], item["total_revenue"]
+                )
+                for item in data["items"]
+            }
+            assert actual.keys() == expected[dimension].keys(), f"Unexpected {dimension} groups."
+            for label, values in expected[dimension].items():
+                assert actual[label][0] == values[0], f"Wrong movie count for {dimension} {label}."
+                assert actual[label][1:] == pytest.approx(values[1:], rel=1e-9, abs=0.01), (
+                    f"Wrong aggregates for {dimension} {label}."
+                )
+        return expected
+
+    expected = await assert_stats_match()
+    years = [int(year) for year in expected["year"]]
+    response = await client.get("/api/v1/theater/stats/")
+    assert [item["key"] for item in response.json()["items"]] == sorted(years), "Expected years in order."
+
+    movie_data = {
+        "name": "Stats Test",
+        "date": "1899-05-05",
+        "score": 70,
+        "overview": "Overview.",
+        "status": "Released",
+        "budget": 1000.5,
+        "revenue": 2000,
+        "country": "ZZ",
+        "genres": ["Drama", "Stats Genre"],
+        "actors": ["Someone"],
+        "languages": ["English"],
+    }
+    created = await client.post("/api/v1/theater/movies/", json=movie_data)
+    assert created.status_code == 201, f"Expected status code 201, but got {created.status_code}"
+    expected = await assert_stats_match()
+    assert expected["year"]["1899"] == (1, 70.0, 1000.5, 2000.0)
+
+    imported = await client.post(
+        "/api/v1/theater/movies/bulk/", json=[{**movie_data, "name": "Stats Import", "score": 30}]
+    )
+    assert imported.json()["created"] == 1, f"Expected one imported movie, got {imported.json()}"
+    await assert_stats_match()
+
+    movie_id = created.json()["id"]
+    response = await client.patch(f"/api/v1/theater/movies/{movie_id}/", json={"date": "1898-01-01", "score": 90})
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    expected = await assert_stats_match()
+    assert expected["year"]["1898"][:2] == (1, 90.0)
+
+    await client.delete(f"/api/v1/theater/movies/{movie_id}/")
+    expected = await assert_stats_match()
+    assert "1898" not in expected["year"], "Expected years without movies to be omitted."
+
+    response = await client.get("/api/v1/theater/stats/?group_by=decade")
+    assert response.status_code == 422, f"Expected status code 422, but got {response.status_code}"
+
+
+@pytest.mark.asyncio
+async def test_sparse_fieldsets_narrow_select_and_output(client, db_session, seed_database):
+    """
+    Test that `fields` limits both the columns read from the database and the serialized
+    movie fields in the list and detail endpoints.
+    """
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = await client.get("/api/v1/theater/movies/?fields=name,score&sort_by=score&per_page=5")
+        assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+        movies_statements = [s for s in statements if "FROM movies" in s and "count(" not in s]
+        assert movies_statements and all("overview" not in s for s in movies_statements), (
+            "Expected the overview column not to be selected."
+        )
+
+        statements.clear()
+        movie_id = response.json()["movies"][0]["id"]
+        detail = await client.get(f"/api/v1/theater/movies/{movie_id}/?fields=score,genres")
+        assert detail.status_code == 200, f"Expected status code 200, but got {detail.status_code}"
+        assert not any("actors" in s or "languages" in s or "countries" in s for s in statements), (
+            "Expected relationships that were not requested not to be loaded."
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    data = response.json()
+    assert all(movie.keys() == {"id", "name", "score"} for movie in data["movies"])
+    scores = [movie["score"] for movie in data["movies"]]
+    assert scores == sorted(scores, reverse=True)
+    assert "fields=id%2Cname%2Cscore" in data["next_page"], "Expected page links to keep the field selection."
+    next_page = await client.get(f"/api/v1/theater/movies/?fields=name,score&sort_by=score&per_page=5"
+                                 f"&cursor={data['next_cursor']}")
+    assert next_page.status_code == 200, f"Expected status code 200, but got {next_page.status_code}"
+
+    stmt = select(MovieModel).options(joinedload(MovieModel.genres)).where(MovieModel.id == movie_id)
+    movie = (await db_session.execute(stmt)).unique().scalar_one()
+    detail_data = detail.json()
+    assert detail_data.keys() == {"id", "score", "genres"}
+    assert detail_data["score"] == movie.score
+    assert sorted(genre["id"] for genre in detail_data["genres"]) == sorted(genre.id for genre in movie.genres)
+
+    full = await client.get(f"/api/v1/theater/movies/{movie_id}/")
+    assert "overview" in full.json() and "actors" in full.json()
+    assert full.headers["ETag"] != detail.headers["ETag"], "Expected field selections to have their own ETag."
+    cached = await client.get(f"/api/v1/theater/movies/{movie_id}/?fields=genres,score")
+    assert cached.headers["X-Cache"] == "HIT" and cached.json() == detail.json()
+
+    response = await client.get("/api/v1/theater/movies/?fields=name,title")
+    assert response.status_code == 400, f"Expected status code 400, but got {response.status_code}"
+    assert response.json()["detail"].startswith("Unknown fields: title.")
+
+
+@pytest.mark.asyncio
+async def test_get_movies_batch_preserves_order_and_reports_missing(client, db_session, seed_database):
+    """
+    Test that the batch endpoint returns details in the requested order, reports missing
+    ids and uses the same number of queries for any number of ids.
+    """
+    result = await db_session.execute(select(MovieModel.id).order_by(MovieModel.id))
+    all_ids = list(result.scalars().all())
+    requested = [all_ids[5], 999999, all_ids[0], all_ids[5], all_ids[3]]
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = await client.get(f"/api/v1/theater/movies/batch/?ids={','.join(map(str, requested))}")
+        few_queries = len(statements)
+        statements.clear()
+        many = await client.get(f"/api/v1/theater/movies/batch/?ids={','.join(map(str, all_ids))}")
+        assert len(statements) == few_queries, "Expected a fixed number of queries per batch."
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    data = response.json()
+    assert [movie["id"] for movie in data["movies"]] == [all_ids[5], all_ids[0], all_ids[3]]
+    assert data["missing_ids"] == [999999]
+    assert [movie["id"] for movie in many.json()["movies"]] == all_ids
+
+    single = await client.get(f"/api/v1/theater/movies/{all_ids[0]}/")
+    assert data["movies"][1] == single.json(), "Expected batch items to match the detail endpoint."
+
+    narrowed = await client.get(f"/api/v1/theater/movies/batch/?ids={all_ids[0]}&fields=name")
+    assert narrowed.json()["movies"] == [{"id": all_ids[0], "name": single.json()["name"]}]
+
+    for ids in ("1,abc", ",", ",".join(str(i) for i in range(1, 502))):
+        response = await client.get(f"/api/v1/theater/movies/batch/?ids={ids}")
+        assert response.status_code == 400, f"Expected status code 400 for {ids[:20]}, got {response.status_code}"
+
+
+@pytest.mark.asyncio
+async def test_delete_and_update_movie_use_single_statements(client, db_session, seed_database):
+    """
+    Test that deleting a movie cascades to its association rows after a single grouped
+    read and that updating a movie bumps its version, each with one write statement on
+    the movies table.
+    """
+    movie_id = (await db_session.execute(select(MovieModel.id).limit(1))).scalar_one()
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = await client.patch(f"/api/v1/theater/movies/{movie_id}/", json={"status": "Post Production"})
+        assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+        update_writes = [s for s in statements if s.lstrip().startswith(("UPDATE movies", "SELECT"))]
+        assert len(update_writes) == 1 and "RETURNING" in update_writes[0]
+
+        statements.clear()
+        response = await client.delete(f"/api/v1/theater/movies/{movie_id}/")
+        assert response.status_code == 204, f"Expected status code 204, but got {response.status_code}"
+        deletes = [s for s in statements if s.lstrip().startswith("DELETE")]
+        assert deletes[0].startswith("DELETE FROM movies ") and "RETURNING" in deletes[0]
+        pre_reads = statements[:statements.index(deletes[0])]
+        assert len(pre_reads) == 1, (
+            f"Expected one grouped read before the delete, but got {len(pre_reads)} statements."
+        )
+        assert not any("movies_genres" in s or "actors_movies" in s for s in deletes), (
+            "Expected association rows to be removed by the database cascade."
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    for table in (MoviesGenresModel, ActorsMoviesModel, MoviesLanguagesModel):
+        remaining = await db_session.execute(
+            select(func.count()).select_from(table).where(table.c.movie_id == movie_id)
+        )
+        assert remaining.scalar_one() == 0, f"Expected no {table.name} rows for the deleted movie."
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_movies_by_filter_and_ids(client, db_session, seed_database):
+    """
+    Test that bulk updates apply the changes to every selected movie in one transaction,
+    report the affected count and missing ids, and keep the stats in sync.
+    """
+    result = await db_session.execute(select(MovieModel.id).where(MovieModel.score >= 70))
+    matching_ids = set(result.scalars().all())
+    assert matching_ids, "Expected seeded movies with a score of at least 70."
+
+    response = await client.patch(
+        "/api/v1/theater/movies/bulk/",
+        json={"filters": {"score_min": 70}, "changes": {"status": "Post Production"}},
+    )
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    assert response.json() == {"affected": len(matching_ids), "missing_ids": []}
+
+    db_session.expire_all()
+    result = await db_session.execute(select(MovieModel.id).where(MovieModel.status == "Post Production"))
+    assert set(result.scalars().all()) == matching_ids
+
+    some_ids = sorted(matching_ids)[:2]
+    response = await client.patch(
+        "/api/v1/theater/movies/bulk/",
+        json={"ids": [*some_ids, 999999], "changes": {"score": 12.5, "date": "1890-01-01"}},
+    )
+    assert response.json() == {"affected": 2, "missing_ids": [999999]}
+    stats = await client.get("/api/v1/theater/stats/?group_by=year")
+    assert {"key": 1890, "movie_count": 2, "average_score": 12.5} in [
+        {key: item[key] for key in ("key", "movie_count", "average_score")} for item in stats.json()["items"]
+    ]
+
+    response = await client.patch(
+        "/api/v1/theater/movies/bulk/", json={"ids": some_ids, "changes": {"name": "Same Name"}}
+    )
+    assert response.status_code == 400, "Expected a unique constraint violation to roll back the batch."
+    result = await db_session.execute(select(func.count()).where(MovieModel.name == "Same Name"))
+    assert result.scalar_one() == 0
+
+    for payload in (
+            {"changes": {"status": "Released"}},
+            {"ids": [1], "filters": {"status": "Released"}, "changes": {"status": "Released"}},
+            {"filters": {}, "changes": {"status": "Released"}},
+            {"ids": [1], "changes": {}},
+    ):
+        response = await client.patch("/api/v1/theater/movies/bulk/", json=payload)
+        assert response.status_code == 422, f"Expected status code 422 for {payload}, got {response.status_code}"
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_movies_updates_derived_data(client, db_session, seed_database):
+    """
+    Test that bulk deletes remove every selected movie and its associations and keep the
+    movie count, facet counts and stats in sync.
+    """
+    result = await db_session.execute(select(MovieModel.id).order_by(MovieModel.id).limit(3))
+    ids = list(result.scalars().all())
+    total_before = (await db_session.execute(select(func.count()).select_from(MovieModel))).scalar_one()
+    movie_count.invalidate()
+    await client.get("/api/v1/theater/movies/?count_mode=cached")
+
+    response = await client.request("DELETE", "/api/v1/theater/movies/bulk/", json={"ids": [*ids, 999999]})
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    assert response.json() == {"affected": 3, "missing_ids": [999999]}
+
+    remaining = await db_session.execute(select(func.count()).select_from(MovieModel))
+    assert remaining.scalar_one() == total_before - 3
+    associations = await db_session.execute(
+        select(func.count()).select_from(ActorsMoviesModel).where(ActorsMoviesModel.c.movie_id.in_(ids))
+    )
+    assert associations.scalar_one() == 0
+
+    response = await client.get("/api/v1/theater/movies/?count_mode=cached")
+    assert response.json()["total_items"] == total_before - 3, "Expected the cached movie count to be adjusted."
+
+    status = (await db_session.execute(select(MovieModel.status).limit(1))).scalar_one()
+    response = await client.request(
+        "DELETE", "/api/v1/theater/movies/bulk/", json={"filters": {"status": status.value}}
+    )
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    result = await db_session.execute(select(func.count()).where(MovieModel.status == status))
+    assert result.scalar_one() == 0
+
+    expected_genres, expected_countries = await _facet_counts_from_associations(db_session)
+    facets = (await client.get("/api/v1/theater/movies/facets/")).json()
+    assert {item["id"]: item["movie_count"] for item in facets["genres"]} == expected_genres
+    assert {item["id"]: item["movie_count"] for item in facets["countries"]} == expected_countries
+    stats = (await client.get("/api/v1/theater/stats/?group_by=country")).json()
+    assert sum(item["movie_count"] for item in stats["items"]) == sum(expected_countries.values())
+
+
+@pytest.mark.asyncio
+async def test_update_movie_relationships_applies_diff(client, db_session, seed_database):
+    """
+    Test that PATCH replaces genres, actors and languages by inserting only the added
+    associations and deleting only the removed ones, and keeps derived data in sync.
+    """
+    stmt = select(MovieModel).options(joinedload(MovieModel.genres)).where(MovieModel.id.in_(
+        select(MoviesGenresModel.c.movie_id)
+        .group_by(MoviesGenresModel.c.movie_id)
+        .having(func.count() >= 2)
+    )).limit(1)
+    movie = (await db_session.execute(stmt)).unique().scalar_one()
+    kept, dropped = movie.genres[0], movie.genres[1:]
+    before = await client.get(f"/api/v1/theater/movies/{movie.id}/")
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = await client.patch(
+            f"/api/v1/theater/movies/{movie.id}/",
+            json={"genres": [kept.name, "diff genre"], "actors": ["Diff Actor"], "languages": []},
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+
+    genre_writes = [
+        (statement, parameters) for statement, parameters in statements
+        if statement.startswith(("INSERT INTO movies_genres ", "DELETE FROM movies_genres "))
+    ]
+    assert len(genre_writes) == 2, f"Expected one insert and one delete, got {genre_writes}"
+    assert all(kept.id not in parameters[1:] for _, parameters in genre_writes), (
+        "Expected the unchanged association row to be left alone."
+    )
+
+    detail = await client.get(f"/api/v1/theater/movies/{movie.id}/")
+    data = detail.json()
+    assert sorted(genre["name"] for genre in data["genres"]) == sorted([kept.name, "Diff Genre"])
+    assert [actor["name"] for actor in data["actors"]] == ["Diff Actor"]
+    assert data["languages"] == []
+    assert detail.headers["ETag"] != before.headers["ETag"], "Expected the version to be bumped."
+
+    facets = (await client.get("/api/v1/theater/movies/facets/")).json()
+    expected_genres, _ = await _facet_counts_from_associations(db_session)
+    assert {item["id"]: item["movie_count"] for item in facets["genres"]} == expected_genres
+
+    stats = (await client.get("/api/v1/theater/stats/?group_by=genre")).json()
+    db_session.expire_all()
+    expected_stats = await _movie_stats_from_movies(db_session)
+    assert {item["label"]: item["movie_count"] for item in stats["items"]} == {
+        label: values[0] for label, values in expected_stats["genre"].items()
+    }
+
+    suggestions = await client.get("/api/v1/theater/actors/suggest/?prefix=diff")
+    assert suggestions.json()["suggestions"] == [{"name": "Diff Actor", "movie_count": 1}]
+
+    response = await client.patch(
+        "/api/v1/theater/movies/bulk/", json={"ids": [movie.id], "changes": {"genres": ["Drama"]}}
+    )
+    assert response.status_code == 422, f"Expected status code 422, but got {response.status_code}"
+    assert dropped, "Expected the movie to have lost at least one genre."
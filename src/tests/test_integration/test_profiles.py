@@ -6,8 +6,10 @@ from io import BytesIO
 from PIL import Image
 from sqlalchemy import select, func
 
+from config import get_access_token_cache, reload_settings
 from database import UserModel, UserProfileModel
 from exceptions import S3FileUploadError
+from main import app
 
 
 @pytest.mark.asyncio
@@ -633,3 +635,39 @@ async def test_profile_creation_empty_info(client, jwt_manager, info_value):
     assert response.status_code == 422, f"Expected 422, got {response.status_code}"
     assert "Info field cannot be empty or contain only spaces." in str(response.json()), \
         f"Unexpected error message: {response.json()}"
+
+
+@pytest.mark.asyncio
+async def test_rotated_access_secret_rejects_cached_token(client, jwt_manager, monkeypatch):
+    """
+    Test that a token signed with the previous access secret is rejected once the secret is
+    rotated and the settings are reloaded, even though it was verified and cached before.
+
+    Steps:
+    1. Authenticate with a token for a user that does not exist, so that the request passes the
+       token check and fails on the user lookup.
+    2. Rotate `SECRET_KEY_ACCESS` and reload the settings.
+    3. Verify that the same token now fails the token check itself.
+    """
+    app.dependency_overrides.pop(get_access_token_cache)
+    access_token = jwt_manager.create_access_token({"user_id": 999999})
+    profile_url = "/api/v1/profiles/users/999999/profile/"
+    headers = {"Authorization": f"Bearer {access_token}"}
+    files = {"first_name": (None, "John")}
+
+    response = await client.post(profile_url, headers=headers, files=files)
+    assert response.status_code == 401, f"Expected 401, got {response.status_code}"
+    assert response.json()["detail"] == "User not found or not active.", "Expected the token to be accepted."
+
+    monkeypatch.setenv("SECRET_KEY_ACCESS", "ROTATED_SECRET_KEY_ACCESS")
+    try:
+        reload_settings()
+        response = await client.post(profile_url, headers=headers, files=files)
+    finally:
+        monkeypatch.undo()
+        reload_settings()
+
+    assert response.status_code == 401, f"Expected 401, got {response.status_code}"
+    assert response.json()["detail"] == "Invalid token.", (
+        f"Expected the token signed with the previous secret to be rejected, got: {response.json()['detail']}"
+    )
@@ -0,0 +1,150 @@
+import time
+
+import pytest
+
+from caches import AccessTokenCache, InMemoryLRUCache, PrefixIndex
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_in_memory_cache_evicts_least_recently_used():
+    """
+    Test that the cache evicts the least recently used entry once it is full.
+    """
+    cache = InMemoryLRUCache(max_entries=2, ttl_seconds=60)
+
+    await cache.set("a", b"1")
+    await cache.set("b", b"2")
+    assert await cache.get("a") == b"1", "Expected 'a' to be cached."
+
+    await cache.set("c", b"3")
+
+    assert await cache.get("b") is None, "Expected the least recently used entry 'b' to be evicted."
+    assert await cache.get("a") == b"1", "Expected recently used entry 'a' to survive eviction."
+    assert await cache.get("c") == b"3", "Expected the newest entry 'c' to be cached."
+    assert len(cache) == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_in_memory_cache_expires_entries():
+    """
+    Test that entries are not returned once their time to live has passed.
+    """
+    cache = InMemoryLRUCache(max_entries=10, ttl_seconds=0)
+
+    await cache.set("a", b"1")
+
+    assert await cache.get("a") is None, "Expected an expired entry to be dropped."
+    assert len(cache) == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_in_memory_cache_invalidates_by_tag():
+    """
+    Test that invalidating a tag drops exactly the entries registered under it.
+    """
+    cache = InMemoryLRUCache(max_entries=10, ttl_seconds=60)
+
+    await cache.set("movie:1", b"detail-1", tags=["movie:1"])
+    await cache.set("page:1", b"page-1", tags=["list", "movie:1", "movie:2"])
+    await cache.set("page:2", b"page-2", tags=["list", "movie:3"])
+
+    await cache.invalidate_tags("movie:1")
+
+    assert await cache.get("movie:1") is None, "Expected the tagged detail to be invalidated."
+    assert await cache.get("page:1") is None, "Expected the page containing movie 1 to be invalidated."
+    assert await cache.get("page:2") == b"page-2", "Expected unrelated pages to stay cached."
+
+    await cache.invalidate_tags("list")
+    assert await cache.get("page:2") is None, "Expected all list pages to be invalidated."
+
+
+@pytest.mark.unit
+def test_prefix_index_matches_word_starts_and_ranks_by_score():
+    """
+    Test that names are found by any word start, ignoring case and punctuation,
+    and that matches are ranked by score, then by name.
+    """
+    index = PrefixIndex(ttl_seconds=60)
+    index.replace({"MichaelB.Jordan": 3, "MichaelJackson": 5, "JordanPeele": 3, "Zendaya": 1})
+
+    assert index.suggest("jord", 10) == [("JordanPeele", 3), ("MichaelB.Jordan", 3)]
+    assert index.suggest("Michael B.", 10) == [("MichaelB.Jordan", 3)]
+    assert index.suggest("michael", 1) == [("MichaelJackson", 5)]
+    assert index.suggest("xyz", 10) == []
+    assert index.suggest("...", 10) == []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_prefix_index_refreshes_once_and_adjusts_in_place():
+    """
+    Test that a stale index is loaded once and that adjustments add names and shift scores.
+    """
+    index = PrefixIndex(ttl_seconds=60)
+    loads = []
+
+    async def load():
+        loads.append(1)
+        return {"Zendaya": 1}
+
+    index.adjust({"Ignored": 1})
+    assert index.is_stale, "Expected a new index to be stale."
+
+    await index.refresh(load)
+    await index.refresh(load)
+    assert len(loads) == 1, "Expected a fresh index not to be reloaded."
+
+    assert index.suggest("z", 10) == [("Zendaya", 1)]
+
+    index.adjust({"Zendaya": 1, "ZacEfron": 1})
+    assert index.suggest("z", 10) == [("Zendaya", 2), ("ZacEfron", 1)], (
+        "Expected memoized short-prefix results to follow adjustments."
+    )
+    assert "Ignored" not in {name for name, _ in index.suggest("ignored", 10)}
+
+    index.adjust({"Zendaya": -5})
+    assert index.suggest("zen", 10) == [("Zendaya", 0)], "Expected scores not to become negative."
+
+
+@pytest.mark.unit
+def test_access_token_cache_counts_hits_and_misses():
+    """
+    Test that a verified token is served from the cache until it is evicted, and counted.
+    """
+    cache = AccessTokenCache(max_entries=2)
+    expires = time.time() + 60
+
+    assert cache.get("token-a") is None, "Expected an unknown token to miss."
+    cache.set("token-a", {"user_id": 1, "exp": expires})
+    cache.set("token-b", {"user_id": 2, "exp": expires})
+
+    assert cache.get("token-a") == {"user_id": 1, "exp": expires}
+    cache.set("token-c", {"user_id": 3, "exp": expires})
+
+    assert cache.get("token-b") is None, "Expected the least recently used token to be evicted."
+    assert cache.get("token-a") is not None, "Expected the recently used token to survive eviction."
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (2, 2, 2)
+    assert stats.hit_ratio == 0.5
+
+
+@pytest.mark.unit
+def test_access_token_cache_honours_token_expiration():
+    """
+    Test that payloads are only cached until the token's `exp` claim, and not at all without it.
+    """
+    cache = AccessTokenCache(max_entries=10)
+
+    cache.set("no-exp", {"user_id": 1})
+    cache.set("expired", {"user_id": 1, "exp": time.time() - 1})
+    assert len(cache) == 0, "Expected tokens without a future expiration not to be cached."
+
+    cache.set("expiring", {"user_id": 1, "exp": time.time() + 0.05})
+    assert cache.get("expiring") is not None
+    time.sleep(0.06)
+    assert cache.get("expiring") is None, "Expected an expired token to be decoded again."
+    assert len(cache) == 0
@@ -0,0 +1,156 @@
+import asyncio
+
+import pytest
+from starlette.requests import Request
+
+from config import (
+    get_settings,
+    get_jwt_auth_manager,
+    get_accounts_email_notificator,
+    get_s3_storage_client,
+    get_password_hasher,
+    reload_settings
+)
+from config.dependencies import APP_SERVICE_FACTORIES, create_s3_storage_client
+from main import app, lifespan
+
+
+def app_request() -> Request:
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": [], "app": app})
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_lifespan_creates_and_releases_app_services():
+    """
+    Test that the lifespan creates the services once, that every request gets the same
+    instances, and that they are released on shutdown.
+    """
+    settings = get_settings()
+
+    async with lifespan(app):
+        jwt_manager = app.state.jwt_auth_manager
+        email_sender = app.state.accounts_email_notificator
+        s3_client = app.state.s3_storage_client
+
+        password_hasher = get_password_hasher(settings)
+
+        for _ in range(2):
+            assert get_jwt_auth_manager(app_request(), settings) is jwt_manager
+            assert get_accounts_email_notificator(app_request(), settings) is email_sender
+            assert get_s3_storage_client(app_request(), settings) is s3_client
+
+    for name in ("jwt_auth_manager", "accounts_email_notificator", "s3_storage_client"):
+        assert not hasattr(app.state, name), f"Expected {name} to be released on shutdown."
+    assert password_hasher._executor is None, "Expected the hashing threads to be stopped on shutdown."
+    assert get_password_hasher(settings) is not password_hasher, "Expected a new pool after shutdown."
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_lifespan_closes_app_services_in_reverse_order(monkeypatch):
+    """
+    Test that the services are closed on shutdown in the reverse order of their creation.
+    """
+    closed = []
+
+    class ClosingService:
+        def __init__(self, name: str):
+            self.name = name
+
+        async def close(self) -> None:
+            closed.append(self.name)
+
+    for name in list(APP_SERVICE_FACTORIES):
+        monkeypatch.setitem(APP_SERVICE_FACTORIES, name, lambda settings, name=name: ClosingService(name))
+
+    async with lifespan(app):
+        assert closed == []
+
+    assert closed == list(reversed(APP_SERVICE_FACTORIES))
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_s3_client_reuses_and_closes_its_connection_pool():
+    """
+    Test that the S3 client keeps one underlying client between calls and releases it on close.
+    """
+    storage = create_s3_storage_client(get_settings())
+
+    client = await storage._get_client()
+    assert await storage._get_client() is client, "Expected the client to be reused."
+
+    await storage.close()
+    assert storage._client is None, "Expected the client to be released."
+    await storage.close()
+
+    assert await storage._get_client() is not client, "Expected a new client after close."
+    await storage.close()
+
+
+@pytest.mark.unit
+def test_app_services_are_created_lazily_without_lifespan():
+    """
+    Test that the providers still work when the lifespan has not run, and reuse the instance they create.
+    """
+    settings = get_settings()
+
+    jwt_manager = get_jwt_auth_manager(app_request(), settings)
+
+    assert get_jwt_auth_manager(app_request(), settings) is jwt_manager
+    assert app.state.jwt_auth_manager is jwt_manager
+
+
+@pytest.mark.unit
+def test_settings_are_cached_until_reloaded(monkeypatch):
+    """
+    Test that the settings are resolved once and re-read from the environment only on reload.
+    """
+    settings = get_settings()
+    assert get_settings() is settings, "Expected the cached settings instance."
+
+    monkeypatch.setenv("LOGIN_TIME_DAYS", str(settings.LOGIN_TIME_DAYS + 1))
+    assert get_settings().LOGIN_TIME_DAYS == settings.LOGIN_TIME_DAYS, "Expected no re-read before reload."
+
+    try:
+        reloaded = reload_settings()
+        assert reloaded is not settings
+        assert reloaded.LOGIN_TIME_DAYS == settings.LOGIN_TIME_DAYS + 1
+        assert get_settings() is reloaded
+    finally:
+        monkeypatch.undo()
+        reload_settings()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_reload_settings_retires_previous_password_hasher(monkeypatch):
+    """
+    Test that reloading changed hashing settings swaps in a new pool, and that the previous
+    pool keeps serving the callers that still hold it and releases its threads once idle.
+    """
+    password_hasher = get_password_hasher(get_settings())
+    assert reload_settings() and get_password_hasher(get_settings()) is password_hasher, (
+        "Expected the pool to be kept when the hashing settings did not change."
+    )
+
+    running = asyncio.create_task(password_hasher.hash("StrongPassword123!"))
+    await asyncio.sleep(0)
+
+    monkeypatch.setenv("PASSWORD_HASH_MAX_PENDING", str(get_settings().PASSWORD_HASH_MAX_PENDING + 1))
+    try:
+        reloaded_settings = reload_settings()
+        reloaded = get_password_hasher(reloaded_settings)
+        assert reloaded is not password_hasher, "Expected a new pool for the new settings."
+
+        hashed = await running
+        assert await password_hasher.verify("StrongPassword123!", hashed), (
+            "Expected the previous pool to keep serving callers that still hold it."
+        )
+        await asyncio.sleep(0)
+        assert password_hasher._executor is None, "Expected the previous pool to release its threads."
+        assert await reloaded.verify("StrongPassword123!", hashed)
+    finally:
+        monkeypatch.undo()
+        reload_settings()
@@ -0,0 +1,216 @@
+import asyncio
+import logging
+import threading
+
+import pytest
+from passlib.context import CryptContext
+
+from config import get_password_context, get_settings, reload_settings
+from database import UserModel
+from exceptions import PasswordHasherBusyError
+from security.passwords import PasswordHashingService, build_password_context, get_default_password_context
+
+FAST_CONTEXT = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4)
+
+
+class BlockingContext:
+    """
+    A password context whose calls wait until the test releases them.
+    """
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def hash(self, password: str) -> str:
+        self.started.set()
+        self.release.wait(timeout=5)
+        return f"hashed:{password}"
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        self.release.wait(timeout=5)
+        return hashed_password == f"hashed:{password}"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_password_hashing_service_hashes_and_verifies():
+    """
+    Test that passwords hashed on the worker pool can be verified on it.
+    """
+    service = PasswordHashingService(max_workers=2, max_pending=2, context=FAST_CONTEXT)
+
+    hashed = await service.hash("StrongPassword123!")
+
+    assert hashed != "StrongPassword123!", "Expected the password to be hashed."
+    assert await service.verify("StrongPassword123!", hashed), "Expected the correct password to verify."
+    assert not await service.verify("WrongPassword123!", hashed), "Expected a wrong password to be rejected."
+
+    stats = service.stats()
+    assert stats.completed == 3
+    assert stats.in_flight == 0 and stats.queued == 0, "Expected the queue to be drained."
+    service.shutdown()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_password_hashing_service_rejects_calls_beyond_queue(caplog):
+    """
+    Test that calls are rejected once all workers are busy and the queue is full,
+    without blocking the event loop while the workers are busy.
+    """
+    context = BlockingContext()
+    service = PasswordHashingService(max_workers=1, max_pending=1, context=context)
+
+    running = asyncio.create_task(service.hash("first"))
+    queued = asyncio.create_task(service.hash("second"))
+    await asyncio.sleep(0)
+
+    stats = service.stats()
+    assert (stats.in_flight, stats.queued) == (1, 1), "Expected one running and one queued call."
+
+    with caplog.at_level(logging.WARNING):
+        for _ in range(2):
+            with pytest.raises(PasswordHasherBusyError):
+                await service.verify("third", "hashed:third")
+    warnings = [record for record in caplog.records if "Password hashing queue is full" in record.getMessage()]
+    assert len(warnings) == 1, "Expected one warning per saturation, not one per rejected call."
+
+    context.release.set()
+    assert await running == "hashed:first"
+    assert await queued == "hashed:second"
+
+    stats = service.stats()
+    assert stats.rejected == 2
+    assert stats.peak_pending == 2
+    assert stats.completed == 2
+    assert await service.verify("third", "hashed:third"), "Expected calls to be accepted again."
+    service.shutdown()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_password_hashing_service_counts_cancelled_calls_until_worker_finishes():
+    """
+    Test that a cancelled call keeps its worker slot until the hash finishes, while a
+    cancelled call that was still queued frees its slot right away.
+    """
+    context = BlockingContext()
+    service = PasswordHashingService(max_workers=1, max_pending=1, context=context)
+
+    running = asyncio.create_task(service.hash("first"))
+    queued = asyncio.create_task(service.hash("second"))
+    assert await asyncio.to_thread(context.started.wait, 5), "Expected the first call to reach the worker."
+
+    running.cancel()
+    queued.cancel()
+    for task in (running, queued):
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    await asyncio.sleep(0)
+
+    stats = service.stats()
+    assert (stats.in_flight, stats.queued) == (1, 0), "Expected the running call to keep its slot."
+
+    context.release.set()
+    for _ in range(100):
+        if service.stats().in_flight == 0:
+            break
+        await asyncio.sleep(0.01)
+
+    assert service.stats().in_flight == 0, "Expected the slot to be released once the worker finished."
+    assert await service.hash("third") == "hashed:third"
+    service.shutdown()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_password_hashing_service_keeps_slot_free_when_submit_fails(monkeypatch):
+    """
+    Test that a call the executor refuses to accept does not take a queue slot.
+    """
+    service = PasswordHashingService(max_workers=1, max_pending=0, context=FAST_CONTEXT)
+    await service.hash("StrongPassword123!")
+
+    def refuse(*args, **kwargs):
+        raise RuntimeError("cannot schedule new futures after shutdown")
+
+    with monkeypatch.context() as patched:
+        patched.setattr(service._executor, "submit", refuse)
+        for _ in range(3):
+            with pytest.raises(RuntimeError):
+                await service.hash("StrongPassword123!")
+
+    stats = service.stats()
+    assert (stats.in_flight, stats.queued, stats.rejected) == (0, 0, 0), "Expected no slot to be taken."
+    assert await service.verify("StrongPassword123!", await service.hash("StrongPassword123!"))
+    service.shutdown()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_password_hashing_service_serves_calls_after_shutdown():
+    """
+    Test that a stopped service still serves callers that hold it, on a worker thread
+    that is released again when the call is done.
+    """
+    service = PasswordHashingService(max_workers=1, max_pending=1, context=FAST_CONTEXT)
+    hashed = await service.hash("StrongPassword123!")
+    service.shutdown()
+    assert service._executor is None
+
+    assert await service.verify("StrongPassword123!", hashed)
+    assert service._executor is None, "Expected the worker thread to be released after the call."
+    assert service.stats().in_flight == 0
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("stored_rounds", [4, 6])
+def test_password_context_flags_hashes_with_other_cost(stored_rounds):
+    """
+    Test that hashes made with a lower or higher bcrypt cost than the policy need an update.
+    """
+    context = build_password_context(schemes=["bcrypt"], bcrypt_rounds=5)
+    stored_hash = build_password_context(schemes=["bcrypt"], bcrypt_rounds=stored_rounds).hash("Secret123!")
+
+    assert context.needs_update(stored_hash), f"Expected a {stored_rounds}-round hash to need an update."
+    assert not context.needs_update(context.hash("Secret123!")), "Expected a policy hash to be current."
+
+    is_valid, new_hash = context.verify_and_update("Secret123!", stored_hash)
+    assert is_valid
+    assert new_hash.startswith("$2b$05$"), "Expected the password to be rehashed with the policy cost."
+
+
+@pytest.mark.unit
+def test_password_context_rejects_unknown_scheme():
+    """
+    Test that the policy only accepts the supported schemes.
+    """
+    with pytest.raises(ValueError, match="Unsupported password schemes: md5_crypt"):
+        build_password_context(schemes=["md5_crypt"])
+
+
+@pytest.mark.unit
+def test_user_password_helpers_follow_configured_cost(monkeypatch):
+    """
+    Test that the synchronous `UserModel` password helpers hash with the policy that the
+    settings install as the default, and follow it after a settings reload.
+    """
+    rounds = get_settings().PASSWORD_BCRYPT_ROUNDS
+    monkeypatch.setenv("PASSWORD_BCRYPT_ROUNDS", "5")
+    try:
+        reload_settings()
+        user = UserModel.create(email="policy@example.com", raw_password="StrongPassword123!", group_id=1)
+
+        assert user._hashed_password.startswith("$2b$05$"), "Expected the configured bcrypt cost."
+        assert user.verify_password("StrongPassword123!")
+        assert not get_password_context(get_settings()).needs_update(user._hashed_password)
+        assert get_default_password_context() is get_password_context(get_settings())
+    finally:
+        monkeypatch.undo()
+        reload_settings()
+
+    assert get_settings().PASSWORD_BCRYPT_ROUNDS == rounds
+    assert get_password_context(get_settings()).needs_update(user._hashed_password), (
+        "Expected hashes made under the previous cost to be flagged for rehashing."
+    )